@@ -0,0 +1,566 @@
+#!/usr/bin/env python3
+"""
+Shared implementation of the inference benchmark.
+
+benchmark.py and quick_test.py only differ in their parameters, so both call
+run() from this module.
+"""
+
+import os
+import time
+import platform
+import statistics
+import weakref
+import numpy as np
+
+# Optional: Intel oneDAL-accelerated scikit-learn (pip install scikit-learn-intelex).
+# The patch must run before the estimators are imported.
+try:
+    from sklearnex import patch_sklearn
+    patch_sklearn()
+except ImportError:
+    patch_sklearn = None
+
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.datasets import make_regression
+from joblib import parallel_backend
+import multiprocessing as mp
+from multiprocessing import shared_memory
+
+# pandas, matplotlib and psutil are only needed for setup and reporting, so they
+# are imported inside the functions that use them rather than at module load
+
+# Optional: AOT-compiled tree predictor (pip install sklearn-compiledtrees)
+try:
+    from compiledtrees import CompiledRegressionPredictor
+except ImportError:
+    CompiledRegressionPredictor = None
+
+# Optional: numba forest-traversal kernel (pip install numba)
+try:
+    from forest_kernel import NumbaForestPredictor
+except ImportError:
+    NumbaForestPredictor = None
+
+# Optional: ONNX Runtime tree-ensemble kernel (pip install skl2onnx onnxruntime)
+try:
+    from onnx_predictor import OnnxForestPredictor
+except ImportError:
+    OnnxForestPredictor = None
+
+# Optional: RAPIDS cuML Forest Inference Library on the GPU (pip install cuml-cu12)
+try:
+    from fil_predictor import FilForestPredictor
+except ImportError:
+    FilForestPredictor = None
+
+# Rows per predict call inside each worker, so every call's working set stays
+# cache-sized; MICRO_BATCH=auto times the candidates once at startup instead
+MICRO_BATCH = os.environ.get("MICRO_BATCH", "4096")
+MICRO_BATCH_CANDIDATES = [512, 2048, 8192, 32768]
+
+# Predictor for the single- and multi-process runs: fil, numba, onnx,
+# compiledtrees, sklearn, or auto (the first of those that is installed)
+INFERENCE_BACKEND = os.environ.get("INFERENCE_BACKEND", "auto")
+
+# Every measurement is the median of TIMING_REPEATS timed runs, each preceded by
+# WARMUP_RUNS untimed predictions on a small slice
+TIMING_REPEATS = 3
+WARMUP_RUNS = 5
+
+# Per-worker state, set once by the pool initializer
+_worker_model = None
+_worker_data = None
+_worker_out = None
+_worker_shms = None
+_worker_micro_batch = None
+
+def create_model(n_features, n_estimators=50, max_depth=20, n_train_samples=10000):
+    """
+    Create and train a simple Random Forest model.
+    
+    Args:
+        n_features: Number of features in the synthetic training data
+        n_estimators: Number of trees in the forest
+        max_depth: Maximum depth of each tree (None grows them fully)
+        n_train_samples: Number of synthetic training samples
+    
+    Returns:
+        RandomForestRegressor: Fitted model
+    """
+    print("Creating and training model...")
+    # Generate synthetic training data
+    X_train, y_train = make_regression(
+        n_samples=n_train_samples,
+        n_features=n_features,
+        noise=0.1,
+        random_state=42
+    )
+    
+    # Train a Random Forest model with more trees to increase CPU workload
+    model = RandomForestRegressor(n_estimators=n_estimators, max_depth=max_depth, random_state=42)
+    model.fit(X_train, y_train)
+    
+    return model
+
+def build_predictor(model, n_features, backend=INFERENCE_BACKEND):
+    """
+    Wrap the trained model in the requested inference backend.
+    
+    All predictors keep the same .predict(X) interface as the model itself.
+    """
+    available = {
+        "fil": FilForestPredictor is not None,
+        "numba": NumbaForestPredictor is not None,
+        "onnx": OnnxForestPredictor is not None,
+        "compiledtrees": CompiledRegressionPredictor is not None,
+        "sklearn": True,
+    }
+    if backend == "auto":
+        backend = next(name for name, installed in available.items() if installed)
+    elif not available.get(backend, False):
+        raise ValueError(f"Inference backend not available: {backend}")
+    
+    if backend == "fil":
+        print("Loading model into cuML FIL on the GPU...")
+        return FilForestPredictor(model)
+    
+    import psutil
+    
+    # In-process backends get one thread per physical core
+    n_threads = psutil.cpu_count(logical=False)
+    if backend == "numba":
+        print("Exporting model to the numba forest kernel...")
+        return NumbaForestPredictor(model, n_threads=n_threads)
+    if backend == "onnx":
+        print("Converting model to ONNX...")
+        return OnnxForestPredictor(model, n_features, n_threads=n_threads)
+    if backend == "compiledtrees":
+        # Compile each tree to native code
+        print("Compiling model with sklearn-compiledtrees...")
+        return CompiledRegressionPredictor(model)
+    return model
+
+def generate_inference_data(n_samples, n_features):
+    """Generate synthetic data for inference."""
+    print(f"Generating {n_samples} samples for inference...")
+    # Only the features are needed for prediction, so draw them directly rather
+    # than building a full regression problem; trees compare float32 internally
+    rng = np.random.default_rng(24)
+    return rng.standard_normal((n_samples, n_features), dtype=np.float32)
+
+def _warm_up(model, data):
+    """Warm up the CPU, caches and any lazily initialized predictor state."""
+    for _ in range(WARMUP_RUNS):
+        model.predict(data[:100])
+
+def _measure(func, repeats=TIMING_REPEATS):
+    """
+    Time repeated calls of func with a monotonic high-resolution clock.
+    
+    Returns:
+        tuple: (median elapsed seconds, result of the last call)
+    """
+    times = []
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start_time)
+    return statistics.median(times), result
+
+def single_process_inference(model, data):
+    """Run inference using a single process."""
+    print("Running single-process inference...")
+    _warm_up(model, data)
+    elapsed_time, predictions = _measure(lambda: model.predict(data))
+    
+    print(f"Single-process inference completed in {elapsed_time:.4f} seconds")
+    
+    return elapsed_time, predictions
+
+def physical_cpus():
+    """
+    List one logical CPU per physical core available to this process.
+    
+    Hyper-threaded siblings share one core's execution units, so keeping a
+    single CPU per core stops workers from competing for the same core. Falls
+    back to every available logical CPU where the topology cannot be read.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        cpus = sorted(os.sched_getaffinity(0))
+    else:
+        cpus = list(range(os.cpu_count() or 1))
+    
+    seen_cores = set()
+    first_per_core = []
+    for cpu in cpus:
+        topology = f"/sys/devices/system/cpu/cpu{cpu}/topology"
+        try:
+            with open(os.path.join(topology, "physical_package_id")) as f:
+                package = f.read().strip()
+            with open(os.path.join(topology, "core_id")) as f:
+                core = f.read().strip()
+        except OSError:
+            return cpus
+        if (package, core) not in seen_cores:
+            seen_cores.add((package, core))
+            first_per_core.append(cpu)
+    return first_per_core
+
+def _init_worker(model, shm_name, shape, dtype, out_shm_name, micro_batch, cpus=None, counter=None):
+    """
+    Attach the model, the shared input data and the shared output once per worker.
+    
+    With 'fork' the model is inherited through copy-on-write pages; with 'spawn'
+    it is pickled once per worker via initargs instead of once per task. When
+    cpus and a shared counter are given, each worker takes the next CPU in the
+    list and pins itself to it.
+    """
+    global _worker_model, _worker_data, _worker_out, _worker_shms, _worker_micro_batch
+    if cpus and counter is not None and hasattr(os, "sched_setaffinity"):
+        # The pool initializer gets no worker index, so hand them out from a counter
+        with counter.get_lock():
+            index = counter.value
+            counter.value += 1
+        os.sched_setaffinity(0, {cpus[index % len(cpus)]})
+    # Each worker already owns a core, so keep the predictor from fanning out again
+    if hasattr(model, "n_threads"):
+        model.n_threads = 1
+    _worker_model = model
+    _worker_micro_batch = micro_batch
+    _worker_shms = [
+        shared_memory.SharedMemory(name=shm_name),
+        shared_memory.SharedMemory(name=out_shm_name),
+    ]
+    _worker_data = np.ndarray(shape, dtype=dtype, buffer=_worker_shms[0].buf)
+    _worker_out = np.ndarray((shape[0],), dtype=np.float64, buffer=_worker_shms[1].buf)
+
+def process_batch(bounds):
+    """Predict a slice of the shared data into the shared output (used by multiprocessing)."""
+    start, end = bounds
+    for batch_start in range(start, end, _worker_micro_batch):
+        batch_end = min(batch_start + _worker_micro_batch, end)
+        _worker_out[batch_start:batch_end] = _worker_model.predict(
+            _worker_data[batch_start:batch_end]
+        )
+
+def tune_micro_batch(model, data, candidates=MICRO_BATCH_CANDIDATES):
+    """Time each candidate micro-batch size on a sample of the data and return the fastest."""
+    sample = data[:2 * max(candidates)]
+    timings = {}
+    for size in candidates:
+        start_time = time.perf_counter()
+        for batch_start in range(0, len(sample), size):
+            model.predict(sample[batch_start:batch_start + size])
+        timings[size] = time.perf_counter() - start_time
+    
+    best = min(timings, key=timings.get)
+    print("Micro-batch auto-tune: " + ", ".join(f"{size}: {t:.4f}s" for size, t in timings.items()))
+    print(f"Using micro-batch size {best}")
+    return best
+
+def _pool_inference(model, data, bounds, micro_batch, mp_context, cpus=None):
+    """Copy the data into shared memory and predict it with one pool of workers."""
+    n_samples = len(data)
+    
+    # Copy the input into shared memory once instead of pickling a batch per worker
+    shm = shared_memory.SharedMemory(create=True, size=data.nbytes)
+    # Workers write their slice straight into one preallocated output, so nothing
+    # needs to be concatenated; shared memory is page-aligned (hence 64-byte aligned)
+    out_shm = shared_memory.SharedMemory(create=True, size=n_samples * np.dtype(np.float64).itemsize)
+    predictions = np.ndarray((n_samples,), dtype=np.float64, buffer=out_shm.buf)
+    try:
+        shared_data = np.ndarray(data.shape, dtype=data.dtype, buffer=shm.buf)
+        shared_data[:] = data
+        del shared_data
+        
+        # Use a context manager to ensure proper cleanup
+        context = mp.get_context(mp_context)
+        counter = context.Value('i', 0)
+        with context.Pool(
+            processes=len(bounds),
+            initializer=_init_worker,
+            initargs=(model, shm.name, data.shape, data.dtype, out_shm.name, micro_batch, cpus, counter),
+        ) as pool:
+            pool.map(process_batch, bounds)
+    finally:
+        shm.close()
+        shm.unlink()
+        # Only drop the name; the output mapping lives as long as `predictions`
+        out_shm.unlink()
+    weakref.finalize(predictions, out_shm.close)
+    
+    return predictions
+
+def multi_process_inference(model, data, processes, micro_batch=4096, mp_context=None,
+                            pin_workers=True):
+    """
+    Run inference using multiple processes.
+    
+    Args:
+        model: Fitted model or predictor
+        data: Input features
+        processes: Number of worker processes
+        micro_batch: Rows per predict call inside each worker
+        mp_context: Multiprocessing start method (None picks 'spawn' on Windows, 'fork' elsewhere)
+        pin_workers: Whether to pin each worker to its own physical core (Linux only)
+    """
+    print(f"Running multi-process inference with {processes} processes...")
+    
+    # Warm up the CPU and initialize resources
+    _warm_up(model, data)
+    
+    # Workers only receive slice bounds; the data itself lives in shared memory
+    n_samples = len(data)
+    bounds = [
+        (n_samples * i // processes, n_samples * (i + 1) // processes)
+        for i in range(processes)
+    ]
+    
+    # Use 'fork' on Linux/Mac or 'spawn' on Windows unless one was requested
+    if mp_context is None:
+        mp_context = 'spawn' if os.name == 'nt' else 'fork'
+    
+    # One CPU per physical core, so no two workers share a core's execution units
+    cpus = physical_cpus() if pin_workers else None
+    
+    # Pool startup and the shared-memory copy are part of every timed run
+    elapsed_time, predictions = _measure(
+        lambda: _pool_inference(model, data, bounds, micro_batch, mp_context, cpus)
+    )
+    
+    print(f"Multi-process inference completed in {elapsed_time:.4f} seconds")
+    
+    return elapsed_time, predictions
+
+def multi_thread_inference(model, data, threads):
+    """
+    Run inference using scikit-learn's own thread pool.
+    
+    RandomForestRegressor.predict releases the GIL while traversing trees, so
+    joblib's threading backend parallelizes it without forking, pickling the
+    model or copying the data.
+    """
+    print(f"Running multi-thread inference with {threads} threads...")
+    
+    # Warm up the CPU and initialize resources
+    _warm_up(model, data)
+    
+    def predict_threaded():
+        with parallel_backend('threading', n_jobs=threads):
+            return model.predict(data)
+    
+    elapsed_time, predictions = _measure(predict_threaded)
+    
+    print(f"Multi-thread inference completed in {elapsed_time:.4f} seconds")
+    
+    return elapsed_time, predictions
+
+def verify_results(single_predictions, multi_predictions):
+    """Verify that both methods produce the same results."""
+    if np.float32 in (single_predictions.dtype, multi_predictions.dtype):
+        # float32 predictors (e.g. ONNX) round every leaf value, so allow an error
+        # relative to the prediction scale; a flipped split is still far outside it
+        atol = 1e-5 * np.abs(multi_predictions).max()
+        is_equal = np.allclose(single_predictions, multi_predictions, atol=atol)
+    else:
+        is_equal = np.allclose(single_predictions, multi_predictions)
+    print(f"Results verification: {'PASSED' if is_equal else 'FAILED'}")
+    return is_equal
+
+def plot_results(single_time, multi_time, thread_time, processes):
+    """Create a bar chart comparing the performance."""
+    import matplotlib.pyplot as plt
+    
+    labels = [
+        'Single Process',
+        f'Multi Process ({processes} cores)',
+        f'Multi Thread ({processes} threads)',
+    ]
+    times = [single_time, multi_time, thread_time]
+    
+    plt.figure(figsize=(10, 6))
+    bars = plt.bar(labels, times, color=['blue', 'green', 'orange'])
+    
+    # Add time labels on top of bars
+    for bar in bars:
+        height = bar.get_height()
+        plt.text(bar.get_x() + bar.get_width()/2., height + 0.01,
+                f'{height:.4f}s', ha='center', va='bottom')
+    
+    plt.ylabel('Time (seconds)')
+    plt.title('Inference Performance Comparison')
+    plot_path = os.path.join(os.path.dirname(__file__), 'inference_performance.png')
+    plt.savefig(plot_path)
+    print(f"Performance chart saved as '{plot_path}'")
+
+def save_results(parameters, single_time, multi_time, thread_time, verification_passed,
+                 sklearn_time=None):
+    """
+    Save benchmark results to a file.
+    
+    Args:
+        parameters: Benchmark parameters to report, including "Processes"
+        single_time: Single-process inference time in seconds
+        multi_time: Multi-process inference time in seconds
+        thread_time: Multi-thread inference time in seconds
+        verification_passed: Whether all predictions matched
+        sklearn_time: Single-process time of the plain scikit-learn model, which
+            the multi-thread run uses (None if the backend is scikit-learn)
+    
+    Returns:
+        dict: Parameters, results and system information that were written
+    """
+    import pandas as pd
+    import psutil
+    
+    speedup = single_time / multi_time
+    efficiency = speedup / parameters["Processes"]
+    if sklearn_time is None:
+        sklearn_time = single_time
+    
+    system_info = {
+        "CPU": f"{psutil.cpu_count(logical=False)} physical cores, {psutil.cpu_count(logical=True)} logical cores",
+        "Memory": f"{psutil.virtual_memory().total / (1024**3):.2f} GB",
+        "Python Version": platform.python_version(),
+    }
+    
+    results = {
+        "Parameters": parameters,
+        "Results": {
+            "Single Process Time (s)": single_time,
+            "Multi Process Time (s)": multi_time,
+            "Multi Thread Time (s)": thread_time,
+            "Speedup": speedup,
+            "Efficiency": efficiency,
+            "Thread Speedup": sklearn_time / thread_time,
+            "Backend Speedup": sklearn_time / single_time,
+            "Verification": "PASSED" if verification_passed else "FAILED"
+        },
+        "System Info": system_info
+    }
+    
+    # Convert to DataFrame for nice formatting
+    params_df = pd.DataFrame(list(results["Parameters"].items()), columns=["Parameter", "Value"])
+    results_df = pd.DataFrame(list(results["Results"].items()), columns=["Metric", "Value"])
+    system_df = pd.DataFrame(list(results["System Info"].items()), columns=["Component", "Specification"])
+    
+    # Save to text file
+    results_path = os.path.join(os.path.dirname(__file__), "results.txt")
+    with open(results_path, "w") as f:
+        f.write("# Inference Performance Benchmark Results\n\n")
+    
+        f.write("## Parameters\n")
+        f.write(params_df.to_string(index=False))
+        f.write("\n\n")
+    
+        f.write("## Results\n")
+        f.write(results_df.to_string(index=False))
+        f.write("\n\n")
+    
+        f.write("## System Information\n")
+        f.write(system_df.to_string(index=False))
+    
+    print(f"Results saved to '{results_path}'")
+    
+    return results
+
+def run(n_samples, n_features, n_estimators=50, processes=None, mp_context=None,
+        max_depth=20, n_train_samples=10000, title="INFERENCE PERFORMANCE BENCHMARK",
+        save=True):
+    """
+    Run the full benchmark: single process, multiple processes and multiple threads.
+    
+    Args:
+        n_samples: Number of samples to generate for inference
+        n_features: Number of features in the synthetic data
+        n_estimators: Number of trees in the forest
+        processes: Number of worker processes and threads (None uses up to 4 physical cores)
+        mp_context: Multiprocessing start method (None picks one per platform)
+        max_depth: Maximum depth of each tree (None grows them fully)
+        n_train_samples: Number of synthetic training samples
+        title: Heading printed before the run
+        save: Whether to write results.txt and the performance chart
+    """
+    if processes is None:
+        processes = min(len(physical_cpus()), 4)  # Limit to 4 processes to reduce overhead
+    
+    print("=" * 50)
+    print(title)
+    print("=" * 50)
+    print(f"Comparing single process vs. {processes} processes vs. {processes} threads")
+    print("-" * 50)
+    
+    # Create model
+    model = create_model(n_features, n_estimators, max_depth, n_train_samples)
+    predictor = build_predictor(model, n_features)
+    
+    # Generate inference data
+    data = generate_inference_data(n_samples, n_features)
+    
+    # Run single-process inference
+    single_time, single_predictions = single_process_inference(predictor, data)
+    
+    # The thread pool parallelizes scikit-learn's own predict, so the thread
+    # speedup is measured against the plain model rather than the backend
+    if predictor is model:
+        sklearn_time = single_time
+    else:
+        print("Timing the plain scikit-learn model for the thread comparison...")
+        sklearn_time, _ = single_process_inference(model, data)
+    
+    # Pick the per-worker micro-batch size
+    if MICRO_BATCH == "auto":
+        micro_batch = tune_micro_batch(predictor, data)
+    else:
+        micro_batch = int(MICRO_BATCH)
+    
+    # Run multi-process inference; GPU predictors cannot be shared with forked
+    # workers, so those fall back to the plain scikit-learn model there
+    pool_model = predictor if getattr(predictor, "multiprocess_safe", True) else model
+    multi_time, multi_predictions = multi_process_inference(
+        pool_model, data, processes, micro_batch, mp_context
+    )
+    
+    # Run multi-thread inference with the plain scikit-learn model
+    thread_time, thread_predictions = multi_thread_inference(model, data, processes)
+    
+    # Verify results
+    verification_passed = (
+        verify_results(single_predictions, multi_predictions)
+        and verify_results(single_predictions, thread_predictions)
+    )
+    
+    # Calculate speedup
+    speedup = single_time / multi_time
+    print(f"Speedup: {speedup:.2f}x")
+    print(f"Efficiency: {speedup / processes:.2f}")
+    print(f"Thread speedup (scikit-learn): {sklearn_time / thread_time:.2f}x")
+    if predictor is not model:
+        print(f"Backend speedup over scikit-learn: {sklearn_time / single_time:.2f}x")
+    
+    if save:
+        # Plot results
+        try:
+            plot_results(single_time, multi_time, thread_time, processes)
+        except Exception as e:
+            print(f"Could not create plot: {e}")
+    
+        # Save results
+        parameters = {
+            "Samples": n_samples,
+            "Features": n_features,
+            "Processes": processes,
+            "Batch Size": n_samples // processes,
+            "Micro Batch": micro_batch,
+        }
+        save_results(parameters, single_time, multi_time, thread_time, verification_passed,
+                     sklearn_time)
+    
+    return {
+        "single_time": single_time,
+        "multi_time": multi_time,
+        "thread_time": thread_time,
+        "sklearn_time": sklearn_time,
+        "verification_passed": verification_passed,
+    }
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Numba forest-traversal kernel.
+
+This module exports the trees of a fitted scikit-learn forest into plain NumPy
+arrays and evaluates them with a JIT-compiled, multi-threaded kernel.
+"""
+
+import os
+import numpy as np
+import numba
+from numba import njit, prange
+
+# The benchmark forks worker processes after the kernel has run, and the TBB
+# threading layer can hang at interpreter exit once a process has forked, so
+# use the fork-safe workqueue layer unless one was picked explicitly
+if "NUMBA_THREADING_LAYER" not in os.environ:
+    numba.config.THREADING_LAYER = "workqueue"
+
+# Marker used by scikit-learn (and by the exported node table) for leaf nodes
+TREE_LEAF = -1
+
+# One decision node per 16-byte record
+NODE_DTYPE = np.dtype([
+    ("left", np.int32),
+    ("right", np.int32),
+    ("feature", np.int32),
+    ("threshold", np.float32),
+])
+
+# Samples per tile; large enough to amortize reloading each tree, small enough
+# to leave plenty of tiles to spread across threads
+TILE_SIZE = 8192
+
+
+def _round_down_float32(threshold):
+    """
+    Convert float64 split thresholds to float32 without changing any decision.
+
+    scikit-learn compares float32 features against float64 thresholds, so the
+    largest float32 that is <= each threshold yields exactly the same splits.
+    """
+    threshold_f32 = threshold.astype(np.float32)
+    too_large = threshold_f32.astype(np.float64) > threshold
+    threshold_f32[too_large] = np.nextafter(threshold_f32[too_large], np.float32(-np.inf))
+    return threshold_f32
+
+
+def flatten_forest(model):
+    """
+    Export every tree of a fitted forest into one contiguous node table.
+
+    Each node is a packed 16-byte record (left, right, feature, threshold) so a
+    decision needs a single cache line. Child indices are shifted by the tree's
+    offset, so all trees share one index space and tree t starts at
+    ``tree_offset[t]``.
+
+    Args:
+        model: Fitted scikit-learn forest regressor
+
+    Returns:
+        tuple: (nodes, value, tree_offset) where nodes is a NODE_DTYPE record
+            array, value holds the leaf predictions and tree_offset has
+            n_trees + 1 entries
+    """
+    trees = [estimator.tree_ for estimator in model.estimators_]
+    tree_offset = np.zeros(len(trees) + 1, dtype=np.int64)
+    tree_offset[1:] = np.cumsum([tree.node_count for tree in trees])
+
+    nodes = np.empty(tree_offset[-1], dtype=NODE_DTYPE)
+    value = np.empty(tree_offset[-1], dtype=np.float64)
+
+    for t, tree in enumerate(trees):
+        start, end = tree_offset[t], tree_offset[t + 1]
+        is_leaf = tree.children_left == TREE_LEAF
+        nodes["left"][start:end] = np.where(is_leaf, TREE_LEAF, tree.children_left + start)
+        nodes["right"][start:end] = np.where(is_leaf, TREE_LEAF, tree.children_right + start)
+        # Leaves carry a negative feature index; clamp so the field stays a valid index
+        nodes["feature"][start:end] = np.maximum(tree.feature, 0)
+        nodes["threshold"][start:end] = _round_down_float32(tree.threshold)
+        value[start:end] = tree.value[:, 0, 0]
+
+    return nodes, value, tree_offset
+
+
+def bin_forest(nodes):
+    """
+    Quantize the forest's split thresholds into per-feature integer bins.
+
+    The bin edges of each feature are the distinct thresholds the forest splits
+    on, so comparing bin indices gives exactly the same decisions as comparing
+    raw values: ``x <= edges[k]`` holds iff ``searchsorted(edges, x) <= k``.
+
+    Args:
+        nodes: Node table from flatten_forest
+
+    Returns:
+        tuple: (edges, n_edges, binned_nodes, bin_dtype) where edges is a padded
+            (n_features, max_edges) float32 array and binned_nodes is a copy of
+            nodes whose thresholds are bin indices, or None if some feature has
+            too many distinct thresholds for a uint16 bin index
+    """
+    is_split = nodes["left"] != TREE_LEAF
+    feature = nodes["feature"]
+    threshold = nodes["threshold"]
+    n_features = int(feature.max()) + 1
+    per_feature = [np.unique(threshold[is_split & (feature == f)]) for f in range(n_features)]
+    max_edges = max(len(e) for e in per_feature)
+    if max_edges <= np.iinfo(np.uint8).max:
+        bin_dtype = np.uint8
+    elif max_edges <= np.iinfo(np.uint16).max:
+        bin_dtype = np.uint16
+    else:
+        return None
+
+    edges = np.full((n_features, max(max_edges, 1)), np.inf, dtype=np.float32)
+    n_edges = np.zeros(n_features, dtype=np.int64)
+    binned_nodes = nodes.copy()
+    for f, feature_edges in enumerate(per_feature):
+        edges[f, :len(feature_edges)] = feature_edges
+        n_edges[f] = len(feature_edges)
+        # Bin indices stay below 2**16, so the float32 field holds them exactly
+        mask = is_split & (feature == f)
+        binned_nodes["threshold"][mask] = np.searchsorted(feature_edges, threshold[mask])
+
+    return edges, n_edges, binned_nodes, bin_dtype
+
+
+@njit(parallel=True, cache=True)
+def bin_features_numba(X, edges, n_edges, out):
+    """Replace every feature value with its bin index (binary search per value)."""
+    n_features = X.shape[1]
+    for i in prange(X.shape[0]):
+        for f in range(n_features):
+            x = X[i, f]
+            lo = 0
+            hi = n_edges[f]
+            # Count the edges strictly below x
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if edges[f, mid] < x:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            out[i, f] = lo
+    return out
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def predict_forest_numba(nodes, value, tree_offset, X, out, tile_size=TILE_SIZE):
+    """
+    Average the predictions of every tree for every sample.
+
+    Samples are cut into tiles that are distributed across threads with
+    ``prange``. Within a tile the trees form the outer loop, so one tree stays
+    hot in cache while the tile's samples stream through it, instead of the
+    whole forest being pulled through the cache for every sample.
+    """
+    n_samples = X.shape[0]
+    n_trees = tree_offset.shape[0] - 1
+    n_tiles = (n_samples + tile_size - 1) // tile_size
+    for tile in prange(n_tiles):
+        start = tile * tile_size
+        end = min(start + tile_size, n_samples)
+        acc = np.zeros(end - start)
+        for t in range(n_trees):
+            root = tree_offset[t]
+            for i in range(start, end):
+                node = root
+                while nodes[node].left != TREE_LEAF:
+                    record = nodes[node]
+                    if X[i, record.feature] <= record.threshold:
+                        node = record.left
+                    else:
+                        node = record.right
+                acc[i - start] += value[node]
+        for i in range(start, end):
+            out[i] = acc[i - start] / n_trees
+    return out
+
+
+class NumbaForestPredictor:
+    """Drop-in replacement for ``model.predict`` backed by the numba kernel."""
+
+    def __init__(self, model, n_threads=None, binned=False, tile_size=TILE_SIZE):
+        """
+        Export the forest once so predictions only run the compiled kernels.
+
+        Args:
+            model: Fitted scikit-learn forest regressor
+            n_threads: Number of threads for the kernels (None keeps numba's default)
+            binned: Whether to traverse on uint8/uint16 feature bins instead of float32
+            tile_size: Number of samples each thread processes per tile
+        """
+        self.nodes, self.value, self.tree_offset = flatten_forest(model)
+        self.bins = bin_forest(self.nodes) if binned else None
+        self.n_threads = n_threads
+        self.tile_size = tile_size
+
+    def predict(self, X):
+        """Predict regression targets for X."""
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        out = np.empty(X.shape[0], dtype=np.float64)
+        if self.n_threads is not None:
+            numba.set_num_threads(self.n_threads)
+        if self.bins is None:
+            return predict_forest_numba(
+                self.nodes, self.value, self.tree_offset, X, out, self.tile_size
+            )
+
+        # Narrow integer features shrink the data the traversal has to stream
+        edges, n_edges, binned_nodes, bin_dtype = self.bins
+        X_binned = np.empty(X.shape, dtype=bin_dtype)
+        bin_features_numba(X, edges, n_edges, X_binned)
+        return predict_forest_numba(
+            binned_nodes, self.value, self.tree_offset, X_binned, out, self.tile_size
+        )
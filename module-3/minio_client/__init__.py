@@ -6,5 +6,12 @@ This package provides a client for performing CRUD operations on a MinIO server.
 
 from .minio_crud_client import MinioCrudClient
 from .config import get_config
+from .async_facade import AsyncFacade
 
-__all__ = ["MinioCrudClient", "get_config"]
+# Optional: asyncio client for high fan-out workloads (pip install aiohttp)
+try:
+    from .async_client import AsyncMinioCrudClient
+except ImportError:
+    AsyncMinioCrudClient = None
+
+__all__ = ["MinioCrudClient", "AsyncFacade", "AsyncMinioCrudClient", "get_config"]
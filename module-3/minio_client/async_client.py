@@ -0,0 +1,364 @@
+"""
+Async MinIO CRUD Client
+
+This module provides an asyncio client for workloads dominated by many small
+requests. All requests are issued from one event loop over a shared aiohttp
+connection pool instead of one thread per request, and are signed with the
+minio SDK's own Signature V4 helpers.
+"""
+
+import asyncio
+import logging
+from typing import Dict, List, Optional, Tuple, Union
+from urllib.parse import urlunsplit
+from xml.etree import ElementTree
+
+import aiohttp
+from yarl import URL
+
+from minio import time as minio_time
+from minio.credentials import Credentials
+from minio.error import S3Error
+from minio.helpers import BaseURL, sha256_hash
+from minio.signer import sign_v4_s3
+
+from .config import get_config
+from .minio_crud_client import _META_LEN, _META_PREFIX
+
+logger = logging.getLogger(__name__)
+
+# Default number of requests in flight at once
+DEFAULT_CONCURRENCY = 256
+
+
+class AsyncMinioCrudClient:
+    """
+    An asyncio client for common object operations on a MinIO server.
+
+    Use it as an async context manager, or call close() when done, so the
+    underlying connection pool is released.
+    """
+
+    def __init__(
+        self,
+        endpoint: Optional[str] = None,
+        access_key: Optional[str] = None,
+        secret_key: Optional[str] = None,
+        secure: Optional[bool] = None,
+        region: Optional[str] = None,
+        connection_limit: int = DEFAULT_CONCURRENCY,
+    ):
+        """
+        Initialize the async MinIO client.
+
+        Args:
+            endpoint: MinIO server endpoint (host:port)
+            access_key: MinIO access key
+            secret_key: MinIO secret key
+            secure: Whether to use HTTPS
+            region: MinIO region
+            connection_limit: Maximum number of open connections
+        """
+        config = get_config(
+            endpoint=endpoint,
+            access_key=access_key,
+            secret_key=secret_key,
+            secure=secure,
+            region=region,
+        )
+
+        scheme = "https" if config["secure"] else "http"
+        # MinIO does not need a bucket location lookup; use its default region
+        self._region = config["region"] or "us-east-1"
+        self._base_url = BaseURL(f"{scheme}://{config['endpoint']}", self._region)
+        self._credentials = Credentials(config["access_key"], config["secret_key"])
+        self._connection_limit = connection_limit
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        logger.info("Initialized async MinIO client for endpoint: %s", config["endpoint"])
+
+    async def __aenter__(self) -> "AsyncMinioCrudClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying connection pool."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Create the shared session on first use, inside the running event loop."""
+        if self._session is None:
+            connector = aiohttp.TCPConnector(
+                limit=self._connection_limit,
+                limit_per_host=self._connection_limit,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def _request(
+        self,
+        method: str,
+        bucket_name: str,
+        object_name: Optional[str] = None,
+        body: bytes = b"",
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[Dict[str, str], bytes]:
+        """
+        Sign and send one request.
+
+        Returns:
+            Tuple containing the response headers and body
+
+        Raises:
+            S3Error: If the server returned an error response
+        """
+        url = self._base_url.build(
+            method=method,
+            region=self._region,
+            bucket_name=bucket_name,
+            object_name=object_name,
+        )
+
+        # Same headers the minio SDK signs for its own requests
+        headers = dict(headers or {})
+        headers["Host"] = url.netloc
+        if body:
+            headers["Content-Length"] = str(len(body))
+        content_sha256 = "UNSIGNED-PAYLOAD" if url.scheme == "https" else sha256_hash(body)
+        headers["x-amz-content-sha256"] = content_sha256
+        date = minio_time.utcnow()
+        headers["x-amz-date"] = minio_time.to_amz_date(date)
+        headers = sign_v4_s3(
+            method=method,
+            url=url,
+            region=self._region,
+            headers=headers,
+            credentials=self._credentials,
+            content_sha256=content_sha256,
+            date=date,
+        )
+
+        # The path is already percent-encoded and signed as is; keep aiohttp from re-quoting it
+        async with self._get_session().request(
+            method,
+            URL(urlunsplit(url), encoded=True),
+            data=body or None,
+            headers=headers,
+        ) as response:
+            data = await response.read()
+            if response.status not in (200, 204, 206):
+                raise self._error(response.status, data, bucket_name, object_name)
+            return response.headers, data
+
+    @staticmethod
+    def _error(
+        status: int, data: bytes, bucket_name: str, object_name: Optional[str]
+    ) -> S3Error:
+        """Build an S3Error from an error response body (HEAD responses have none)."""
+        fields = {}
+        if data:
+            element = ElementTree.fromstring(data)
+            fields = {child.tag: child.text for child in element}
+
+        code = fields.get("Code")
+        if code is None:
+            if status == 404:
+                code = "NoSuchKey" if object_name else "NoSuchBucket"
+            elif status == 403:
+                code = "AccessDenied"
+            else:
+                code = f"HTTP{status}"
+
+        return S3Error(
+            None,
+            code,
+            fields.get("Message"),
+            fields.get("Resource"),
+            fields.get("RequestId"),
+            fields.get("HostId"),
+            bucket_name=bucket_name,
+            object_name=object_name,
+        )
+
+    @staticmethod
+    def _custom_metadata(headers) -> Dict[str, str]:
+        """Extract user-defined metadata from response headers."""
+        return {
+            lowered[_META_LEN:]: value
+            for key, value in headers.items()
+            if (lowered := key.lower()).startswith(_META_PREFIX)
+        }
+
+    # ===== Object Operations =====
+
+    async def upload_object(
+        self,
+        bucket_name: str,
+        object_name: str,
+        data: Union[str, bytes],
+        content_type: Optional[str] = None,
+        metadata: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, str]:
+        """
+        Upload an object to an existing bucket.
+
+        Args:
+            bucket_name: Name of the bucket
+            object_name: Name of the object
+            data: Data to upload (string or bytes)
+            content_type: Content type of the object
+            metadata: Metadata to attach to the object
+
+        Returns:
+            Dictionary containing etag and version_id
+
+        Raises:
+            S3Error: If there was an error uploading the object
+        """
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+            if content_type is None:
+                content_type = "text/plain"
+
+        headers = {"Content-Type": content_type or "application/octet-stream"}
+        for key, value in (metadata or {}).items():
+            headers[_META_PREFIX + key] = value
+
+        try:
+            response_headers, _ = await self._request(
+                "PUT", bucket_name, object_name, body=bytes(data), headers=headers
+            )
+        except S3Error as e:
+            logger.error("Error uploading object %s/%s: %s", bucket_name, object_name, e)
+            raise
+
+        logger.info("Uploaded object: %s/%s", bucket_name, object_name)
+        return {
+            "etag": response_headers.get("ETag", "").strip('"'),
+            "version_id": response_headers.get("x-amz-version-id"),
+        }
+
+    async def download_object(
+        self, bucket_name: str, object_name: str
+    ) -> Tuple[bytes, Dict[str, str]]:
+        """
+        Download an object from a bucket.
+
+        Args:
+            bucket_name: Name of the bucket
+            object_name: Name of the object
+
+        Returns:
+            Tuple containing the object data and metadata
+
+        Raises:
+            S3Error: If there was an error downloading the object
+        """
+        try:
+            headers, data = await self._request("GET", bucket_name, object_name)
+        except S3Error as e:
+            logger.error("Error downloading object %s/%s: %s", bucket_name, object_name, e)
+            raise
+
+        metadata = {
+            "content_type": headers.get("Content-Type", ""),
+            "etag": headers.get("ETag", "").strip('"'),
+            "last_modified": headers.get("Last-Modified", ""),
+            "size": headers.get("Content-Length", ""),
+        }
+        metadata.update(self._custom_metadata(headers))
+
+        logger.info("Downloaded object: %s/%s", bucket_name, object_name)
+        return data, metadata
+
+    async def get_object_metadata(self, bucket_name: str, object_name: str) -> Dict[str, str]:
+        """
+        Get metadata for an object.
+
+        Args:
+            bucket_name: Name of the bucket
+            object_name: Name of the object
+
+        Returns:
+            Dictionary containing object metadata
+
+        Raises:
+            S3Error: If there was an error getting object metadata
+        """
+        try:
+            headers, _ = await self._request("HEAD", bucket_name, object_name)
+        except S3Error as e:
+            logger.error("Error getting metadata for object %s/%s: %s", bucket_name, object_name, e)
+            raise
+
+        last_modified = headers.get("Last-Modified")
+        metadata = {
+            "size": int(headers.get("Content-Length", 0)),
+            "etag": headers.get("ETag", "").strip('"') or None,
+            "last_modified": (
+                minio_time.from_http_header(last_modified).isoformat() if last_modified else None
+            ),
+            "content_type": headers.get("Content-Type"),
+            "version_id": headers.get("x-amz-version-id"),
+        }
+        metadata.update(self._custom_metadata(headers))
+        return metadata
+
+    async def remove_object(self, bucket_name: str, object_name: str) -> bool:
+        """
+        Remove an object from a bucket.
+
+        Args:
+            bucket_name: Name of the bucket
+            object_name: Name of the object
+
+        Returns:
+            bool: True if the delete succeeded, False if the server reported the
+                object as missing
+
+        Raises:
+            S3Error: If there was an error removing the object
+        """
+        try:
+            await self._request("DELETE", bucket_name, object_name)
+        except S3Error as e:
+            if e.code == "NoSuchKey":
+                return False
+            logger.error("Error removing object %s/%s: %s", bucket_name, object_name, e)
+            raise
+
+        logger.info("Removed object: %s/%s", bucket_name, object_name)
+        return True
+
+    async def download_many(
+        self,
+        bucket_name: str,
+        object_names: List[str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> List[Tuple[bytes, Dict[str, str]]]:
+        """
+        Download many objects concurrently.
+
+        Args:
+            bucket_name: Name of the bucket
+            object_names: Names of the objects to download
+            concurrency: Maximum number of downloads in flight
+
+        Returns:
+            List of (data, metadata) tuples, in the order of object_names
+
+        Raises:
+            S3Error: If there was an error downloading any of the objects
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def download(object_name):
+            async with semaphore:
+                return await self.download_object(bucket_name, object_name)
+
+        return await asyncio.gather(*(download(name) for name in object_names))
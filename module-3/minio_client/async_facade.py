@@ -0,0 +1,96 @@
+"""
+Asyncio facade for the MinIO CRUD Client
+
+This module lets asyncio applications use MinioCrudClient without blocking
+their event loop. Each call runs on a dedicated thread pool sized to the
+client's connection pool, so many requests can be in flight from async code.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from .minio_crud_client import MinioCrudClient
+
+# MinioCrudClient methods exposed as coroutines; iter_objects is left out
+# because a lazy generator would still block the loop on every page
+ASYNC_METHODS = frozenset({
+    "create_bucket",
+    "list_buckets",
+    "bucket_exists",
+    "remove_bucket",
+    "upload_object",
+    "download_object",
+    "upload_file",
+    "upload_objects",
+    "download_objects",
+    "upload_object_multipart_presigned",
+    "list_objects",
+    "object_exists",
+    "get_object_metadata",
+    "update_object",
+    "copy_object",
+    "remove_object",
+    "remove_objects",
+    "get_presigned_url",
+    "is_connected",
+})
+
+
+class AsyncFacade:
+    """
+    Coroutine versions of the MinioCrudClient methods.
+
+    Every method in ASYNC_METHODS takes the same arguments as its
+    MinioCrudClient counterpart and returns an awaitable, e.g.
+    ``await facade.upload_object("bucket", "name", b"data")``.
+    """
+
+    def __init__(
+        self,
+        client: Optional[MinioCrudClient] = None,
+        max_workers: Optional[int] = None,
+        **client_kwargs,
+    ):
+        """
+        Initialize the facade.
+
+        Args:
+            client: Client to wrap; created from client_kwargs if not given
+            max_workers: Number of I/O threads (defaults to the client's
+                connection pool size)
+            **client_kwargs: Arguments for MinioCrudClient
+        """
+        self.client = client or MinioCrudClient(**client_kwargs)
+        if max_workers is None:
+            # More threads than pooled connections would only wait for a connection
+            max_workers = self.client._http.connection_pool_kw["maxsize"]
+        self._io_pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="minio-io")
+
+    def __getattr__(self, name: str):
+        if name not in ASYNC_METHODS:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        method = getattr(self.client, name)
+
+        @functools.wraps(method)
+        async def call(*args, **kwargs):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._io_pool, functools.partial(method, *args, **kwargs)
+            )
+
+        # Cache the wrapper so later lookups skip __getattr__
+        setattr(self, name, call)
+        return call
+
+    async def __aenter__(self) -> "AsyncFacade":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        # Wait for running calls on another thread so the event loop keeps running
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    def close(self) -> None:
+        """Shut down the I/O thread pool once running calls have finished."""
+        self._io_pool.shutdown(wait=True)
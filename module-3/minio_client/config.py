@@ -19,8 +19,27 @@ DEFAULT_CONFIG = {
     "secret_key": "minioadmin",
     "secure": False,  # Set to True for HTTPS
     "region": None,
+    "pool_size": 32,  # Pooled HTTP connections per host
 }
 
+# Environment variable for each configuration key
+ENV_VARS = {
+    "endpoint": "MINIO_ENDPOINT",
+    "access_key": "MINIO_ACCESS_KEY",
+    "secret_key": "MINIO_SECRET_KEY",
+    "secure": "MINIO_SECURE",
+    "region": "MINIO_REGION",
+    "pool_size": "MINIO_POOL_SIZE",
+}
+
+# Snapshot the non-empty environment overrides once, after .env has been loaded,
+# so get_config does not repeat the lookups on every call
+_ENV_CONFIG = {key: os.environ.get(var) for key, var in ENV_VARS.items() if os.environ.get(var)}
+if "secure" in _ENV_CONFIG:
+    _ENV_CONFIG["secure"] = _ENV_CONFIG["secure"].lower() in ("true", "1", "yes")
+if "pool_size" in _ENV_CONFIG:
+    _ENV_CONFIG["pool_size"] = int(_ENV_CONFIG["pool_size"])
+
 
 def get_config(
     endpoint: Optional[str] = None,
@@ -28,6 +47,7 @@ def get_config(
     secret_key: Optional[str] = None,
     secure: Optional[bool] = None,
     region: Optional[str] = None,
+    pool_size: Optional[int] = None,
 ) -> Dict[str, any]:
     """
     Get MinIO configuration with priority:
@@ -35,29 +55,21 @@ def get_config(
     2. Environment variables
     3. Default values
 
+    Environment variables are read once, when this module is imported.
+
     Args:
         endpoint: MinIO server endpoint (host:port)
         access_key: MinIO access key
         secret_key: MinIO secret key
         secure: Whether to use HTTPS
         region: MinIO region
+        pool_size: Number of pooled HTTP connections per host
 
     Returns:
         Dict containing MinIO configuration
     """
-    config = DEFAULT_CONFIG.copy()
-
-    # Override with environment variables if available
-    if os.getenv("MINIO_ENDPOINT"):
-        config["endpoint"] = os.getenv("MINIO_ENDPOINT")
-    if os.getenv("MINIO_ACCESS_KEY"):
-        config["access_key"] = os.getenv("MINIO_ACCESS_KEY")
-    if os.getenv("MINIO_SECRET_KEY"):
-        config["secret_key"] = os.getenv("MINIO_SECRET_KEY")
-    if os.getenv("MINIO_SECURE"):
-        config["secure"] = os.getenv("MINIO_SECURE").lower() in ("true", "1", "yes")
-    if os.getenv("MINIO_REGION"):
-        config["region"] = os.getenv("MINIO_REGION")
+    # Defaults overridden with environment variables if available
+    config = {**DEFAULT_CONFIG, **_ENV_CONFIG}
 
     # Override with explicitly passed parameters if provided
     if endpoint is not None:
@@ -70,5 +82,7 @@ def get_config(
         config["secure"] = secure
     if region is not None:
         config["region"] = region
+    if pool_size is not None:
+        config["pool_size"] = pool_size
 
     return config
@@ -6,10 +6,14 @@ This script shows basic usage of the MinIO CRUD client for common operations.
 
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from minio_client import MinioCrudClient
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
 logger = logging.getLogger(__name__)
 
 
@@ -36,32 +40,47 @@ def main():
     buckets = client.list_buckets()
     logger.info(f"Available buckets: {', '.join(bucket['name'] for bucket in buckets)}")
     
-    # Upload a text object
+    # The three uploads are independent, so issue them concurrently; the
+    # client is thread-safe and waits on the network with the GIL released
     text_object_name = "hello.txt"
-    text_content = "Hello, MinIO!"
-    result = client.upload_object(bucket_name, text_object_name, text_content)
-    logger.info(f"Uploaded text object: {text_object_name}, ETag: {result['etag']}")
-    
-    # Upload a binary object
+    text_content = b"Hello, MinIO!"
     binary_object_name = "binary.dat"
     binary_content = b"\x00\x01\x02\x03\x04\x05"
-    result = client.upload_object(bucket_name, binary_object_name, binary_content)
-    logger.info(f"Uploaded binary object: {binary_object_name}, ETag: {result['etag']}")
-    
-    # Upload an object with metadata and tags
     metadata_object_name = "metadata.txt"
-    metadata_content = "This object has metadata and tags"
+    metadata_content = b"This object has metadata and tags"
     metadata = {"created-by": "example-script", "purpose": "demonstration"}
     tags = {"category": "example", "version": "1.0"}
     
-    result = client.upload_object(
-        bucket_name,
-        metadata_object_name,
-        metadata_content,
-        metadata=metadata,
-        tags=tags,
-    )
-    logger.info(f"Uploaded object with metadata: {metadata_object_name}")
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        # Upload a text object
+        text_future = executor.submit(
+            client.upload_object,
+            bucket_name,
+            text_object_name,
+            text_content,
+            content_type="text/plain",
+        )
+        # Upload a binary object
+        binary_future = executor.submit(
+            client.upload_object, bucket_name, binary_object_name, binary_content
+        )
+        # Upload an object with metadata and tags
+        metadata_future = executor.submit(
+            client.upload_object,
+            bucket_name,
+            metadata_object_name,
+            metadata_content,
+            content_type="text/plain",
+            metadata=metadata,
+            tags=tags,
+        )
+        
+        result = text_future.result()
+        logger.info(f"Uploaded text object: {text_object_name}, ETag: {result['etag']}")
+        result = binary_future.result()
+        logger.info(f"Uploaded binary object: {binary_object_name}, ETag: {result['etag']}")
+        metadata_future.result()
+        logger.info(f"Uploaded object with metadata: {metadata_object_name}")
     
     # List objects in the bucket
     objects = client.list_objects(bucket_name)
@@ -69,18 +88,21 @@ def main():
     for obj in objects:
         logger.info(f"  - {obj['name']} ({obj['size']} bytes)")
     
-    # Download an object
-    data, metadata = client.download_object(bucket_name, text_object_name)
-    logger.info(f"Downloaded object {text_object_name}: {data.decode('utf-8')}")
-    logger.info(f"Object metadata: {metadata}")
-    
-    # Get object metadata
-    metadata = client.get_object_metadata(bucket_name, metadata_object_name)
-    logger.info(f"Metadata for {metadata_object_name}: {metadata}")
+    # Download an object and get another object's metadata concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        download_future = executor.submit(client.download_object, bucket_name, text_object_name)
+        metadata_future = executor.submit(client.get_object_metadata, bucket_name, metadata_object_name)
+        
+        data, metadata = download_future.result()
+        logger.info(f"Downloaded object {text_object_name}: {data.decode('utf-8')}")
+        logger.info(f"Object metadata: {metadata}")
+        
+        metadata = metadata_future.result()
+        logger.info(f"Metadata for {metadata_object_name}: {metadata}")
     
     # Update an object
-    updated_content = "Updated content"
-    client.update_object(bucket_name, text_object_name, updated_content)
+    updated_content = b"Updated content"
+    client.update_object(bucket_name, text_object_name, updated_content, content_type="text/plain")
     logger.info(f"Updated object: {text_object_name}")
     
     # Download the updated object
@@ -96,12 +118,11 @@ def main():
     result = client.copy_object(bucket_name, text_object_name, bucket_name, copy_object_name)
     logger.info(f"Copied {text_object_name} to {copy_object_name}")
     
-    # Remove an object
-    client.remove_object(bucket_name, text_object_name)
-    logger.info(f"Removed object: {text_object_name}")
-    
-    # Remove multiple objects
-    client.remove_objects(bucket_name, [binary_object_name, metadata_object_name, copy_object_name])
+    # Remove all objects in one batched request
+    client.remove_objects(
+        bucket_name,
+        [text_object_name, binary_object_name, metadata_object_name, copy_object_name],
+    )
     logger.info("Removed multiple objects")
     
     # Remove the bucket
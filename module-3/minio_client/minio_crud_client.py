@@ -5,26 +5,123 @@ This module provides a client for performing CRUD operations on a MinIO server.
 It supports creating, reading, updating, and deleting objects and buckets.
 """
 
-import io
 import os
 import json
-from typing import Dict, List, Optional, Union, BinaryIO, Tuple, Iterator
+import mmap
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from datetime import timedelta
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, List, Optional, Union, BinaryIO, Tuple, Iterable, Iterator
 import logging
-from urllib3.exceptions import MaxRetryError
+import certifi
+import urllib3
+from urllib3.exceptions import HTTPError
 
 from minio import Minio
-from minio.error import S3Error
-from minio.commonconfig import Tags
+from minio.error import MinioException, S3Error
+from minio.commonconfig import REPLACE, CopySource, Tags
+from minio.datatypes import Part
+from minio.deleteobjects import DeleteObject
 
 from .config import get_config
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+# Logging is left for the application to configure; without any configuration
+# only warnings and errors reach stderr
 logger = logging.getLogger(__name__)
 
+# S3 accepts at most 1000 keys per DeleteObjects request
+REMOVE_BATCH_SIZE = 1000
+
+# Prefix of user-defined metadata headers
+_META_PREFIX = "x-amz-meta-"
+_META_LEN = len(_META_PREFIX)
+
+# Seconds a confirmed bucket is trusted to exist before it is checked again
+BUCKET_EXISTS_TTL = 60
+
+# Default number of concurrent requests for the batch operations; keep it at or
+# below the connection pool size so threads do not wait for a connection
+DEFAULT_MAX_WORKERS = 16
+
+# Seconds warm_up waits for a free pooled connection before giving up
+WARM_UP_POOL_TIMEOUT = 1
+
+
+@lru_cache(maxsize=256)
+def _make_tags(items: Tuple[Tuple[str, str], ...]) -> Tags:
+    """Build object Tags once per distinct tag set; the SDK only reads them."""
+    tag_obj = Tags(for_object=True)
+    for key, value in items:
+        tag_obj[key] = value
+    return tag_obj
+
+
+class _MVReader:
+    """
+    Read-only file object over a bytes-like buffer.
+    
+    Unlike io.BytesIO it never copies the buffer up front. The minio SDK only
+    accepts bytes from read(), so a read of a whole bytes buffer hands back the
+    buffer itself and any other read copies just the slice asked for.
+    """
+
+    def __init__(self, buf: Union[bytes, bytearray, memoryview]):
+        self.buf = buf
+        self.mv = memoryview(buf).cast("B")
+        self.pos = 0
+
+    def read(self, n: int = -1) -> bytes:
+        size = len(self.mv)
+        end = size if n is None or n < 0 else min(self.pos + n, size)
+        if self.pos == 0 and end == size and type(self.buf) is bytes:
+            chunk = self.buf
+        else:
+            chunk = self.mv[self.pos:end].tobytes()
+        self.pos = end
+        return chunk
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_CUR:
+            offset += self.pos
+        elif whence == os.SEEK_END:
+            offset += len(self.mv)
+        self.pos = max(0, offset)
+        return self.pos
+
+    def tell(self) -> int:
+        return self.pos
+
+
+def _from_str(data: str) -> Tuple[_MVReader, int, Optional[str]]:
+    """Upload source for a string: its UTF-8 encoding, sent as text/plain."""
+    encoded = data.encode("utf-8")
+    return _MVReader(encoded), len(encoded), "text/plain"
+
+
+def _from_bytes(data: Union[bytes, bytearray, memoryview]) -> Tuple[_MVReader, int, Optional[str]]:
+    """Upload source for bytes-like data: a reader over the caller's buffer."""
+    reader = _MVReader(data)
+    return reader, len(reader.mv), None
+
+
+def _from_filelike(data: BinaryIO) -> Tuple[BinaryIO, int, Optional[str]]:
+    """Upload source for a seekable file-like object, sized by seeking to its end."""
+    data.seek(0, os.SEEK_END)
+    data_size = data.tell()
+    data.seek(0)
+    return data, data_size, "application/octet-stream"
+
+
+# Exact type -> upload source builder; anything else is treated as file-like
+_UPLOAD_DISPATCH = {
+    str: _from_str,
+    bytes: _from_bytes,
+    bytearray: _from_bytes,
+    memoryview: _from_bytes,
+}
+
 
 class MinioCrudClient:
     """
@@ -41,6 +138,8 @@ class MinioCrudClient:
         secret_key: Optional[str] = None,
         secure: Optional[bool] = None,
         region: Optional[str] = None,
+        pool_size: Optional[int] = None,
+        prewarm: bool = False,
     ):
         """
         Initialize the MinIO CRUD client.
@@ -51,6 +150,8 @@ class MinioCrudClient:
             secret_key: MinIO secret key
             secure: Whether to use HTTPS
             region: MinIO region
+            pool_size: Number of pooled HTTP connections per host
+            prewarm: Open every pooled connection now (see warm_up)
         """
         config = get_config(
             endpoint=endpoint,
@@ -58,17 +159,158 @@ class MinioCrudClient:
             secret_key=secret_key,
             secure=secure,
             region=region,
+            pool_size=pool_size,
         )
         
+        # Keep-alive pool with one connection per concurrent request; block=True
+        # makes extra threads wait for a free connection instead of opening
+        # throwaway ones that are discarded when the pool is full
+        http_client = urllib3.PoolManager(
+            num_pools=4,
+            maxsize=config["pool_size"],
+            block=True,
+            # Fail fast on unreachable hosts; keep the SDK's 300 s read timeout
+            # so large or slow multipart GETs are not cut off
+            timeout=urllib3.Timeout(connect=3, read=300),
+            cert_reqs="CERT_REQUIRED",
+            ca_certs=os.environ.get("SSL_CERT_FILE") or certifi.where(),
+            retries=urllib3.Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[500, 502, 503, 504],
+            ),
+        )
+        
+        self._http = http_client
         self.client = Minio(
             endpoint=config["endpoint"],
             access_key=config["access_key"],
             secret_key=config["secret_key"],
             secure=config["secure"],
             region=config["region"],
+            http_client=http_client,
         )
         
-        logger.info(f"Initialized MinIO client for endpoint: {config['endpoint']}")
+        # MinIO's unauthenticated liveness endpoint, used by is_connected
+        scheme = "https" if config["secure"] else "http"
+        self._health_url = f"{scheme}://{config['endpoint']}/minio/health/live"
+        
+        # Bucket name -> time.monotonic() of the last confirmation that it exists
+        self._bucket_exists_cache: Dict[str, float] = {}
+        
+        logger.info("Initialized MinIO client for endpoint: %s", config["endpoint"])
+        
+        if prewarm:
+            self.warm_up()
+
+    def warm_up(self, connections: Optional[int] = None) -> int:
+        """
+        Open pooled connections ahead of the first requests.
+        
+        Each connection completes its TCP (and TLS) handshake and is returned to
+        the pool that the SDK uses for this endpoint, so the first burst of
+        concurrent requests finds warm sockets. Sequential requests would reuse
+        one socket, so the connections are opened directly.
+        
+        Args:
+            connections: Number of connections to open (defaults to, and at most,
+                the pool size)
+            
+        Returns:
+            int: Number of connections opened
+        """
+        pool = self._http.connection_from_url(self._health_url)
+        maxsize = self._http.connection_pool_kw["maxsize"]
+        # The pool blocks once all its connections are taken, so never ask for more
+        connections = maxsize if connections is None else min(connections, maxsize)
+        
+        conns = []
+        try:
+            for _ in range(connections):
+                # Connections held by other threads may leave none free
+                conn = pool._get_conn(timeout=WARM_UP_POOL_TIMEOUT)
+                try:
+                    conn.connect()
+                except (OSError, HTTPError):
+                    # Drop the connection that failed to open, keeping its slot
+                    conn.close()
+                    pool._put_conn(None)
+                    raise
+                conns.append(conn)
+        except (OSError, HTTPError) as e:
+            logger.warning("Warmed %d connections before failing: %s", len(conns), e)
+        finally:
+            for conn in conns:
+                pool._put_conn(conn)
+        
+        logger.debug("Warmed %d connections to %s", len(conns), self._health_url)
+        return len(conns)
+
+    def _bucket_exists_cached(self, bucket_name: str, ttl: float = BUCKET_EXISTS_TTL) -> bool:
+        """
+        Check if a bucket exists, skipping the request if it was confirmed recently.
+        
+        Only positive results are cached, so a bucket created elsewhere is seen
+        on the next call. A bucket deleted elsewhere may be reported as existing
+        for up to ttl seconds.
+        
+        Args:
+            bucket_name: Name of the bucket to check
+            ttl: Seconds a cached confirmation stays valid
+            
+        Returns:
+            bool: True if bucket exists, False otherwise
+        """
+        checked_at = self._bucket_exists_cache.get(bucket_name)
+        if checked_at is not None and time.monotonic() - checked_at < ttl:
+            return True
+        
+        exists = self.client.bucket_exists(bucket_name)
+        if exists:
+            self._bucket_exists_cache[bucket_name] = time.monotonic()
+        return exists
+
+    def _ensure_bucket_then(
+        self, bucket_name: str, op, /, *args, source_bucket: Optional[str] = None, **kwargs
+    ):
+        """
+        Run op, creating the bucket and retrying once if it does not exist.
+        
+        The common case, a bucket that already exists, costs a single request
+        instead of an existence check followed by the operation. Only
+        bucket_name is ever created: if it exists, or source_bucket is
+        missing, the error is re-raised.
+        
+        Args:
+            bucket_name: Name of the bucket op writes to
+            op: Callable performing the request
+            *args: Positional arguments for op
+            source_bucket: Name of a bucket op reads from, which is never created
+            **kwargs: Keyword arguments for op
+            
+        Returns:
+            The result of op
+        """
+        try:
+            return op(*args, **kwargs)
+        except S3Error as e:
+            if e.code != "NoSuchBucket" or (e.bucket_name or bucket_name) != bucket_name:
+                raise
+            # The error may name the request's bucket whichever one is missing
+            if source_bucket is not None and not self.client.bucket_exists(source_bucket):
+                raise
+            if self.client.bucket_exists(bucket_name):
+                raise
+        
+        try:
+            self.client.make_bucket(bucket_name)
+            logger.info("Created bucket: %s", bucket_name)
+        except S3Error as e:
+            # A concurrent caller may have created it in the meantime
+            if e.code != "BucketAlreadyOwnedByYou":
+                raise
+        self._bucket_exists_cache[bucket_name] = time.monotonic()
+        return op(*args, **kwargs)
 
     # ===== Bucket Operations =====
     
@@ -89,13 +331,14 @@ class MinioCrudClient:
         try:
             if not self.client.bucket_exists(bucket_name):
                 self.client.make_bucket(bucket_name, location=location)
-                logger.info(f"Created bucket: {bucket_name}")
+                self._bucket_exists_cache[bucket_name] = time.monotonic()
+                logger.info("Created bucket: %s", bucket_name)
                 return True
             else:
-                logger.info(f"Bucket already exists: {bucket_name}")
+                logger.info("Bucket already exists: %s", bucket_name)
                 return False
         except S3Error as e:
-            logger.error(f"Error creating bucket {bucket_name}: {e}")
+            logger.error("Error creating bucket %s: %s", bucket_name, e)
             raise
 
     def list_buckets(self) -> List[Dict[str, str]]:
@@ -115,7 +358,7 @@ class MinioCrudClient:
                 for bucket in buckets
             ]
         except S3Error as e:
-            logger.error(f"Error listing buckets: {e}")
+            logger.error("Error listing buckets: %s", e)
             raise
 
     def bucket_exists(self, bucket_name: str) -> bool:
@@ -134,16 +377,20 @@ class MinioCrudClient:
         try:
             return self.client.bucket_exists(bucket_name)
         except S3Error as e:
-            logger.error(f"Error checking if bucket {bucket_name} exists: {e}")
+            logger.error("Error checking if bucket %s exists: %s", bucket_name, e)
             raise
 
-    def remove_bucket(self, bucket_name: str, force: bool = False) -> bool:
+    def remove_bucket(
+        self, bucket_name: str, force: bool = False, max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> bool:
         """
         Remove a bucket.
         
         Args:
             bucket_name: Name of the bucket to remove
-            force: If True, remove all objects in the bucket before removing the bucket
+            force: If True, remove all objects in the bucket before removing the bucket;
+                the object listing is streamed, never held in memory as a whole
+            max_workers: Number of concurrent delete requests used when force is True
             
         Returns:
             bool: True if bucket was removed, False if it doesn't exist
@@ -152,34 +399,88 @@ class MinioCrudClient:
             S3Error: If there was an error removing the bucket
         """
         try:
+            # Forget the bucket up front so a failed removal is rechecked next time
+            self._bucket_exists_cache.pop(bucket_name, None)
             if not self.client.bucket_exists(bucket_name):
-                logger.info(f"Bucket does not exist: {bucket_name}")
+                logger.info("Bucket does not exist: %s", bucket_name)
                 return False
                 
             if force:
                 # Remove all objects in the bucket first
-                objects = self.client.list_objects(bucket_name, recursive=True)
-                objects_to_delete = [obj.object_name for obj in objects]
-                
-                if objects_to_delete:
-                    errors = self.client.remove_objects(bucket_name, objects_to_delete)
-                    for error in errors:
-                        logger.error(f"Error removing object: {error}")
+                self._remove_all_objects(bucket_name, max_workers)
             
             self.client.remove_bucket(bucket_name)
-            logger.info(f"Removed bucket: {bucket_name}")
+            logger.info("Removed bucket: %s", bucket_name)
             return True
         except S3Error as e:
-            logger.error(f"Error removing bucket {bucket_name}: {e}")
+            logger.error("Error removing bucket %s: %s", bucket_name, e)
             raise
 
+    def _remove_all_objects(self, bucket_name: str, max_workers: int) -> None:
+        """
+        Delete every object in a bucket with concurrent batched requests.
+        
+        Args:
+            bucket_name: Name of the bucket to empty
+            max_workers: Number of concurrent delete requests
+        """
+        objects = self.client.list_objects(bucket_name, recursive=True)
+        _, errors = self._remove_in_batches(
+            bucket_name, (obj.object_name for obj in objects), max_workers
+        )
+        if logger.isEnabledFor(logging.ERROR):
+            for error in errors:
+                logger.error("Error removing object: %s", error)
+
+    def _remove_in_batches(
+        self, bucket_name: str, object_names: Iterable[str], max_workers: int
+    ) -> Tuple[int, list]:
+        """
+        Delete objects with concurrent batched requests.
+        
+        The names are consumed lazily in batches of REMOVE_BATCH_SIZE keys, and
+        each batch is deleted on a thread pool sharing this client's connection
+        pool, so producing and deleting names overlap and at most a few batches
+        are held in memory at a time.
+        
+        Args:
+            bucket_name: Name of the bucket
+            object_names: Names of the objects to remove (any iterable)
+            max_workers: Number of concurrent delete requests
+            
+        Returns:
+            Tuple containing the number of names submitted and the DeleteError
+            entries reported by the server
+        """
+        to_delete = (DeleteObject(name) for name in object_names)
+        
+        def remove_batch(batch):
+            # remove_objects is lazy; consuming the errors sends the request
+            return list(self.client.remove_objects(bucket_name, batch))
+        
+        count = 0
+        errors = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = set()
+            for batch in iter(lambda: list(islice(to_delete, REMOVE_BATCH_SIZE)), []):
+                count += len(batch)
+                pending.add(executor.submit(remove_batch, batch))
+                # Stop reading ahead once every worker has a batch queued
+                if len(pending) >= 2 * max_workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        errors.extend(future.result())
+            for future in wait(pending).done:
+                errors.extend(future.result())
+        return count, errors
+
     # ===== Object Operations =====
     
     def upload_object(
         self,
         bucket_name: str,
         object_name: str,
-        data: Union[str, bytes, BinaryIO],
+        data: Union[str, bytes, bytearray, memoryview, BinaryIO],
         content_type: Optional[str] = None,
         metadata: Optional[Dict[str, str]] = None,
         tags: Optional[Dict[str, str]] = None,
@@ -191,7 +492,8 @@ class MinioCrudClient:
         Args:
             bucket_name: Name of the bucket
             object_name: Name of the object
-            data: Data to upload (string, bytes, or file-like object)
+            data: Data to upload (string, bytes-like, or file-like object);
+                strings are UTF-8 encoded, so pass bytes to skip the encoding copy
             content_type: Content type of the object
             metadata: Metadata to attach to the object
             tags: Tags to attach to the object
@@ -204,71 +506,70 @@ class MinioCrudClient:
             S3Error: If there was an error uploading the object
         """
         try:
-            # Create bucket if it doesn't exist
-            if not self.client.bucket_exists(bucket_name):
-                self.client.make_bucket(bucket_name)
-                logger.info(f"Created bucket: {bucket_name}")
-            
-            # Convert string to bytes if necessary
-            if isinstance(data, str):
-                data = data.encode("utf-8")
-                if content_type is None:
-                    content_type = "text/plain"
-            
-            # Convert bytes to BytesIO if necessary
-            if isinstance(data, bytes):
-                data_size = len(data)
-                data = io.BytesIO(data)
-            else:
-                # Get file size for file-like objects
-                data.seek(0, os.SEEK_END)
-                data_size = data.tell()
+            # One lookup on the exact type picks the reader, size and default content type
+            handler = _UPLOAD_DISPATCH.get(type(data), _from_filelike)
+            data, data_size, default_content_type = handler(data)
+            if content_type is None:
+                content_type = default_content_type
+            
+            # Prepare tags if provided, reusing them across uploads with the same tags
+            tag_obj = _make_tags(tuple(sorted(tags.items()))) if tags else None
+            
+            def put_object():
+                # Rewind in case a first attempt consumed the data
                 data.seek(0)
-                
-                if content_type is None:
-                    content_type = "application/octet-stream"
-            
-            # Prepare tags if provided
-            tag_obj = None
-            if tags:
-                tag_obj = Tags(for_object=True)
-                for key, value in tags.items():
-                    tag_obj[key] = value
-            
-            # Upload the object
-            result = self.client.put_object(
-                bucket_name=bucket_name,
-                object_name=object_name,
-                data=data,
-                length=data_size,
-                content_type=content_type,
-                metadata=metadata,
-                tags=tag_obj,
-                part_size=part_size,
-            )
+                return self.client.put_object(
+                    bucket_name=bucket_name,
+                    object_name=object_name,
+                    data=data,
+                    length=data_size,
+                    content_type=content_type,
+                    metadata=metadata,
+                    tags=tag_obj,
+                    part_size=part_size,
+                )
             
-            logger.info(f"Uploaded object: {bucket_name}/{object_name}")
+            # Upload the object, creating the bucket only if it is missing
+            result = self._ensure_bucket_then(bucket_name, put_object)
+            
+            logger.info("Uploaded object: %s/%s", bucket_name, object_name)
             return {
                 "etag": result.etag,
                 "version_id": result.version_id,
             }
         except S3Error as e:
-            logger.error(f"Error uploading object {bucket_name}/{object_name}: {e}")
+            logger.error("Error uploading object %s/%s: %s", bucket_name, object_name, e)
             raise
 
     def download_object(
-        self, bucket_name: str, object_name: str, version_id: Optional[str] = None
-    ) -> Tuple[bytes, Dict[str, str]]:
+        self,
+        bucket_name: str,
+        object_name: str,
+        version_id: Optional[str] = None,
+        writer: Optional[BinaryIO] = None,
+        chunk_size: int = 1 << 16,  # 64KB
+        zero_copy: bool = False,
+    ) -> Tuple[Optional[Union[bytes, bytearray]], Dict[str, str]]:
         """
         Download an object from a bucket.
         
+        The body is streamed in chunks rather than read in one piece. With a
+        writer, each chunk is written to it as it arrives and nothing is
+        buffered; otherwise the chunks are copied into one buffer preallocated
+        from the Content-Length header, which is returned as bytes unless
+        zero_copy is set.
+        
         Args:
             bucket_name: Name of the bucket
             object_name: Name of the object
             version_id: Version ID of the object
+            writer: Binary file-like object to stream the data into
+            chunk_size: Size of the chunks read from the response
+            zero_copy: Return the buffer itself as a bytearray instead of
+                copying it into bytes
             
         Returns:
-            Tuple containing the object data and metadata
+            Tuple containing the object data (None when a writer is given) and metadata
             
         Raises:
             S3Error: If there was an error downloading the object
@@ -280,8 +581,18 @@ class MinioCrudClient:
                 version_id=version_id,
             )
             
-            # Read the data
-            data = response.read()
+            try:
+                if writer is not None:
+                    for chunk in response.stream(chunk_size):
+                        writer.write(chunk)
+                    data = None
+                else:
+                    data = self._read_into_buffer(response, chunk_size)
+                    if not zero_copy:
+                        data = bytes(data)
+            finally:
+                response.close()
+                response.release_conn()
             
             # Get the metadata
             metadata = {
@@ -291,37 +602,277 @@ class MinioCrudClient:
                 "size": response.headers.get("Content-Length", ""),
             }
             
-            # Add custom metadata
-            for key, value in response.headers.items():
-                if key.lower().startswith("x-amz-meta-"):
-                    metadata_key = key[len("x-amz-meta-"):].lower()
-                    metadata[metadata_key] = value
+            # Add custom metadata, lowering each header name once
+            metadata.update({
+                lowered[_META_LEN:]: value
+                for key, value in response.headers.items()
+                if (lowered := key.lower()).startswith(_META_PREFIX)
+            })
             
-            response.close()
-            response.release_conn()
-            
-            logger.info(f"Downloaded object: {bucket_name}/{object_name}")
+            logger.info("Downloaded object: %s/%s", bucket_name, object_name)
             return data, metadata
         except S3Error as e:
-            logger.error(f"Error downloading object {bucket_name}/{object_name}: {e}")
+            logger.error("Error downloading object %s/%s: %s", bucket_name, object_name, e)
             raise
 
-    def list_objects(
+    @staticmethod
+    def _read_into_buffer(response, chunk_size: int) -> bytearray:
+        """
+        Copy a streamed response body into a single buffer.
+        
+        The buffer is sized from Content-Length up front, so each chunk is
+        copied exactly once; it grows only if the header is missing or short.
+        """
+        size = int(response.headers.get("Content-Length") or 0)
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        offset = 0
+        for chunk in response.stream(chunk_size):
+            end = offset + len(chunk)
+            if end <= size:
+                view[offset:end] = chunk
+            else:
+                # Release the view so the buffer may be resized
+                view.release()
+                del buffer[offset:]
+                buffer.extend(chunk)
+                size = end
+                view = memoryview(buffer)
+            offset = end
+        view.release()
+        del buffer[offset:]
+        return buffer
+
+    def upload_file(
+        self,
+        bucket_name: str,
+        object_name: str,
+        file_path: str,
+        **kwargs,
+    ) -> Dict[str, str]:
+        """
+        Upload a local file to a bucket.
+        
+        The file is memory-mapped and handed to the SDK as the stream, so each
+        part is read straight from the page cache as it is sent and the file
+        is never loaded into the Python heap as a whole.
+        
+        Args:
+            bucket_name: Name of the bucket
+            object_name: Name of the object
+            file_path: Path of the local file to upload
+            **kwargs: Extra arguments passed to upload_object (content_type,
+                metadata, tags, part_size)
+            
+        Returns:
+            Dictionary containing etag and version_id
+            
+        Raises:
+            S3Error: If there was an error uploading the object
+        """
+        kwargs.setdefault("content_type", "application/octet-stream")
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
+            if size == 0:
+                # Empty files cannot be mapped
+                return self.upload_object(bucket_name, object_name, b"", **kwargs)
+            
+            with mmap.mmap(fd, size, access=mmap.ACCESS_READ) as mapped:
+                return self.upload_object(bucket_name, object_name, mapped, **kwargs)
+        finally:
+            os.close(fd)
+
+    def upload_objects(
+        self,
+        bucket_name: str,
+        items: List[Tuple[str, Union[str, bytes, bytearray, BinaryIO]]],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        **kwargs,
+    ) -> List[Dict[str, str]]:
+        """
+        Upload many objects to a bucket concurrently.
+        
+        The uploads share this client's connection pool, so their network
+        round-trips overlap instead of running one after another.
+        
+        Args:
+            bucket_name: Name of the bucket
+            items: (object name, data) pairs to upload
+            max_workers: Number of concurrent uploads
+            **kwargs: Extra arguments passed to upload_object for every item
+            
+        Returns:
+            List of dictionaries containing etag and version_id, in the order of items
+            
+        Raises:
+            S3Error: If there was an error uploading any of the objects
+        """
+        # Create the bucket once up front rather than racing in every upload
+        if not self._bucket_exists_cached(bucket_name):
+            self.create_bucket(bucket_name)
+        
+        results = [None] * len(items)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.upload_object, bucket_name, object_name, data, **kwargs): index
+                for index, (object_name, data) in enumerate(items)
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        
+        return results
+
+    def download_objects(
+        self,
+        bucket_name: str,
+        object_names: List[str],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> List[Tuple[bytes, Dict[str, str]]]:
+        """
+        Download many objects from a bucket concurrently.
+        
+        Args:
+            bucket_name: Name of the bucket
+            object_names: Names of the objects to download
+            max_workers: Number of concurrent downloads
+            
+        Returns:
+            List of (data, metadata) tuples, in the order of object_names
+            
+        Raises:
+            S3Error: If there was an error downloading any of the objects
+        """
+        results = [None] * len(object_names)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.download_object, bucket_name, object_name): index
+                for index, object_name in enumerate(object_names)
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        
+        return results
+
+    def upload_object_multipart_presigned(
+        self,
+        bucket_name: str,
+        object_name: str,
+        file_path: str,
+        part_size: int = 16 * 1024 * 1024,  # 16MB
+        concurrency: int = 8,
+        content_type: str = "application/octet-stream",
+        expires: int = 3600,
+    ) -> Dict[str, str]:
+        """
+        Upload a large file as a multipart upload with parts PUT to presigned URLs.
+        
+        The SDK only starts and completes the upload; every part is sent by a
+        plain HTTP PUT to its own presigned URL, concurrently, straight from a
+        memory map of the file, so part data is never copied into Python
+        objects or re-signed by the SDK.
+        
+        Args:
+            bucket_name: Name of the bucket
+            object_name: Name of the object
+            file_path: Path of the local file to upload
+            part_size: Size of each part (at least 5MB, except the last one)
+            concurrency: Number of parts uploaded at once
+            content_type: Content type of the object
+            expires: Expiration time of the part URLs in seconds
+            
+        Returns:
+            Dictionary containing etag and version_id
+            
+        Raises:
+            S3Error: If there was an error starting or completing the upload
+            IOError: If a part could not be uploaded
+        """
+        file_size = os.path.getsize(file_path)
+        if file_size == 0:
+            # A multipart upload needs at least one part; nothing to split here
+            with open(file_path, "rb") as f:
+                return self.upload_object(bucket_name, object_name, f, content_type=content_type)
+        
+        try:
+            upload_id = self._ensure_bucket_then(
+                bucket_name,
+                self.client._create_multipart_upload,
+                bucket_name, object_name, {"Content-Type": content_type},
+            )
+        except S3Error as e:
+            logger.error("Error starting multipart upload %s/%s: %s", bucket_name, object_name, e)
+            raise
+        
+        n_parts = (file_size + part_size - 1) // part_size
+        
+        try:
+            with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                
+                def put_part(part_number):
+                    url = self.client.get_presigned_url(
+                        "PUT",
+                        bucket_name,
+                        object_name,
+                        expires=timedelta(seconds=expires),
+                        extra_query_params={
+                            "partNumber": str(part_number),
+                            "uploadId": upload_id,
+                        },
+                    )
+                    start = (part_number - 1) * part_size
+                    # The view is sent as is, without copying the part into bytes
+                    with memoryview(mapped) as view, view[start:start + part_size] as body:
+                        response = self._http.request("PUT", url, body=body)
+                    if response.status != 200:
+                        raise IOError(
+                            f"Uploading part {part_number} of {bucket_name}/{object_name} "
+                            f"failed with HTTP {response.status}: {response.data[:200]!r}"
+                        )
+                    return Part(part_number, response.headers["ETag"])
+                
+                with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                    parts = list(executor.map(put_part, range(1, n_parts + 1)))
+            
+            result = self.client._complete_multipart_upload(
+                bucket_name, object_name, upload_id, parts
+            )
+        except Exception as e:
+            logger.error("Error uploading object %s/%s in parts: %s", bucket_name, object_name, e)
+            # Drop the parts already stored so they do not linger on the server
+            try:
+                self.client._abort_multipart_upload(bucket_name, object_name, upload_id)
+            except S3Error:
+                pass
+            raise
+        
+        logger.info("Uploaded object in %d parts: %s/%s", n_parts, bucket_name, object_name)
+        return {
+            "etag": result.etag,
+            "version_id": result.version_id,
+        }
+
+    def iter_objects(
         self,
         bucket_name: str,
         prefix: Optional[str] = None,
         recursive: bool = False,
-    ) -> List[Dict[str, str]]:
+        start_after: Optional[str] = None,
+    ) -> Iterator[Dict[str, str]]:
         """
-        List objects in a bucket.
+        Iterate over objects in a bucket.
+        
+        Objects are yielded as the SDK pages through the listing, so memory stays
+        bounded by one page regardless of how many objects the bucket holds.
         
         Args:
             bucket_name: Name of the bucket
             prefix: Prefix to filter objects
             recursive: Whether to list objects recursively
+            start_after: Only list objects after this key (to resume a listing)
             
-        Returns:
-            List of dictionaries containing object information
+        Yields:
+            Dictionaries containing object information
             
         Raises:
             S3Error: If there was an error listing objects
@@ -331,21 +882,44 @@ class MinioCrudClient:
                 bucket_name=bucket_name,
                 prefix=prefix,
                 recursive=recursive,
+                start_after=start_after,
             )
             
-            return [
-                {
+            for obj in objects:
+                yield {
                     "name": obj.object_name,
                     "size": obj.size,
                     "last_modified": obj.last_modified.isoformat() if obj.last_modified else None,
                     "etag": obj.etag.strip('"') if obj.etag else None,
                 }
-                for obj in objects
-            ]
         except S3Error as e:
-            logger.error(f"Error listing objects in bucket {bucket_name}: {e}")
+            logger.error("Error listing objects in bucket %s: %s", bucket_name, e)
             raise
 
+    def list_objects(
+        self,
+        bucket_name: str,
+        prefix: Optional[str] = None,
+        recursive: bool = False,
+        start_after: Optional[str] = None,
+    ) -> List[Dict[str, str]]:
+        """
+        List objects in a bucket.
+        
+        Args:
+            bucket_name: Name of the bucket
+            prefix: Prefix to filter objects
+            recursive: Whether to list objects recursively
+            start_after: Only list objects after this key (to resume a listing)
+            
+        Returns:
+            List of dictionaries containing object information
+            
+        Raises:
+            S3Error: If there was an error listing objects
+        """
+        return list(self.iter_objects(bucket_name, prefix, recursive, start_after))
+
     def object_exists(
         self, bucket_name: str, object_name: str
     ) -> bool:
@@ -368,7 +942,7 @@ class MinioCrudClient:
         except S3Error as e:
             if e.code == "NoSuchKey":
                 return False
-            logger.error(f"Error checking if object {bucket_name}/{object_name} exists: {e}")
+            logger.error("Error checking if object %s/%s exists: %s", bucket_name, object_name, e)
             raise
 
     def get_object_metadata(
@@ -403,16 +977,17 @@ class MinioCrudClient:
                 "version_id": stat.version_id,
             }
             
-            # Add custom metadata
+            # Add custom metadata, lowering each header name once
             if stat.metadata:
-                for key, value in stat.metadata.items():
-                    if key.lower().startswith("x-amz-meta-"):
-                        metadata_key = key[len("x-amz-meta-"):].lower()
-                        metadata[metadata_key] = value
+                metadata.update({
+                    lowered[_META_LEN:]: value
+                    for key, value in stat.metadata.items()
+                    if (lowered := key.lower()).startswith(_META_PREFIX)
+                })
             
             return metadata
         except S3Error as e:
-            logger.error(f"Error getting metadata for object {bucket_name}/{object_name}: {e}")
+            logger.error("Error getting metadata for object %s/%s: %s", bucket_name, object_name, e)
             raise
 
     def update_object(
@@ -481,26 +1056,26 @@ class MinioCrudClient:
             if dest_object is None:
                 dest_object = source_object
                 
-            # Create destination bucket if it doesn't exist
-            if not self.client.bucket_exists(dest_bucket):
-                self.client.make_bucket(dest_bucket)
-                logger.info(f"Created bucket: {dest_bucket}")
-            
-            result = self.client.copy_object(
+            # Create the destination bucket only if the copy finds it missing
+            result = self._ensure_bucket_then(
+                dest_bucket,
+                self.client.copy_object,
+                source_bucket=source_bucket,
                 bucket_name=dest_bucket,
                 object_name=dest_object,
-                source_bucket_name=source_bucket,
-                source_object_name=source_object,
+                source=CopySource(source_bucket, source_object),
                 metadata=metadata,
+                # S3 ignores new metadata unless told to replace the source's
+                metadata_directive=REPLACE if metadata else None,
             )
             
-            logger.info(f"Copied object from {source_bucket}/{source_object} to {dest_bucket}/{dest_object}")
+            logger.info("Copied object from %s/%s to %s/%s", source_bucket, source_object, dest_bucket, dest_object)
             return {
                 "etag": result.etag,
                 "version_id": result.version_id,
             }
         except S3Error as e:
-            logger.error(f"Error copying object from {source_bucket}/{source_object} to {dest_bucket}/{dest_object}: {e}")
+            logger.error("Error copying object from %s/%s to %s/%s: %s", source_bucket, source_object, dest_bucket, dest_object, e)
             raise
 
     def remove_object(
@@ -509,48 +1084,54 @@ class MinioCrudClient:
         """
         Remove an object from a bucket.
         
+        S3 deletes are idempotent, so the delete is sent without checking for
+        the object first; deleting a missing key normally succeeds as well.
+        
         Args:
             bucket_name: Name of the bucket
             object_name: Name of the object
             version_id: Version ID of the object
             
         Returns:
-            bool: True if object was removed, False if it doesn't exist
+            bool: True if the delete succeeded, False if the server reported the
+                object as missing
             
         Raises:
             S3Error: If there was an error removing the object
         """
         try:
-            # Check if object exists
-            try:
-                self.client.stat_object(bucket_name, object_name, version_id=version_id)
-            except S3Error as e:
-                if e.code == "NoSuchKey":
-                    logger.info(f"Object does not exist: {bucket_name}/{object_name}")
-                    return False
-                raise
-                
             self.client.remove_object(
                 bucket_name=bucket_name,
                 object_name=object_name,
                 version_id=version_id,
             )
             
-            logger.info(f"Removed object: {bucket_name}/{object_name}")
+            logger.info("Removed object: %s/%s", bucket_name, object_name)
             return True
         except S3Error as e:
-            logger.error(f"Error removing object {bucket_name}/{object_name}: {e}")
+            if e.code == "NoSuchKey":
+                logger.info("Object does not exist: %s/%s", bucket_name, object_name)
+                return False
+            logger.error("Error removing object %s/%s: %s", bucket_name, object_name, e)
             raise
 
     def remove_objects(
-        self, bucket_name: str, object_names: List[str]
+        self,
+        bucket_name: str,
+        object_names: Iterable[str],
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ) -> List[Dict[str, str]]:
         """
         Remove multiple objects from a bucket.
         
+        Names are sent in DeleteObjects requests of REMOVE_BATCH_SIZE keys, up to
+        max_workers of them at a time. object_names may be a generator, so a
+        large key set never has to be materialized.
+        
         Args:
             bucket_name: Name of the bucket
-            object_names: List of object names to remove
+            object_names: Object names to remove
+            max_workers: Number of concurrent delete requests
             
         Returns:
             List of dictionaries containing error information for failed deletions
@@ -559,23 +1140,23 @@ class MinioCrudClient:
             S3Error: If there was an error removing objects
         """
         try:
-            errors = list(self.client.remove_objects(bucket_name, object_names))
+            count, errors = self._remove_in_batches(bucket_name, object_names, max_workers)
             
             if not errors:
-                logger.info(f"Removed {len(object_names)} objects from bucket {bucket_name}")
+                logger.info("Removed %d objects from bucket %s", count, bucket_name)
             else:
-                logger.warning(f"Removed objects with {len(errors)} errors from bucket {bucket_name}")
+                logger.warning("Removed objects with %d errors from bucket %s", len(errors), bucket_name)
                 
             return [
                 {
-                    "object_name": error.object_name,
-                    "error_code": error.error_code,
-                    "error_message": error.error_message,
+                    "object_name": error.name,
+                    "error_code": error.code,
+                    "error_message": error.message,
                 }
                 for error in errors
             ]
         except S3Error as e:
-            logger.error(f"Error removing objects from bucket {bucket_name}: {e}")
+            logger.error("Error removing objects from bucket %s: %s", bucket_name, e)
             raise
 
     # ===== Utility Methods =====
@@ -610,23 +1191,36 @@ class MinioCrudClient:
                 response_headers=response_headers,
             )
             
-            logger.info(f"Generated presigned URL for {bucket_name}/{object_name}")
+            logger.info("Generated presigned URL for %s/%s", bucket_name, object_name)
             return url
         except S3Error as e:
-            logger.error(f"Error generating presigned URL for {bucket_name}/{object_name}: {e}")
+            logger.error("Error generating presigned URL for %s/%s: %s", bucket_name, object_name, e)
             raise
 
     def is_connected(self) -> bool:
         """
         Check if the client is connected to the MinIO server.
         
+        Probes MinIO's liveness endpoint, which the server answers without
+        touching bucket metadata. A 5xx answer means the server is down;
+        endpoints that answer anything else but 200 (other S3 services, or
+        proxies that reject the unauthenticated probe) fall back to listing
+        buckets.
+        
         Returns:
             bool: True if connected, False otherwise
         """
         try:
-            # Try to list buckets as a simple connectivity test
+            response = self._http.request(
+                "GET", self._health_url, timeout=urllib3.Timeout(2.0), retries=False
+            )
+            if response.status == 200:
+                return True
+            if response.status >= 500:
+                return False
+            
             self.client.list_buckets()
             return True
-        except (S3Error, MaxRetryError) as e:
-            logger.error(f"Error connecting to MinIO server: {e}")
+        except (MinioException, HTTPError) as e:
+            logger.error("Error connecting to MinIO server: %s", e)
             return False
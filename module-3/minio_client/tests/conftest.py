@@ -0,0 +1,8 @@
+"""
+Shared pytest configuration for the MinIO CRUD client tests.
+"""
+
+import sys
+
+# Do not write .pyc files (including pytest's rewritten test modules)
+sys.dont_write_bytecode = True
@@ -17,27 +17,55 @@ Example:
     $ export MINIO_ACCESS_KEY=minioadmin
     $ export MINIO_SECRET_KEY=minioadmin
     $ pytest -xvs tests/test_minio_crud.py
+
+The tests are independent, so they can run in parallel with pytest-xdist:
+    $ pytest -n auto tests/test_minio_crud.py
 """
 
 import os
 import io
 import uuid
+import asyncio
+import contextlib
+import inspect
+import threading
+import time
 import pytest
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from types import SimpleNamespace
+from urllib.parse import urlsplit
 import tempfile
 
+from minio.credentials import Credentials
 from minio.error import S3Error
+from minio.helpers import sha256_hash
+from minio.signer import sign_v4_s3
 
-from minio_client import MinioCrudClient
+from minio_client import MinioCrudClient, AsyncFacade, AsyncMinioCrudClient
+from minio_client.minio_crud_client import REMOVE_BATCH_SIZE
 
 
-# Test bucket and object names with unique prefixes to avoid conflicts
-TEST_BUCKET_PREFIX = "test-bucket-"
+# Test bucket and object names with unique prefixes to avoid conflicts; the
+# pytest-xdist worker id keeps buckets of parallel workers apart
+TEST_BUCKET_PREFIX = f"test-bucket-{os.environ.get('PYTEST_XDIST_WORKER', 'gw0')}-"
 TEST_OBJECT_PREFIX = "test-object-"
 
+# Payload for the large object test, allocated once; bytes(n) is zero-filled
+LARGE_PAYLOAD_SIZE = 5 * 1024 * 1024
+_LARGE_PAYLOAD = bytes(LARGE_PAYLOAD_SIZE)
 
-# Fixture for the MinIO client
-@pytest.fixture
+# The async client is optional and needs aiohttp
+requires_aiohttp = pytest.mark.skipif(
+    AsyncMinioCrudClient is None, reason="aiohttp is not installed"
+)
+
+
+# Fixture for the MinIO client, shared by the whole session so the connection
+# pool and the availability check are set up once; pytest caches a skip raised
+# here too, so without a server the probe still runs only once per session
+@pytest.fixture(scope="session")
 def minio_client():
     """Create a MinIO client for testing."""
     client = MinioCrudClient()
@@ -49,10 +77,10 @@ def minio_client():
     return client
 
 
-# Fixture for a test bucket
-@pytest.fixture
-def test_bucket(minio_client):
-    """Create a test bucket and clean it up after the test."""
+# Fixture for a bucket shared by the object tests
+@pytest.fixture(scope="session")
+def shared_bucket(minio_client):
+    """Create one bucket for the session and clean it up at the end."""
     bucket_name = f"{TEST_BUCKET_PREFIX}{uuid.uuid4()}"
     minio_client.create_bucket(bucket_name)
     
@@ -65,6 +93,13 @@ def test_bucket(minio_client):
         pass
 
 
+# Fixture for a test bucket
+@pytest.fixture
+def test_bucket(shared_bucket):
+    """Return the shared bucket; tests use unique object names inside it."""
+    return shared_bucket
+
+
 # Fixture for a test object
 @pytest.fixture
 def test_object(minio_client, test_bucket):
@@ -154,40 +189,32 @@ def test_remove_bucket(minio_client):
 
 # ===== Object Tests =====
 
-def test_upload_object_string(minio_client, test_bucket):
-    """Test uploading a string object."""
-    object_name = f"{TEST_OBJECT_PREFIX}{uuid.uuid4()}"
-    content = "Test content"
-    
-    # Upload the object
-    result = minio_client.upload_object(test_bucket, object_name, content)
-    
-    # Verify the result
-    assert "etag" in result
-    
-    # Verify the object exists
-    assert minio_client.object_exists(test_bucket, object_name)
-    
-    # Clean up
-    minio_client.remove_object(test_bucket, object_name)
-
-
-def test_upload_object_bytes(minio_client, test_bucket):
-    """Test uploading a bytes object."""
+@pytest.mark.parametrize(
+    "content, kwargs",
+    [
+        ("Test content", {}),
+        (b"Test content as bytes", {}),
+        ("Test content", {"metadata": {"custom-key": "custom-value"}}),
+    ],
+    ids=["string", "bytes", "metadata"],
+)
+def test_upload_object_variants(minio_client, test_bucket, content, kwargs):
+    """Test uploading string, bytes and metadata-carrying objects."""
+    # The object is left in the shared bucket, whose teardown removes all
+    # objects in batched requests instead of one request per object
     object_name = f"{TEST_OBJECT_PREFIX}{uuid.uuid4()}"
-    content = b"Test content as bytes"
     
     # Upload the object
-    result = minio_client.upload_object(test_bucket, object_name, content)
+    result = minio_client.upload_object(test_bucket, object_name, content, **kwargs)
     
     # Verify the result
     assert "etag" in result
     
-    # Verify the object exists
-    assert minio_client.object_exists(test_bucket, object_name)
-    
-    # Clean up
-    minio_client.remove_object(test_bucket, object_name)
+    # Verify the object exists, with its metadata if any (note: MinIO adds
+    # the x-amz-meta- prefix)
+    obj_metadata = minio_client.get_object_metadata(test_bucket, object_name)
+    for key in kwargs.get("metadata", {}):
+        assert key in obj_metadata
 
 
 def test_upload_object_file(minio_client, test_bucket, test_file):
@@ -209,28 +236,41 @@ def test_upload_object_file(minio_client, test_bucket, test_file):
     minio_client.remove_object(test_bucket, object_name)
 
 
-def test_upload_object_with_metadata(minio_client, test_bucket):
-    """Test uploading an object with metadata."""
+def test_upload_file(minio_client, test_bucket):
+    """Test uploading a local file by path."""
     object_name = f"{TEST_OBJECT_PREFIX}{uuid.uuid4()}"
-    content = "Test content"
-    metadata = {"custom-key": "custom-value"}
+    content = os.urandom(64 * 1024)
     
-    # Upload the object with metadata
-    result = minio_client.upload_object(
-        test_bucket, object_name, content, metadata=metadata
-    )
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = Path(temp_dir) / "file.bin"
+        file_path.write_bytes(content)
+        
+        result = minio_client.upload_file(test_bucket, object_name, str(file_path))
     
-    # Verify the result
     assert "etag" in result
+    data, metadata = minio_client.download_object(test_bucket, object_name)
+    assert data == content
+    assert metadata["content_type"] == "application/octet-stream"
+
+
+def test_upload_object_multipart_presigned(minio_client, test_bucket):
+    """Test uploading a file in parts through presigned URLs."""
+    object_name = f"{TEST_OBJECT_PREFIX}{uuid.uuid4()}"
+    # Two parts: the minimum part size plus a short last part
+    part_size = 5 * 1024 * 1024
+    content = os.urandom(part_size + 1024)
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = Path(temp_dir) / "large-file.bin"
+        file_path.write_bytes(content)
+        
+        result = minio_client.upload_object_multipart_presigned(
+            test_bucket, object_name, str(file_path), part_size=part_size
+        )
     
-    # Get the object metadata
-    obj_metadata = minio_client.get_object_metadata(test_bucket, object_name)
-    
-    # Verify the metadata (note: MinIO adds the x-amz-meta- prefix)
-    assert "custom-key" in obj_metadata
-    
-    # Clean up
-    minio_client.remove_object(test_bucket, object_name)
+    assert "etag" in result
+    data, _ = minio_client.download_object(test_bucket, object_name)
+    assert data == content
 
 
 def test_download_object(minio_client, test_object):
@@ -241,21 +281,58 @@ def test_download_object(minio_client, test_object):
     data, metadata = minio_client.download_object(bucket_name, object_name)
     
     # Verify the content
+    assert isinstance(data, bytes)
     assert data.decode("utf-8") == original_content
     
     # Verify the metadata
     assert "content_type" in metadata
     assert "etag" in metadata
+    
+    # Opting in to zero copy returns the read buffer itself
+    data, _ = minio_client.download_object(bucket_name, object_name, zero_copy=True)
+    assert isinstance(data, bytearray)
+    assert data.decode("utf-8") == original_content
+
+
+def test_download_object_to_writer(minio_client, test_object):
+    """Test streaming an object into a file-like object."""
+    bucket_name, object_name, original_content = test_object
+    
+    # Stream the object in small chunks
+    writer = io.BytesIO()
+    data, metadata = minio_client.download_object(
+        bucket_name, object_name, writer=writer, chunk_size=4
+    )
+    
+    # Verify the content went to the writer only
+    assert data is None
+    assert writer.getvalue().decode("utf-8") == original_content
+    assert "etag" in metadata
+
+
+def test_upload_and_download_objects(minio_client, test_bucket):
+    """Test uploading and downloading many objects concurrently."""
+    items = [(f"{TEST_OBJECT_PREFIX}{uuid.uuid4()}", f"Content {i}".encode()) for i in range(5)]
+    
+    # Upload the objects
+    results = minio_client.upload_objects(test_bucket, items, max_workers=4)
+    assert len(results) == len(items)
+    assert all("etag" in result for result in results)
+    
+    # Download them back in the same order
+    downloads = minio_client.download_objects(
+        test_bucket, [name for name, _ in items], max_workers=4
+    )
+    assert [bytes(data) for data, _ in downloads] == [content for _, content in items]
 
 
 def test_list_objects(minio_client, test_bucket):
     """Test listing objects in a bucket."""
-    # Create multiple objects
-    object_names = []
-    for i in range(3):
-        object_name = f"{TEST_OBJECT_PREFIX}{uuid.uuid4()}"
-        object_names.append(object_name)
-        minio_client.upload_object(test_bucket, object_name, f"Content {i}")
+    # Create multiple objects with concurrent uploads
+    object_names = [f"{TEST_OBJECT_PREFIX}{uuid.uuid4()}" for _ in range(3)]
+    minio_client.upload_objects(
+        test_bucket, [(name, f"Content {i}") for i, name in enumerate(object_names)]
+    )
     
     # List the objects
     objects = minio_client.list_objects(test_bucket)
@@ -265,9 +342,25 @@ def test_list_objects(minio_client, test_bucket):
     for name in object_names:
         assert name in listed_names
     
-    # Clean up
-    for name in object_names:
-        minio_client.remove_object(test_bucket, name)
+    # Clean up in one batched request
+    minio_client.remove_objects(test_bucket, object_names)
+
+
+def test_iter_objects(minio_client, test_bucket):
+    """Test iterating over objects in a bucket and resuming with start_after."""
+    # Create objects with sortable names under a prefix of their own, since
+    # the bucket is shared with other tests
+    prefix = f"{TEST_OBJECT_PREFIX}{uuid.uuid4()}/"
+    object_names = [f"{prefix}{i}" for i in range(3)]
+    minio_client.upload_objects(test_bucket, [(name, "Content") for name in object_names])
+    
+    # Iterate over all objects
+    listed_names = [obj["name"] for obj in minio_client.iter_objects(test_bucket, prefix=prefix)]
+    assert listed_names == object_names
+    
+    # Resume after the first object
+    resumed = minio_client.iter_objects(test_bucket, prefix=prefix, start_after=object_names[0])
+    assert [obj["name"] for obj in resumed] == object_names[1:]
 
 
 def test_object_exists(minio_client, test_object):
@@ -341,6 +434,99 @@ def test_copy_object(minio_client, test_object):
     minio_client.remove_bucket(dest_bucket)
 
 
+def test_upload_object_creates_missing_bucket(minio_client):
+    """Test that uploading to a missing bucket creates it."""
+    bucket_name = f"{TEST_BUCKET_PREFIX}{uuid.uuid4()}"
+    object_name = f"{TEST_OBJECT_PREFIX}{uuid.uuid4()}"
+    
+    # Upload without creating the bucket first
+    minio_client.upload_object(bucket_name, object_name, "Test content")
+    
+    # Verify the bucket was created and holds the object
+    assert minio_client.bucket_exists(bucket_name)
+    data, _ = minio_client.download_object(bucket_name, object_name)
+    assert data == b"Test content"
+    
+    # Clean up
+    minio_client.remove_bucket(bucket_name, force=True)
+
+
+def test_copy_object_creates_missing_dest_bucket(minio_client, test_object):
+    """Test that copying to a missing bucket creates it."""
+    source_bucket, source_object, original_content = test_object
+    dest_bucket = f"{TEST_BUCKET_PREFIX}{uuid.uuid4()}"
+    
+    # Copy without creating the destination bucket first
+    minio_client.copy_object(source_bucket, source_object, dest_bucket)
+    
+    # Verify the bucket was created and holds the copy
+    data, _ = minio_client.download_object(dest_bucket, source_object)
+    assert data.decode("utf-8") == original_content
+    
+    # Clean up
+    minio_client.remove_bucket(dest_bucket, force=True)
+
+
+def test_copy_object_from_missing_bucket(minio_client):
+    """Test that a missing source bucket fails the copy without creating the destination."""
+    source_bucket = f"{TEST_BUCKET_PREFIX}{uuid.uuid4()}"
+    dest_bucket = f"{TEST_BUCKET_PREFIX}{uuid.uuid4()}"
+    
+    # Try to copy from a bucket that does not exist
+    with pytest.raises(S3Error):
+        minio_client.copy_object(source_bucket, "missing", dest_bucket)
+    
+    # Verify the destination was not created
+    assert not minio_client.bucket_exists(dest_bucket)
+
+
+class _BucketsClient:
+    """Stand-in for the minio SDK client that only knows which buckets exist."""
+    
+    def __init__(self, buckets):
+        self.buckets = set(buckets)
+        self.created = []
+    
+    def bucket_exists(self, bucket_name):
+        return bucket_name in self.buckets
+    
+    def make_bucket(self, bucket_name, location=None):
+        self.buckets.add(bucket_name)
+        self.created.append(bucket_name)
+    
+    def copy_object(self, bucket_name, object_name, source, **kwargs):
+        # Like a server naming the request's bucket whichever bucket is missing
+        if not {source.bucket_name, bucket_name} <= self.buckets:
+            raise S3Error(
+                None, "NoSuchBucket", "The specified bucket does not exist",
+                f"/{bucket_name}/{object_name}", None, None,
+                bucket_name=bucket_name, object_name=object_name,
+            )
+        return SimpleNamespace(etag="etag", version_id=None)
+
+
+def test_copy_object_creates_only_dest_bucket():
+    """Test which bucket a copy creates on NoSuchBucket, without a server."""
+    client = MinioCrudClient(endpoint="localhost:9000")
+    
+    # A missing destination is created and the copy retried
+    client.client = _BucketsClient({"source"})
+    assert client.copy_object("source", "object", "dest")["etag"] == "etag"
+    assert client.client.created == ["dest"]
+    
+    # A missing source fails the copy and creates nothing
+    client.client = _BucketsClient({"dest"})
+    with pytest.raises(S3Error):
+        client.copy_object("source", "object", "dest")
+    assert client.client.created == []
+    
+    # Also when both are missing
+    client.client = _BucketsClient(set())
+    with pytest.raises(S3Error):
+        client.copy_object("source", "object", "dest")
+    assert client.client.created == []
+
+
 def test_remove_object(minio_client, test_bucket):
     """Test removing an object."""
     object_name = f"{TEST_OBJECT_PREFIX}{uuid.uuid4()}"
@@ -362,12 +548,11 @@ def test_remove_object(minio_client, test_bucket):
 
 def test_remove_objects(minio_client, test_bucket):
     """Test removing multiple objects."""
-    # Create multiple objects
-    object_names = []
-    for i in range(3):
-        object_name = f"{TEST_OBJECT_PREFIX}{uuid.uuid4()}"
-        object_names.append(object_name)
-        minio_client.upload_object(test_bucket, object_name, f"Content {i}")
+    # Create multiple objects with concurrent uploads
+    object_names = [f"{TEST_OBJECT_PREFIX}{uuid.uuid4()}" for _ in range(3)]
+    minio_client.upload_objects(
+        test_bucket, [(name, f"Content {i}") for i, name in enumerate(object_names)]
+    )
     
     # Verify the objects exist
     for name in object_names:
@@ -382,6 +567,99 @@ def test_remove_objects(minio_client, test_bucket):
         assert not minio_client.object_exists(test_bucket, name)
 
 
+
+def test_remove_objects_in_batches(minio_client):
+    """Test removing more objects than one delete request holds, named by a generator."""
+    bucket_name = f"{TEST_BUCKET_PREFIX}{uuid.uuid4()}"
+    object_names = [f"{TEST_OBJECT_PREFIX}{i:05d}" for i in range(REMOVE_BATCH_SIZE + 100)]
+    minio_client.create_bucket(bucket_name)
+    minio_client.upload_objects(bucket_name, [(name, b"") for name in object_names])
+    
+    # Remove the objects, passing the names lazily
+    errors = minio_client.remove_objects(bucket_name, (name for name in object_names))
+    assert errors == []
+    
+    # Verify the bucket is empty
+    assert minio_client.list_objects(bucket_name, recursive=True) == []
+    
+    # Clean up
+    minio_client.remove_bucket(bucket_name)
+
+
+def test_remove_bucket_force(minio_client):
+    """Test that force removes a bucket together with its objects."""
+    bucket_name = f"{TEST_BUCKET_PREFIX}{uuid.uuid4()}"
+    minio_client.create_bucket(bucket_name)
+    
+    # Populate the bucket, including objects under a prefix
+    minio_client.upload_objects(
+        bucket_name, [(f"dir/{TEST_OBJECT_PREFIX}{i}", f"Content {i}") for i in range(5)]
+        + [(f"{TEST_OBJECT_PREFIX}top", "Content")]
+    )
+    
+    # A populated bucket cannot be removed without force
+    with pytest.raises(S3Error):
+        minio_client.remove_bucket(bucket_name)
+    
+    # Remove the bucket with its objects
+    assert minio_client.remove_bucket(bucket_name, force=True) is True
+    assert not minio_client.bucket_exists(bucket_name)
+
+
+class _ObjectStoreClient:
+    """Stand-in for the minio SDK client keeping one bucket's object names in memory."""
+    
+    def __init__(self, object_names):
+        self.objects = set(object_names)
+        self.batches = []
+        self.removed = False
+        self._lock = threading.Lock()
+    
+    def bucket_exists(self, bucket_name):
+        return True
+    
+    def list_objects(self, bucket_name, recursive=False):
+        return (SimpleNamespace(object_name=name) for name in sorted(self.objects))
+    
+    def remove_objects(self, bucket_name, delete_object_list):
+        names = [obj.name for obj in delete_object_list]
+        with self._lock:
+            self.batches.append(len(names))
+            self.objects.difference_update(names)
+        return iter([])
+    
+    def remove_bucket(self, bucket_name):
+        if self.objects:
+            raise S3Error(None, "BucketNotEmpty", "The bucket is not empty", None, None, None)
+        self.removed = True
+
+
+def test_remove_objects_batches_generator():
+    """Test how remove_objects batches a generator of names, without a server."""
+    client = MinioCrudClient(endpoint="localhost:9000")
+    object_names = [f"{TEST_OBJECT_PREFIX}{i}" for i in range(2 * REMOVE_BATCH_SIZE + 500)]
+    client.client = _ObjectStoreClient(object_names)
+    
+    errors = client.remove_objects("bucket", (name for name in object_names), max_workers=2)
+    
+    # Every name was deleted once, in requests of at most REMOVE_BATCH_SIZE keys
+    assert errors == []
+    assert not client.client.objects
+    assert sorted(client.client.batches) == [500, REMOVE_BATCH_SIZE, REMOVE_BATCH_SIZE]
+
+
+def test_remove_bucket_force_empties_bucket():
+    """Test that remove_bucket(force=True) deletes every object first, without a server."""
+    client = MinioCrudClient(endpoint="localhost:9000")
+    client.client = _ObjectStoreClient(
+        f"{TEST_OBJECT_PREFIX}{i}" for i in range(REMOVE_BATCH_SIZE + 1)
+    )
+    
+    assert client.remove_bucket("bucket", force=True) is True
+    assert not client.client.objects
+    assert client.client.removed
+
+
 # ===== Utility Tests =====
 
 def test_get_presigned_url(minio_client, test_object):
@@ -403,6 +681,78 @@ def test_is_connected(minio_client):
     assert minio_client.is_connected()
 
 
+@contextlib.contextmanager
+def _local_http_server(status=200):
+    """Serve empty responses with the given status on a free local port."""
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        
+        def log_message(self, *args):
+            pass
+    
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"127.0.0.1:{server.server_port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.parametrize(
+    "status, connected, falls_back",
+    [(200, True, False), (403, True, True), (404, True, True), (503, False, False)],
+)
+def test_is_connected_health_status(status, connected, falls_back):
+    """Test how is_connected reads the health probe's status, without a MinIO server."""
+    with _local_http_server(status) as endpoint:
+        client = MinioCrudClient(endpoint=endpoint)
+        listed = []
+        client.client = SimpleNamespace(list_buckets=lambda: listed.append(True))
+        
+        assert client.is_connected() is connected
+        assert bool(listed) is falls_back
+
+
+def test_warm_up_caps_at_pool_size():
+    """Test warming more connections than the pool holds, without a MinIO server."""
+    with _local_http_server() as endpoint:
+        client = MinioCrudClient(endpoint=endpoint, pool_size=4)
+        pool = client._http.connection_from_url(client._health_url)
+        
+        # Asking for more than the pool holds must not wait for free slots
+        start = time.monotonic()
+        warmed = client.warm_up(10)
+        assert time.monotonic() - start < 1
+        
+        # Only pool_size connections were opened
+        assert warmed == 4
+        assert pool.num_connections == 4
+
+
+def test_connection_pool_is_shared(minio_client):
+    """Test that the SDK and the health probe reuse one keep-alive pool."""
+    # Every call in the session goes through the same PoolManager
+    assert minio_client.client._http is minio_client._http
+
+    # The endpoint's pool, looked up through the PoolManager's public API;
+    # num_connections counts every connection it has ever opened, and
+    # earlier tests open several, so only check that serial calls add none
+    minio_client.list_buckets()
+    pool = minio_client._http.connection_from_url(minio_client._health_url)
+    opened = pool.num_connections
+    
+    # Serial requests keep reusing a pooled connection
+    for _ in range(5):
+        minio_client.list_buckets()
+    assert minio_client._http.connection_from_url(minio_client._health_url) is pool
+    assert pool.num_connections == opened
+
+
 # ===== Error Handling Tests =====
 
 def test_error_handling_non_existent_bucket(minio_client):
@@ -465,12 +815,9 @@ def test_large_file_handling(minio_client, test_bucket):
     """Test handling large files."""
     object_name = f"{TEST_OBJECT_PREFIX}{uuid.uuid4()}"
     
-    # Create a large file (5 MB)
-    size_mb = 5
-    content = b"0" * (size_mb * 1024 * 1024)
-    
-    # Upload the large file
-    result = minio_client.upload_object(test_bucket, object_name, content)
+    # Upload a large file (5 MB) through a file-like object; BytesIO shares the
+    # payload's buffer and the client sizes it by seeking
+    result = minio_client.upload_object(test_bucket, object_name, io.BytesIO(_LARGE_PAYLOAD))
     
     # Verify the result
     assert "etag" in result
@@ -479,11 +826,250 @@ def test_large_file_handling(minio_client, test_bucket):
     metadata = minio_client.get_object_metadata(test_bucket, object_name)
     
     # Verify the size
-    assert metadata["size"] == size_mb * 1024 * 1024
+    assert metadata["size"] == LARGE_PAYLOAD_SIZE
     
     # Clean up
     minio_client.remove_object(test_bucket, object_name)
 
 
+
+# ===== Async Client Tests =====
+
+class _RecordedResponse:
+    """Empty 200 response returned by _RecordingSession."""
+    
+    status = 200
+    headers = {"ETag": '"etag"'}
+    
+    async def read(self):
+        return b""
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        pass
+
+
+class _RecordingSession:
+    """Stand-in for aiohttp.ClientSession that records requests instead of sending them."""
+    
+    def __init__(self):
+        self.requests = []
+    
+    def request(self, method, url, data=None, headers=None):
+        self.requests.append((method, url, data, headers))
+        return _RecordedResponse()
+    
+    async def close(self):
+        pass
+
+
+@requires_aiohttp
+def test_async_client_signs_requests():
+    """Test that async requests are signed for the URL they are sent to, without a server."""
+    client = AsyncMinioCrudClient(
+        endpoint="localhost:9000", access_key="access", secret_key="secret", secure=False
+    )
+    session = _RecordingSession()
+    client._session = session
+    
+    # A name that needs percent-encoding, so re-quoting would break the signature
+    body = b"signed content"
+    asyncio.run(client.upload_object("bucket", "dir/name with spaces", body))
+    
+    method, url, data, headers = session.requests[0]
+    assert method == "PUT"
+    assert str(url) == "http://localhost:9000/bucket/dir/name%20with%20spaces"
+    assert data == body
+    assert headers["x-amz-content-sha256"] == sha256_hash(body)
+    
+    # Signing the request as the server receives it gives the same signature
+    unsigned = {key: value for key, value in headers.items() if key != "Authorization"}
+    date = datetime.strptime(headers["x-amz-date"], "%Y%m%dT%H%M%SZ").replace(tzinfo=timezone.utc)
+    expected = sign_v4_s3(
+        method=method,
+        url=urlsplit(str(url)),
+        region="us-east-1",
+        headers=unsigned,
+        credentials=Credentials("access", "secret"),
+        content_sha256=headers["x-amz-content-sha256"],
+        date=date,
+    )
+    assert headers["Authorization"] == expected["Authorization"]
+    assert headers["Authorization"].startswith("AWS4-HMAC-SHA256 Credential=access/")
+
+
+@requires_aiohttp
+def test_async_client_error_mapping():
+    """Test building S3Error codes from error responses, without a server."""
+    body = (
+        b"<Error><Code>NoSuchBucket</Code><Message>Missing</Message>"
+        b"<Resource>/bucket</Resource></Error>"
+    )
+    error = AsyncMinioCrudClient._error(404, body, "bucket", "object")
+    assert error.code == "NoSuchBucket"
+    
+    # HEAD responses have no body, so the code comes from the status
+    assert AsyncMinioCrudClient._error(404, b"", "bucket", "object").code == "NoSuchKey"
+    assert AsyncMinioCrudClient._error(404, b"", "bucket", None).code == "NoSuchBucket"
+    assert AsyncMinioCrudClient._error(403, b"", "bucket", "object").code == "AccessDenied"
+
+
+@requires_aiohttp
+def test_async_client_round_trip(minio_client, test_bucket):
+    """Test uploading, reading and removing an object with the async client."""
+    object_name = f"{TEST_OBJECT_PREFIX}{uuid.uuid4()}"
+    
+    async def run():
+        async with AsyncMinioCrudClient() as client:
+            result = await client.upload_object(
+                test_bucket, object_name, "Async content", metadata={"purpose": "testing"}
+            )
+            data, metadata = await client.download_object(test_bucket, object_name)
+            info = await client.get_object_metadata(test_bucket, object_name)
+            removed = await client.remove_object(test_bucket, object_name)
+            with pytest.raises(S3Error) as error:
+                await client.download_object(test_bucket, object_name)
+            return result, data, metadata, info, removed, error.value
+    
+    result, data, metadata, info, removed, error = asyncio.run(run())
+    
+    # Verify the upload and download
+    assert result["etag"]
+    assert data == b"Async content"
+    assert metadata["content_type"] == "text/plain"
+    assert metadata["purpose"] == "testing"
+    
+    # Verify the metadata matches the sync client's format
+    assert info["size"] == len(b"Async content")
+    assert info["etag"] == result["etag"]
+    assert info["purpose"] == "testing"
+    
+    # Verify the removal
+    assert removed is True
+    assert error.code == "NoSuchKey"
+    assert not minio_client.object_exists(test_bucket, object_name)
+
+
+@requires_aiohttp
+def test_async_client_download_many_keeps_order(minio_client, test_bucket):
+    """Test that download_many returns objects in the order they were requested."""
+    object_names = [f"{TEST_OBJECT_PREFIX}{uuid.uuid4()}" for _ in range(20)]
+    minio_client.upload_objects(
+        test_bucket, [(name, f"Content {i}") for i, name in enumerate(object_names)]
+    )
+    
+    # Request them in reverse with fewer slots than objects
+    requested = object_names[::-1]
+    
+    async def run():
+        async with AsyncMinioCrudClient() as client:
+            return await client.download_many(test_bucket, requested, concurrency=4)
+    
+    results = asyncio.run(run())
+    
+    # Verify each result belongs to the name at the same position
+    expected = [f"Content {object_names.index(name)}".encode() for name in requested]
+    assert [data for data, _ in results] == expected
+    
+    # Clean up
+    minio_client.remove_objects(test_bucket, object_names)
+
+
+
+# ===== Async Facade Tests =====
+
+def test_async_facade_runs_calls_on_io_pool():
+    """Test awaiting a wrapped method and exiting the facade, without a server."""
+    client = MinioCrudClient(endpoint="localhost:9000")
+    calls = []
+    
+    def list_buckets():
+        # Slow enough that closing the facade has to wait for it
+        time.sleep(0.2)
+        calls.append(threading.current_thread().name)
+        return [{"name": "bucket"}]
+    
+    client.list_buckets = list_buckets
+    
+    async def run():
+        ticks = 0
+        
+        async def tick():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+        
+        ticker = asyncio.create_task(tick())
+        async with AsyncFacade(client=client) as facade:
+            # The pool defaults to one thread per pooled connection
+            assert facade._io_pool._max_workers == client._http.connection_pool_kw["maxsize"]
+            assert inspect.iscoroutinefunction(facade.list_buckets)
+            assert await facade.list_buckets() == [{"name": "bucket"}]
+            
+            # Leave a call running while the context manager exits
+            pending = asyncio.ensure_future(facade.list_buckets())
+            await asyncio.sleep(0)
+            ticks_before_exit = ticks
+        
+        # Exiting waited for the running call without blocking the loop
+        assert pending.done()
+        assert ticks > ticks_before_exit
+        ticker.cancel()
+        
+        # The I/O pool is shut down, so no new calls are accepted
+        with pytest.raises(RuntimeError):
+            await facade.list_buckets()
+    
+    asyncio.run(run())
+    
+    # Both calls ran on the facade's own threads
+    assert len(calls) == 2
+    assert all(name.startswith("minio-io") for name in calls)
+
+
+def test_async_facade_wraps_only_async_methods():
+    """Test that methods outside ASYNC_METHODS are not exposed, without a server."""
+    facade = AsyncFacade(client=MinioCrudClient(endpoint="localhost:9000"), max_workers=1)
+    
+    # Lazy generators and client internals stay on the client itself
+    for name in ("iter_objects", "warm_up", "_ensure_bucket_then"):
+        with pytest.raises(AttributeError):
+            getattr(facade, name)
+    
+    # Wrapped methods keep the client method's name and are cached
+    assert facade.bucket_exists.__name__ == "bucket_exists"
+    assert facade.bucket_exists is facade.bucket_exists
+    
+    facade.close()
+
+
+def test_async_facade_round_trip(minio_client, test_bucket):
+    """Test concurrent uploads and downloads through the facade."""
+    object_names = [f"{TEST_OBJECT_PREFIX}{uuid.uuid4()}" for _ in range(5)]
+    
+    async def run():
+        async with AsyncFacade(client=minio_client) as facade:
+            await asyncio.gather(*(
+                facade.upload_object(test_bucket, name, f"Content {i}")
+                for i, name in enumerate(object_names)
+            ))
+            return await asyncio.gather(*(
+                facade.download_object(test_bucket, name) for name in object_names
+            ))
+    
+    results = asyncio.run(run())
+    
+    # Verify each download matches its upload
+    assert [data for data, _ in results] == [
+        f"Content {i}".encode() for i in range(len(object_names))
+    ]
+    
+    # Clean up
+    minio_client.remove_objects(test_bucket, object_names)
+
+
 if __name__ == "__main__":
     pytest.main(["-xvs", __file__])
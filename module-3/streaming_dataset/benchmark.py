@@ -8,15 +8,15 @@ This script benchmarks the performance of standard dataset loading vs. Streaming
 import os
 import sys
 import time
-import numpy as np
 import pandas as pd
 import argparse
-import matplotlib.pyplot as plt
 from tabulate import tabulate
 import psutil
 import torch
 from torch.utils.data import Dataset, DataLoader
 import platform
+import threading
+import numbers
 
 # Import streaming library
 try:
@@ -26,6 +26,163 @@ except ImportError:
     print("Please install it with: pip install mosaicml-streaming")
     sys.exit(1)
 
+# PyArrow is optional; without it the pandas readers are used
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+# Polars is optional; its multithreaded CSV parser is used when available
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+# Block size for the multithreaded PyArrow CSV reader
+CSV_BLOCK_SIZE = 16 * 1024 * 1024
+
+def read_arrow_table(data_path):
+    """
+    Read a CSV or Parquet file into an Arrow table.
+    
+    CSV files are parsed by Polars when it is installed and otherwise by
+    PyArrow over a memory map; Parquet files are memory-mapped.
+    
+    Args:
+        data_path (str): Path to the dataset file
+        
+    Returns:
+        pyarrow.Table: Loaded table, or None if PyArrow is not installed, the
+        format is not CSV or Parquet, or PyArrow cannot read the file
+    """
+    if pa is None:
+        return None
+    
+    try:
+        if data_path.endswith('.parquet'):
+            return pq.read_table(data_path, memory_map=True)
+        if data_path.endswith('.csv'):
+            if pl is not None:
+                # Polars leaves timestamps as strings, like pandas.read_csv
+                try:
+                    return pl.read_csv(data_path).to_arrow()
+                except pl.exceptions.PolarsError as e:
+                    print(f"Polars could not read {data_path} ({e}), trying PyArrow")
+            with pa.memory_map(data_path) as source:
+                table = pa_csv.read_csv(
+                    source,
+                    read_options=pa_csv.ReadOptions(use_threads=True, block_size=CSV_BLOCK_SIZE)
+                )
+            # pandas.read_csv leaves timestamps as strings, so do the same
+            for i, field in enumerate(table.schema):
+                if pa.types.is_timestamp(field.type):
+                    table = table.set_column(i, field.name, table.column(i).cast(pa.string()))
+            return table
+    except (OSError, pa.ArrowInvalid) as e:
+        print(f"PyArrow could not read {data_path} ({e}), falling back to pandas")
+    
+    return None
+
+
+class PeakRSSMonitor:
+    """Track the peak resident memory of this process from a background thread."""
+    
+    def __init__(self, interval=0.05):
+        """
+        Initialize the monitor.
+        
+        Args:
+            interval (float): Seconds between samples
+        """
+        self.interval = interval
+        self.process = psutil.Process(os.getpid())
+        self.baseline = self.peak = self.process.memory_info().rss
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+    
+    def _sample(self):
+        """Record the resident memory until the monitor is stopped."""
+        while not self._stopped.wait(self.interval):
+            self.peak = max(self.peak, self.process.memory_info().rss)
+    
+    def start(self):
+        """Start sampling and return the monitor."""
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        """
+        Stop sampling.
+        
+        Returns:
+            float: Peak resident memory above the baseline at creation, in MB
+        """
+        self._stopped.set()
+        self._thread.join()
+        self.peak = max(self.peak, self.process.memory_info().rss)
+        return (self.peak - self.baseline) / (1024 * 1024)
+
+class CUDAPrefetcher:
+    """
+    Copy DataLoader batches to the GPU one batch ahead of the consumer.
+    
+    The copies are issued on a separate CUDA stream, so the transfer of the
+    next batch overlaps with the work done on the current one.
+    """
+    
+    def __init__(self, dataloader, device='cuda'):
+        """
+        Initialize the prefetcher.
+        
+        Args:
+            dataloader (DataLoader): DataLoader to read batches from
+            device (str): Device to copy the batches to
+        """
+        self.dataloader = dataloader
+        self.device = device
+        self.stream = torch.cuda.Stream()
+    
+    def __iter__(self):
+        # Create the DataLoader iterator now so its workers start right away
+        return self._prefetch(iter(self.dataloader))
+    
+    def _prefetch(self, batches):
+        """Yield GPU batches while the next one is being copied."""
+        ahead = None
+        for batch in batches:
+            current, ahead = ahead, self._copy(batch)
+            if current is not None:
+                yield self._wait(current)
+        if ahead is not None:
+            yield self._wait(ahead)
+    
+    def _copy(self, batch):
+        """Start copying the tensors of a batch on the copy stream."""
+        if not isinstance(batch, dict):
+            # Uncollated samples have no tensors to copy
+            return batch
+        with torch.cuda.stream(self.stream):
+            # Only copies from pinned memory are asynchronous
+            return {
+                k: (v if v.is_pinned() else v.pin_memory()).to(self.device, non_blocking=True)
+                if torch.is_tensor(v) else v
+                for k, v in batch.items()
+            }
+    
+    def _wait(self, batch):
+        """Make the current stream wait for the copy of a batch."""
+        if not isinstance(batch, dict):
+            return batch
+        current_stream = torch.cuda.current_stream()
+        current_stream.wait_stream(self.stream)
+        for v in batch.values():
+            if torch.is_tensor(v):
+                # Keep the memory from being reused while the current stream uses it
+                v.record_stream(current_stream)
+        return batch
+
 class StandardDataset(Dataset):
     """Standard PyTorch dataset for loading data from disk."""
     
@@ -36,18 +193,33 @@ class StandardDataset(Dataset):
         Args:
             data_path (str): Path to the dataset file
         """
+        # Keep one NumPy array per column so samples are read by indexing
+        # instead of building a pandas Series per row
+        table = read_arrow_table(data_path)
+        if table is not None:
+            self.keys = table.column_names
+            self.cols = {
+                name: table.column(name).to_numpy(zero_copy_only=False) for name in self.keys
+            }
+            self.num_samples = table.num_rows
+            return
+        
         if data_path.endswith('.csv'):
-            self.df = pd.read_csv(data_path)
+            df = pd.read_csv(data_path)
         elif data_path.endswith('.parquet'):
-            self.df = pd.read_parquet(data_path)
+            df = pd.read_parquet(data_path)
         elif data_path.endswith('.json'):
-            self.df = pd.read_json(data_path, lines=True)
+            df = pd.read_json(data_path, lines=True)
         else:
             raise ValueError(f"Unsupported file format: {data_path}")
+        
+        self.keys = list(df.columns)
+        self.cols = {col: df[col].to_numpy() for col in self.keys}
+        self.num_samples = len(df)
     
     def __len__(self):
         """Return the number of samples in the dataset."""
-        return len(self.df)
+        return self.num_samples
     
     def __getitem__(self, idx):
         """
@@ -59,10 +231,10 @@ class StandardDataset(Dataset):
         Returns:
             dict: Sample as a dictionary
         """
-        return self.df.iloc[idx].to_dict()
+        return {key: self.cols[key][idx] for key in self.keys}
 
-def parse_args():
-    """Parse command line arguments."""
+def parse_args(argv=None):
+    """Parse command line arguments, or argv if given."""
     parser = argparse.ArgumentParser(description='Benchmark StreamingDataset vs. standard loading')
     parser.add_argument('--standard-path', type=str, default='data/raw/dataset.csv',
                         help='Path to the standard dataset file (default: data/raw/dataset.csv)')
@@ -72,13 +244,121 @@ def parse_args():
                         help='Batch size for data loading (default: 32)')
     parser.add_argument('--num-workers', type=int, default=4,
                         help='Number of workers for data loading (default: 4)')
+    parser.add_argument('--prefetch-factor', type=int, default=4,
+                        help='Batches prefetched by each worker (default: 4)')
+    parser.add_argument('--pin-memory', action='store_true',
+                        help='Pin batches in page-locked memory for faster GPU copies (CUDA only)')
     parser.add_argument('--iterations', type=int, default=10,
-                        help='Number of iterations for benchmarking (default: 10)')
+                        help='Number of batches to load for benchmarking (default: 10)')
     parser.add_argument('--output-dir', type=str, default='.',
                         help='Output directory for benchmark results (default: .)')
-    return parser.parse_args()
+    parser.add_argument('--no-collate', action='store_true',
+                        help='Hand standard-loading batches over as lists of samples instead of collated tensors')
+    parser.add_argument('--no-plot', action='store_true',
+                        help='Skip plotting the results (avoids importing matplotlib)')
+    return parser.parse_args(argv)
 
-def benchmark_standard_loading(data_path, batch_size, num_workers, iterations):
+def dataloader_options(num_workers, pin_memory=False, prefetch_factor=4):
+    """
+    Build the DataLoader keyword arguments shared by both benchmarks.
+    
+    Args:
+        num_workers (int): Number of workers for data loading
+        pin_memory (bool): Whether to pin batches in page-locked memory
+        prefetch_factor (int): Number of batches prefetched by each worker
+        
+    Returns:
+        dict: DataLoader keyword arguments
+    """
+    options = {
+        'num_workers': num_workers,
+        # Pinned memory only helps host-to-GPU copies
+        'pin_memory': pin_memory and torch.cuda.is_available(),
+    }
+    if num_workers > 0:
+        # Keep the worker processes alive between passes over the dataset
+        options['persistent_workers'] = True
+        options['prefetch_factor'] = prefetch_factor
+    return options
+
+def identity_collate(samples):
+    """
+    Return the samples of a batch as they are, without collating them.
+    
+    Args:
+        samples (list): Samples from the dataset
+        
+    Returns:
+        list: The same samples
+    """
+    return samples
+
+def consume_batch(batch):
+    """
+    Reduce every numeric value in a batch, as a training step would read it.
+    
+    Args:
+        batch (dict or list): Collated batch from the DataLoader, or the list
+            of samples when collation is disabled
+        
+    Returns:
+        float: Sum over all numeric values in the batch
+    """
+    if isinstance(batch, list):
+        # Uncollated samples are read one at a time
+        return sum(
+            float(v) for sample in batch for v in sample.values()
+            if isinstance(v, numbers.Number)
+        )
+    # .item() waits for the data, so the work cannot be skipped or deferred
+    return sum(v.sum().item() for v in batch.values() if torch.is_tensor(v))
+
+def time_batches(dataloader, iterations):
+    """
+    Time loading a fixed number of batches in a single pass.
+    
+    Args:
+        dataloader (DataLoader): DataLoader to read from
+        iterations (int): Number of batches to load
+        
+    Returns:
+        float: Total time in seconds
+    """
+    # Copy batches to the GPU ahead of use when there is one
+    if torch.cuda.is_available():
+        dataloader = CUDAPrefetcher(dataloader)
+    
+    # Start the workers outside the timed region
+    batches = iter(dataloader)
+    if torch.cuda.is_available():
+        torch.cuda.synchronize()
+    
+    # Iteration times are printed after the timed loop, not inside it
+    lines = []
+    start_time = time.perf_counter_ns()
+    for i in range(iterations):
+        batch_start = time.perf_counter_ns()
+        try:
+            batch = next(batches)
+        except StopIteration:
+            # Start another pass if the dataset has fewer batches than requested
+            batches = iter(dataloader)
+            batch = next(batches)
+        
+        # Process the batch
+        consume_batch(batch)
+        batch_end = time.perf_counter_ns()
+        lines.append(f"  Iteration {i+1}/{iterations}: {(batch_end - batch_start) / 1e9:.4f} seconds")
+    
+    if torch.cuda.is_available():
+        torch.cuda.synchronize()
+    total_time = (time.perf_counter_ns() - start_time) / 1e9
+    
+    sys.stdout.write('\n'.join(lines) + '\n')
+    return total_time
+
+def benchmark_standard_loading(data_path, batch_size, num_workers, iterations,
+                               pin_memory=False, prefetch_factor=4, collate=True):
     """
     Benchmark standard dataset loading.
     
@@ -86,20 +366,28 @@ def benchmark_standard_loading(data_path, batch_size, num_workers, iterations):
         data_path (str): Path to the dataset file
         batch_size (int): Batch size for data loading
         num_workers (int): Number of workers for data loading
-        iterations (int): Number of iterations for benchmarking
+        iterations (int): Number of batches to load for benchmarking
+        pin_memory (bool): Whether to pin batches in page-locked memory
+        prefetch_factor (int): Number of batches prefetched by each worker
+        collate (bool): Whether to collate samples into batched tensors; if
+            False, batches are plain lists of samples
         
     Returns:
         dict: Benchmark results
     """
     print(f"Benchmarking standard dataset loading from {data_path}...")
     
+    # Sample memory from before the dataset is read to catch loading spikes
+    monitor = PeakRSSMonitor().start()
+    
     # Create dataset and dataloader
     dataset = StandardDataset(data_path)
     dataloader = DataLoader(
         dataset,
         batch_size=batch_size,
         shuffle=True,
-        num_workers=num_workers
+        collate_fn=None if collate else identity_collate,
+        **dataloader_options(num_workers, pin_memory, prefetch_factor)
     )
     
     # Measure memory usage before loading
@@ -107,44 +395,37 @@ def benchmark_standard_loading(data_path, batch_size, num_workers, iterations):
     memory_before = process.memory_info().rss / (1024 * 1024)  # MB
     
     # Benchmark loading time
-    start_time = time.time()
-    
-    # Iterate through the dataloader for the specified number of iterations
-    for i in range(iterations):
-        batch_start = time.time()
-        for batch_idx, batch in enumerate(dataloader):
-            # Process the batch (just access a few items to ensure it's loaded)
-            _ = list(batch.keys())
-            if batch_idx >= iterations:
-                break
-        batch_end = time.time()
-        print(f"  Iteration {i+1}/{iterations}: {batch_end - batch_start:.4f} seconds")
-    
-    end_time = time.time()
+    total_time = time_batches(dataloader, iterations)
     
     # Measure memory usage after loading
     memory_after = process.memory_info().rss / (1024 * 1024)  # MB
+    peak_memory = monitor.stop()
     
     # Calculate results
-    total_time = end_time - start_time
     avg_time_per_iteration = total_time / iterations
+    samples_per_sec = iterations * batch_size / total_time
     memory_usage = memory_after - memory_before
     
     results = {
         'method': 'Standard Loading',
         'total_time': total_time,
         'avg_time_per_iteration': avg_time_per_iteration,
+        'samples_per_sec': samples_per_sec,
         'memory_usage': memory_usage,
+        'peak_memory_mb': peak_memory,
         'dataset_size': len(dataset)
     }
     
     print(f"  Total time: {total_time:.4f} seconds")
     print(f"  Average time per iteration: {avg_time_per_iteration:.4f} seconds")
+    print(f"  Throughput: {samples_per_sec:.1f} samples/s")
     print(f"  Memory usage: {memory_usage:.2f} MB")
+    print(f"  Peak memory: {peak_memory:.2f} MB")
     
     return results
 
-def benchmark_streaming_loading(data_path, batch_size, num_workers, iterations):
+def benchmark_streaming_loading(data_path, batch_size, num_workers, iterations,
+                                pin_memory=False, prefetch_factor=4):
     """
     Benchmark StreamingDataset loading.
     
@@ -152,13 +433,18 @@ def benchmark_streaming_loading(data_path, batch_size, num_workers, iterations):
         data_path (str): Path to the StreamingDataset directory
         batch_size (int): Batch size for data loading
         num_workers (int): Number of workers for data loading
-        iterations (int): Number of iterations for benchmarking
+        iterations (int): Number of batches to load for benchmarking
+        pin_memory (bool): Whether to pin batches in page-locked memory
+        prefetch_factor (int): Number of batches prefetched by each worker
         
     Returns:
         dict: Benchmark results
     """
     print(f"Benchmarking StreamingDataset loading from {data_path}...")
     
+    # Sample memory from before the dataset is opened to catch loading spikes
+    monitor = PeakRSSMonitor().start()
+    
     # Create StreamingDataset and dataloader
     dataset = StreamingDataset(
         local=data_path,  # Local path for caching
@@ -169,8 +455,8 @@ def benchmark_streaming_loading(data_path, batch_size, num_workers, iterations):
     
     dataloader = DataLoader(
         dataset,
-        batch_size=None,  # Batch size is handled by StreamingDataset
-        num_workers=num_workers
+        batch_size=batch_size,  # Must match the StreamingDataset batch size
+        **dataloader_options(num_workers, pin_memory, prefetch_factor)
     )
     
     # Measure memory usage before loading
@@ -178,40 +464,32 @@ def benchmark_streaming_loading(data_path, batch_size, num_workers, iterations):
     memory_before = process.memory_info().rss / (1024 * 1024)  # MB
     
     # Benchmark loading time
-    start_time = time.time()
-    
-    # Iterate through the dataloader for the specified number of iterations
-    for i in range(iterations):
-        batch_start = time.time()
-        for batch_idx, batch in enumerate(dataloader):
-            # Process the batch (just access a few items to ensure it's loaded)
-            _ = list(batch.keys())
-            if batch_idx >= iterations:
-                break
-        batch_end = time.time()
-        print(f"  Iteration {i+1}/{iterations}: {batch_end - batch_start:.4f} seconds")
-    
-    end_time = time.time()
+    total_time = time_batches(dataloader, iterations)
     
     # Measure memory usage after loading
     memory_after = process.memory_info().rss / (1024 * 1024)  # MB
+    peak_memory = monitor.stop()
     
     # Calculate results
-    total_time = end_time - start_time
     avg_time_per_iteration = total_time / iterations
+    samples_per_sec = iterations * batch_size / total_time
     memory_usage = memory_after - memory_before
     
     results = {
         'method': 'StreamingDataset',
         'total_time': total_time,
         'avg_time_per_iteration': avg_time_per_iteration,
+        'samples_per_sec': samples_per_sec,
         'memory_usage': memory_usage,
+        'peak_memory_mb': peak_memory,
         'dataset_size': len(dataset)
     }
     
     print(f"  Total time: {total_time:.4f} seconds")
     print(f"  Average time per iteration: {avg_time_per_iteration:.4f} seconds")
+    print(f"  Throughput: {samples_per_sec:.1f} samples/s")
     print(f"  Memory usage: {memory_usage:.2f} MB")
+    print(f"  Peak memory: {peak_memory:.2f} MB")
     
     return results
 
@@ -223,6 +501,12 @@ def plot_results(results, output_dir):
         results (list): List of benchmark results
         output_dir (str): Output directory for the plot
     """
+    # Imported here so runs without a plot skip matplotlib's startup cost;
+    # the Agg backend renders straight to PNG without probing GUI backends
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    
     # Extract data for plotting
     methods = [r['method'] for r in results]
     times = [r['avg_time_per_iteration'] for r in results]
@@ -274,7 +558,9 @@ def save_results(results, output_dir):
             r['method'],
             f"{r['total_time']:.4f}",
             f"{r['avg_time_per_iteration']:.4f}",
+            f"{r['samples_per_sec']:.1f}",
             f"{r['memory_usage']:.2f}",
+            f"{r['peak_memory_mb']:.2f}",
             r['dataset_size']
         ])
     
@@ -305,7 +591,7 @@ def save_results(results, output_dir):
         f.write("## Results\n")
         f.write(tabulate(
             table_data,
-            headers=['Method', 'Total Time (s)', 'Avg Time/Iteration (s)', 'Memory Usage (MB)', 'Dataset Size'],
+            headers=['Method', 'Total Time (s)', 'Avg Time/Iteration (s)', 'Samples/s', 'Memory Usage (MB)', 'Peak Memory (MB)', 'Dataset Size'],
             tablefmt='grid'
         ))
         f.write("\n\n")
@@ -318,9 +604,9 @@ def save_results(results, output_dir):
     
     print(f"Benchmark results saved to {results_path}")
 
-def main():
+def main(argv=None):
     """Main function to run the benchmark."""
-    args = parse_args()
+    args = parse_args(argv)
     
     print("=" * 50)
     print("STREAMINGDATASET VS. STANDARD LOADING BENCHMARK")
@@ -331,7 +617,10 @@ def main():
         args.standard_path,
         args.batch_size,
         args.num_workers,
-        args.iterations
+        args.iterations,
+        pin_memory=args.pin_memory,
+        prefetch_factor=args.prefetch_factor,
+        collate=not args.no_collate
     )
     
     print("\n" + "-" * 50 + "\n")
@@ -340,14 +629,17 @@ def main():
         args.streaming_path,
         args.batch_size,
         args.num_workers,
-        args.iterations
+        args.iterations,
+        pin_memory=args.pin_memory,
+        prefetch_factor=args.prefetch_factor
     )
     
     # Combine results
     results = [standard_results, streaming_results]
     
     # Plot results
-    plot_results(results, args.output_dir)
+    if not args.no_plot:
+        plot_results(results, args.output_dir)
     
     # Save results
     save_results(results, args.output_dir)
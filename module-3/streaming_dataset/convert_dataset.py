@@ -11,34 +11,147 @@ import numpy as np
 import pandas as pd
 import argparse
 from tqdm import tqdm
-import uuid
 import json
-from datetime import datetime
 import time
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
 
 # Import streaming library for MDS format
 try:
     from streaming import MDSWriter
+    from streaming.base.util import merge_index
 except ImportError:
     print("Error: MosaicML streaming library not found.")
     print("Please install it with: pip install mosaicml-streaming")
     sys.exit(1)
 
-def parse_args():
-    """Parse command line arguments."""
+# PyArrow is optional; without it the pandas readers are used
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+# Polars is optional; its multithreaded CSV parser is used when available
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+# Block size for the multithreaded PyArrow CSV reader
+CSV_BLOCK_SIZE = 16 * 1024 * 1024
+
+# Number of batches read ahead of the writer when streaming the input
+PREFETCH_DEPTH = 2
+
+# Column type for each NumPy dtype kind; any other kind is stored as a string
+COLUMN_KINDS = {
+    'i': 'int',
+    'u': 'int',
+    'f': 'float',
+    'b': 'bool',
+    'M': 'datetime',
+}
+
+# MDSWriter encoding for each column type; floats use float32 encoding,
+# booleans are stored as one-byte integers (0 or 1) instead of the eight
+# bytes of 'int', and datetimes as strings
+MDS_ENCODINGS = {
+    'int': 'int',
+    'float': 'float32',
+    'bool': 'uint8',
+    'datetime': 'str',
+    'str': 'str',
+}
+
+# MDSWriter encoding of float columns for each --float-dtype; MDS has no
+# bfloat16 type, so bfloat16 values are stored as their raw 16-bit patterns
+FLOAT_ENCODINGS = {
+    'float32': 'float32',
+    'float16': 'float16',
+    'bfloat16': 'uint16',
+}
+
+def parse_args(argv=None):
+    """Parse command line arguments, or argv if given."""
     parser = argparse.ArgumentParser(description='Convert dataset to StreamingDataset format')
     parser.add_argument('--input-path', type=str, default='data/raw/dataset.csv',
                         help='Path to the input dataset (default: data/raw/dataset.csv)')
     parser.add_argument('--output-dir', type=str, default='data/streaming',
                         help='Output directory for the StreamingDataset (default: data/streaming)')
     parser.add_argument('--compression', type=str, default='zstd',
-                        choices=['zstd', 'lz4', 'none'],
-                        help='Compression algorithm to use (default: zstd)')
+                        help='Compression algorithm to use: zstd, lz4 or none, optionally '
+                             'with a level such as zstd:1 (default: zstd)')
     parser.add_argument('--hashes', type=int, default=10,
                         help='Number of hashes for sharding (default: 10)')
     parser.add_argument('--size-limit', type=int, default=1024*1024*16,
                         help='Size limit for each shard in bytes (default: 16MB)')
-    return parser.parse_args()
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Number of processes writing shards in parallel (default: 1)')
+    parser.add_argument('--float-dtype', type=str, default='float32',
+                        choices=list(FLOAT_ENCODINGS),
+                        help='Precision of float columns in the shards (default: float32)')
+    parser.add_argument('--chunk-size', type=int, default=65536,
+                        help='Rows read from the input at a time; 0 loads the whole file (default: 65536)')
+    return parser.parse_args(argv)
+
+def timestamps_to_strings(table):
+    """
+    Cast the timestamp columns of an Arrow table to strings.
+    
+    pandas.read_csv leaves timestamps as strings, so the Arrow readers do
+    the same.
+    
+    Args:
+        table (pyarrow.Table): Table read from a CSV file
+        
+    Returns:
+        pyarrow.Table: Table without timestamp columns
+    """
+    for i, field in enumerate(table.schema):
+        if pa.types.is_timestamp(field.type):
+            table = table.set_column(i, field.name, table.column(i).cast(pa.string()))
+    return table
+
+def read_arrow_table(data_path):
+    """
+    Read a CSV or Parquet file into an Arrow table.
+    
+    CSV files are parsed by Polars when it is installed and otherwise by
+    PyArrow over a memory map; Parquet files are memory-mapped.
+    
+    Args:
+        data_path (str): Path to the dataset file
+        
+    Returns:
+        pyarrow.Table: Loaded table, or None if PyArrow is not installed, the
+        format is not CSV or Parquet, or PyArrow cannot read the file
+    """
+    if pa is None:
+        return None
+    
+    try:
+        if data_path.endswith('.parquet'):
+            return pq.read_table(data_path, memory_map=True)
+        if data_path.endswith('.csv'):
+            if pl is not None:
+                # Polars leaves timestamps as strings, like pandas.read_csv
+                try:
+                    return pl.read_csv(data_path).to_arrow()
+                except pl.exceptions.PolarsError as e:
+                    print(f"Polars could not read {data_path} ({e}), trying PyArrow")
+            with pa.memory_map(data_path) as source:
+                table = pa_csv.read_csv(
+                    source,
+                    read_options=pa_csv.ReadOptions(use_threads=True, block_size=CSV_BLOCK_SIZE)
+                )
+            return timestamps_to_strings(table)
+    except (OSError, pa.ArrowInvalid) as e:
+        print(f"PyArrow could not read {data_path} ({e}), falling back to pandas")
+    
+    return None
 
 def load_dataset(input_path):
     """
@@ -52,7 +165,10 @@ def load_dataset(input_path):
     """
     print(f"Loading dataset from {input_path}...")
     
-    if input_path.endswith('.csv'):
+    table = read_arrow_table(input_path)
+    if table is not None:
+        df = table.to_pandas()
+    elif input_path.endswith('.csv'):
         df = pd.read_csv(input_path)
     elif input_path.endswith('.parquet'):
         df = pd.read_parquet(input_path)
@@ -64,6 +180,131 @@ def load_dataset(input_path):
     print(f"Dataset loaded with shape: {df.shape}")
     return df
 
+def iter_csv_chunks(input_path, chunk_size):
+    """
+    Read a CSV file in batches of rows with PyArrow's streaming reader.
+    
+    The reader parses the file a block at a time, with the column types
+    inferred from the first block; its record batches are regrouped into
+    batches of chunk_size rows.
+    
+    Args:
+        input_path (str): Path to the CSV file
+        chunk_size (int): Number of rows per batch
+        
+    Yields:
+        pandas.DataFrame: Next batch of rows
+    """
+    reader = pa_csv.open_csv(
+        input_path,
+        read_options=pa_csv.ReadOptions(use_threads=True, block_size=CSV_BLOCK_SIZE)
+    )
+    pending, rows = [], 0
+    try:
+        for batch in reader:
+            pending.append(batch)
+            rows += batch.num_rows
+            while rows >= chunk_size:
+                table = pa.Table.from_batches(pending)
+                yield timestamps_to_strings(table.slice(0, chunk_size)).to_pandas()
+                rest = table.slice(chunk_size)
+                pending, rows = rest.to_batches(), rest.num_rows
+    except pa.ArrowInvalid as e:
+        # A later block does not match the types inferred from the first one
+        raise ValueError(
+            f"Could not read {input_path} in chunks ({e}); "
+            f"convert with --chunk-size 0 to infer the types from the whole file"
+        ) from e
+    if rows:
+        table = pa.Table.from_batches(pending, schema=reader.schema)
+        yield timestamps_to_strings(table).to_pandas()
+
+def iter_chunks(input_path, chunk_size):
+    """
+    Read the dataset from disk in batches of rows.
+    
+    When PyArrow is installed, Parquet files are read one record batch at a
+    time and CSV files with its multithreaded streaming reader; otherwise,
+    and for JSON lines files, the pandas chunked readers are used.
+    
+    Args:
+        input_path (str): Path to the input dataset
+        chunk_size (int): Number of rows per batch
+        
+    Yields:
+        pandas.DataFrame: Next batch of rows
+    """
+    if input_path.endswith('.parquet'):
+        if pa is not None:
+            parquet_file = pq.ParquetFile(input_path, memory_map=True)
+            for batch in parquet_file.iter_batches(batch_size=chunk_size):
+                yield batch.to_pandas()
+            return
+        # Without PyArrow the file can only be read as a whole
+        df = pd.read_parquet(input_path)
+        for start in range(0, len(df), chunk_size):
+            yield df.iloc[start:start + chunk_size]
+    elif input_path.endswith('.csv'):
+        if pa is not None:
+            yield from iter_csv_chunks(input_path, chunk_size)
+            return
+        with pd.read_csv(input_path, chunksize=chunk_size) as reader:
+            yield from reader
+    elif input_path.endswith('.json'):
+        with pd.read_json(input_path, lines=True, chunksize=chunk_size) as reader:
+            yield from reader
+    else:
+        raise ValueError(f"Unsupported file format: {input_path}")
+
+def prefetch(iterable, depth=PREFETCH_DEPTH):
+    """
+    Produce the items of an iterable on a background thread.
+    
+    The next items are read while the caller processes the current one;
+    exceptions raised by the iterable are re-raised in the caller.
+    
+    Args:
+        iterable: Items to produce
+        depth (int): Maximum number of items read ahead
+        
+    Yields:
+        Items of the iterable, in order
+    """
+    items = queue.Queue(maxsize=depth)
+    done = object()
+    stop = threading.Event()
+    
+    def produce():
+        try:
+            for item in iterable:
+                # Time out regularly so an abandoned consumer does not block
+                # this thread forever
+                while not stop.is_set():
+                    try:
+                        items.put(item, timeout=0.1)
+                        break
+                    except queue.Full:
+                        pass
+                if stop.is_set():
+                    return
+            items.put(done)
+        except BaseException as e:
+            items.put(e)
+    
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = items.get()
+            if item is done:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
 def get_column_types(df):
     """
     Determine the column types for the dataset.
@@ -74,32 +315,168 @@ def get_column_types(df):
     Returns:
         dict: Dictionary mapping column names to their types
     """
-    column_types = {}
+    return {col: COLUMN_KINDS.get(dtype.kind, 'str') for col, dtype in df.dtypes.items()}
+
+def datetime_values(series):
+    """
+    Convert a datetime column to ISO format strings, keeping NaT as None.
+    
+    Args:
+        series (pandas.Series): Datetime column
+        
+    Returns:
+        list: Column values
+    """
+    fmt = '%Y-%m-%dT%H:%M:%S'
+    if (series.dt.microsecond > 0).any():
+        fmt += '.%f'
+    return series.dt.strftime(fmt).to_numpy(dtype=object, na_value=None).tolist()
+
+def bool_values(series):
+    """
+    Convert a boolean column to integers (0 or 1), missing values to 0.
+    
+    Args:
+        series (pandas.Series): Boolean column
+        
+    Returns:
+        list: Column values
+    """
+    return series.fillna(False).astype(np.uint8).to_numpy().tolist()
+
+def plain_values(series):
+    """
+    Return the values of a column that needs no conversion.
+    
+    Args:
+        series (pandas.Series): Column
+        
+    Returns:
+        list: Column values
+    """
+    return series.to_numpy().tolist()
+
+def bfloat16_values(series):
+    """
+    Convert a float column to bfloat16 bit patterns.
+    
+    The values can be restored with
+    ``torch.from_numpy(np.asarray(bits, dtype=np.uint16)).view(torch.bfloat16)``.
+    
+    Args:
+        series (pandas.Series): Float column
+        
+    Returns:
+        list: Column values as 16-bit unsigned integers
+    """
+    bits = series.to_numpy(dtype=np.float32).view(np.uint32)
+    # Round to nearest even before dropping the low 16 bits of the mantissa
+    bits = bits + np.uint32(0x7FFF) + ((bits >> 16) & np.uint32(1))
+    return (bits >> 16).astype(np.uint16).tolist()
+
+# Converts a whole column at a time for each column type that needs it
+VALUE_CONVERTERS = {
+    'datetime': datetime_values,
+    'bool': bool_values,
+}
+
+def column_encodings(column_types, float_dtype='float32'):
+    """
+    Map each column to its MDSWriter encoding.
+    
+    Args:
+        column_types (dict): Column name to column type
+        float_dtype (str): Precision of float columns (float32, float16 or bfloat16)
+        
+    Returns:
+        dict: Column name to MDSWriter encoding
+    """
+    encodings = {**MDS_ENCODINGS, 'float': FLOAT_ENCODINGS[float_dtype]}
+    return {col: encodings[col_type] for col, col_type in column_types.items()}
+
+def column_values(df, column_types, float_dtype='float32'):
+    """
+    Extract each column once as a list of values ready for MDSWriter.
     
-    for col in df.columns:
-        if pd.api.types.is_integer_dtype(df[col]):
-            column_types[col] = 'int'
-        elif pd.api.types.is_float_dtype(df[col]):
-            column_types[col] = 'float'
-        elif pd.api.types.is_bool_dtype(df[col]):
-            column_types[col] = 'bool'
-        elif pd.api.types.is_datetime64_any_dtype(df[col]):
-            column_types[col] = 'datetime'
-        else:
-            column_types[col] = 'str'
+    Args:
+        df (pandas.DataFrame): Dataset
+        column_types (dict): Column name to column type
+        float_dtype (str): Precision of float columns (float32, float16 or bfloat16)
+        
+    Returns:
+        dict: Column name to list of values
+    """
+    # Python scalars are needed (MDS encodings reject NumPy scalars), and
+    # converting whole columns avoids boxing every row into a Series
+    converters = VALUE_CONVERTERS
+    if float_dtype == 'bfloat16':
+        converters = {**VALUE_CONVERTERS, 'float': bfloat16_values}
+    return {
+        col: converters.get(col_type, plain_values)(df[col])
+        for col, col_type in column_types.items()
+    }
+
+def write_rows(out, values, progress=True):
+    """
+    Write column arrays to an open MDSWriter, one sample per row.
     
-    return column_types
+    Args:
+        out (MDSWriter): Writer to write the samples to
+        values (dict): Column name to list of values, all of the same length
+        progress (bool): Whether to show a progress bar
+        
+    Returns:
+        int: Number of samples written
+    """
+    names = list(values)
+    num_samples = len(values[names[0]]) if names else 0
+    
+    # MDSWriter encodes each sample as soon as it is written, so one dict can
+    # be refilled for every row instead of allocating a new one
+    sample = dict.fromkeys(names)
+    for row in tqdm(zip(*values.values()), total=num_samples, disable=not progress):
+        for name, value in zip(names, row):
+            sample[name] = value
+        out.write(sample)
+    
+    return num_samples
+
+def write_samples(output_dir, columns, values, compression, size_limit, progress=True):
+    """
+    Write column arrays to an MDS dataset, one sample per row.
+    
+    Args:
+        output_dir (str): Output directory for the MDS dataset
+        columns (dict): MDSWriter column encodings
+        values (dict): Column name to list of values, all of the same length
+        compression (str): Compression algorithm to use
+        size_limit (int): Size limit for each shard in bytes
+        progress (bool): Whether to show a progress bar
+        
+    Returns:
+        int: Number of samples written
+    """
+    with MDSWriter(out=output_dir, columns=columns, compression=compression,
+                   size_limit=size_limit) as out:
+        return write_rows(out, values, progress)
 
-def convert_to_mds(df, output_dir, compression='zstd', hashes=10, size_limit=1024*1024*16):
+def convert_to_mds(df, output_dir, compression='zstd', hashes=10, size_limit=1024*1024*16,
+                   workers=1, float_dtype='float32'):
     """
     Convert the dataset to MDS format.
     
+    With more than one worker, contiguous row ranges are written by separate
+    processes into numbered subdirectories, whose index files are then merged
+    into a single index.json in output_dir.
+    
     Args:
         df (pandas.DataFrame): Dataset to convert
         output_dir (str): Output directory for the MDS dataset
         compression (str): Compression algorithm to use
         hashes (int): Number of hashes for sharding
         size_limit (int): Size limit for each shard in bytes
+        workers (int): Number of processes writing shards in parallel
+        float_dtype (str): Precision of float columns (float32, float16 or bfloat16)
     """
     print(f"Converting dataset to MDS format...")
     
@@ -111,69 +488,137 @@ def convert_to_mds(df, output_dir, compression='zstd', hashes=10, size_limit=102
     print(f"Column types: {json.dumps(column_types, indent=2)}")
     
     # Create columns dictionary for MDSWriter
-    columns = {}
-    for col, col_type in column_types.items():
-        if col_type == 'int':
-            columns[col] = 'int'
-        elif col_type == 'float':
-            columns[col] = 'float32'  # Use float32 encoding
-        elif col_type == 'bool':
-            columns[col] = 'int'  # Store booleans as integers (0 or 1)
-        elif col_type == 'datetime':
-            columns[col] = 'str'  # Store datetimes as strings
-        else:
-            columns[col] = 'str'
-    
-    # Create MDSWriter
-    print(f"Creating MDSWriter with output directory: {output_dir}")
-    writer = MDSWriter(
-        out=output_dir,
-        columns=columns,
-        compression=compression,
-        # Use default hashes parameter
-        size_limit=size_limit
-    )
+    columns = column_encodings(column_types, float_dtype)
+    values = column_values(df, column_types, float_dtype)
     
-    # Convert each row to a sample
+    # Write one sample per row
     print(f"Writing {len(df)} samples to MDS format...")
-    start_time = time.time()
-    
-    with writer as out:
-        for _, row in tqdm(df.iterrows(), total=len(df)):
-            # Convert row to dictionary
-            sample = {}
-            for col, value in row.items():
-                if column_types[col] == 'datetime':
-                    # Convert datetime to ISO format string
-                    sample[col] = value.isoformat() if pd.notna(value) else None
-                elif column_types[col] == 'bool':
-                    # Convert boolean to integer (0 or 1)
-                    sample[col] = int(value) if pd.notna(value) else 0
-                else:
-                    sample[col] = value
-            
-            # Write sample to MDS
-            out.write(sample)
-    
-    end_time = time.time()
-    print(f"Conversion completed in {end_time - start_time:.2f} seconds")
+    start_time = time.perf_counter_ns()
+    
+    workers = max(1, min(workers, len(df)))
+    if workers == 1:
+        print(f"Creating MDSWriter with output directory: {output_dir}")
+        write_samples(output_dir, columns, values, compression, size_limit)
+    else:
+        # Each process compresses and writes its own row range, so the work
+        # is not serialized behind one writer thread
+        print(f"Writing with {workers} processes into subdirectories of {output_dir}")
+        bounds = np.linspace(0, len(df), workers + 1, dtype=np.int64)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    write_samples,
+                    os.path.join(output_dir, str(i)),
+                    columns,
+                    {col: arr[start:stop] for col, arr in values.items()},
+                    compression,
+                    size_limit,
+                    False,
+                )
+                for i, (start, stop) in enumerate(zip(bounds[:-1], bounds[1:]))
+            ]
+            for future in tqdm(futures):
+                future.result()
+        
+        # Combine the per-process index files into one for the whole dataset
+        merge_index(output_dir, keep_local=True)
+    
+    end_time = time.perf_counter_ns()
+    print(f"Conversion completed in {(end_time - start_time) / 1e9:.2f} seconds")
+    print(f"MDS dataset saved to {output_dir}")
+
+def convert_stream(input_path, output_dir, compression='zstd', size_limit=1024*1024*16,
+                   chunk_size=65536, float_dtype='float32'):
+    """
+    Convert the dataset to MDS format without loading it into memory at once.
+    
+    The input is read in batches of rows on a background thread while the
+    previous batch is written, so peak memory is bounded by the batch size
+    instead of the dataset size. Column types are taken from the first batch.
+    
+    Args:
+        input_path (str): Path to the input dataset
+        output_dir (str): Output directory for the MDS dataset
+        compression (str): Compression algorithm to use
+        size_limit (int): Size limit for each shard in bytes
+        chunk_size (int): Number of rows read at a time
+        float_dtype (str): Precision of float columns (float32, float16 or bfloat16)
+        
+    Returns:
+        int: Number of samples written
+    """
+    print(f"Converting {input_path} to MDS format in chunks of {chunk_size} rows...")
+    
+    # Ensure output directory exists
+    os.makedirs(output_dir, exist_ok=True)
+    
+    chunks = prefetch(iter_chunks(input_path, chunk_size))
+    first = next(chunks, None)
+    if first is None:
+        raise ValueError(f"No rows in {input_path}")
+    
+    column_types = get_column_types(first)
+    print(f"Column types: {json.dumps(column_types, indent=2)}")
+    columns = column_encodings(column_types, float_dtype)
+    
+    start_time = time.perf_counter_ns()
+    num_samples = 0
+    
+    with MDSWriter(out=output_dir, columns=columns, compression=compression,
+                   size_limit=size_limit) as out:
+        with tqdm(unit=' samples') as progress:
+            chunk = first
+            while chunk is not None:
+                # A later chunk can infer a different type, e.g. a float
+                # column for integers with missing values
+                chunk_types = get_column_types(chunk)
+                if chunk_types != column_types:
+                    changed = sorted(
+                        col for col in column_types if chunk_types.get(col) != column_types[col]
+                    )
+                    raise ValueError(
+                        f"Column types changed after row {num_samples}: {changed}; "
+                        f"convert with --chunk-size 0 to infer them from the whole file"
+                    )
+                written = write_rows(out, column_values(chunk, column_types, float_dtype),
+                                     progress=False)
+                num_samples += written
+                progress.update(written)
+                chunk = next(chunks, None)
+    
+    end_time = time.perf_counter_ns()
+    print(f"Wrote {num_samples} samples in {(end_time - start_time) / 1e9:.2f} seconds")
     print(f"MDS dataset saved to {output_dir}")
+    return num_samples
 
-def main():
+def main(argv=None):
     """Main function to convert the dataset."""
-    args = parse_args()
-    
-    # Load the dataset
-    df = load_dataset(args.input_path)
-    
-    # Convert to MDS format
-    convert_to_mds(
-        df,
-        args.output_dir,
-        compression=args.compression,
-        hashes=args.hashes,
-        size_limit=args.size_limit
-    )
+    args = parse_args(argv)
+    
+    if args.chunk_size > 0 and args.workers <= 1:
+        # Stream the input through a single writer
+        convert_stream(
+            args.input_path,
+            args.output_dir,
+            compression=args.compression,
+            size_limit=args.size_limit,
+            chunk_size=args.chunk_size,
+            float_dtype=args.float_dtype
+        )
+    else:
+        # Load the dataset
+        df = load_dataset(args.input_path)
+        
+        # Convert to MDS format
+        convert_to_mds(
+            df,
+            args.output_dir,
+            compression=args.compression,
+            hashes=args.hashes,
+            size_limit=args.size_limit,
+            workers=args.workers,
+            float_dtype=args.float_dtype
+        )
     
     print("Dataset conversion complete!")
 
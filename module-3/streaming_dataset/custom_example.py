@@ -8,6 +8,7 @@ This script demonstrates how to use the custom StreamingDataset implementation.
 import os
 import sys
 import argparse
+import itertools
 import time
 import torch
 from torch.utils.data import DataLoader
@@ -26,6 +27,8 @@ def parse_args():
                         help='Batch size for data loading (default: 32)')
     parser.add_argument('--num-batches', type=int, default=5,
                         help='Number of batches to load (default: 5)')
+    parser.add_argument('--num-workers', type=int, default=4,
+                        help='Number of worker processes for data loading (default: 4)')
     parser.add_argument('--skip-conversion', action='store_true',
                         help='Skip dataset conversion step')
     return parser.parse_args()
@@ -65,11 +68,16 @@ def main():
     print(f"Dataset columns: {list(first_sample.keys())}")
     
     # Create DataLoader
-    print(f"Creating DataLoader with batch_size={args.batch_size}...")
+    print(f"Creating DataLoader with batch_size={args.batch_size}, num_workers={args.num_workers}...")
+    worker_options = {}
+    if args.num_workers > 0:
+        # Keep the workers between epochs and let each load batches ahead
+        worker_options = {'persistent_workers': True, 'prefetch_factor': 4}
     dataloader = DataLoader(
         dataset,
         batch_size=None,  # Batch size is handled by CustomStreamingDataset
-        num_workers=0     # Use single process to avoid pickling issues
+        num_workers=args.num_workers,
+        **worker_options
     )
     
     # Load and print a few batches
@@ -85,7 +93,7 @@ def main():
         print(f"  Batch keys: {list(batch.keys())}")
         
         # Print a few samples from the batch
-        for key in list(batch.keys())[:3]:  # Print first 3 columns
+        for key in itertools.islice(batch, 3):  # Print first 3 columns
             if isinstance(batch[key], torch.Tensor):
                 print(f"  {key}: {batch[key][:3].tolist()}")  # Print first 3 values
             else:
@@ -99,7 +107,7 @@ def main():
     sample_idx = 42  # Access sample at index 42
     sample = dataset[sample_idx]
     print(f"Sample at index {sample_idx}:")
-    for key in list(sample.keys())[:5]:  # Print first 5 keys
+    for key in itertools.islice(sample, 5):  # Print first 5 keys
         print(f"  {key}: {sample[key]}")
     
     print("\nCustom StreamingDataset example completed!")
@@ -10,11 +10,39 @@ import os
 import json
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.json as pa_json
+import pyarrow.parquet as pq
 import torch
-from torch.utils.data import Dataset, IterableDataset
+import zstandard as zstd
+from torch.utils.data import Dataset, IterableDataset, get_worker_info
+import io
 import random
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import Dict, List, Optional, Union, Any, Tuple
 
+# nvCOMP is optional; it decompresses batches of shards on the GPU
+try:
+    from nvidia import nvcomp
+except ImportError:
+    nvcomp = None
+
+# Largest possible zstd frame header, which holds the decompressed size
+ZSTD_FRAME_HEADER_MAX_SIZE = 18
+
+# Bytes of a CSV file compared at a time when counting its lines
+CSV_SCAN_BLOCK_SIZE = 16 * 1024 * 1024
+
+# Rows of a CSV file read to infer which of its columns are numeric
+CSV_SAMPLE_ROWS = 1000
+
+# Block size for the multithreaded PyArrow JSON reader
+JSON_BLOCK_SIZE = 4 * 1024 * 1024
+
+# Column types from index.json that are stacked into the feature matrix
+NUMERIC_TYPES = ('int', 'float', 'bool')
+
 
 class CustomStreamingDataset(IterableDataset):
     """
@@ -30,7 +58,12 @@ class CustomStreamingDataset(IterableDataset):
         batch_size: int = 32,
         shuffle: bool = True,
         seed: Optional[int] = None,
-        chunk_size: int = 1000
+        chunk_size: int = 1000,
+        read_size: int = 1 << 20,
+        prefetch: int = 1,
+        reuse_buffer: bool = False,
+        decompress_backend: str = 'cpu',
+        columns: Optional[List[str]] = None
     ):
         """
         Initialize the CustomStreamingDataset.
@@ -40,13 +73,49 @@ class CustomStreamingDataset(IterableDataset):
             batch_size: Number of samples per batch
             shuffle: Whether to shuffle the data
             seed: Random seed for reproducibility
-            chunk_size: Number of samples to load at once
+            chunk_size: Number of samples to load at once; at most
+                prefetch + 1 chunks are held in memory, which bounds the
+                memory used by iteration
+            read_size: Bytes of a compressed shard read at a time while
+                decompressing it
+            prefetch: Number of chunks loaded on a background thread ahead
+                of the chunk being iterated (0 loads them in turn)
+            reuse_buffer: Whether to fill the 'features' of every batch into
+                one preallocated tensor (pinned when CUDA is available)
+                instead of a new one; each batch is then only valid until
+                the next one is produced. Ignored in DataLoader workers
+            decompress_backend: Where zstd shards are decompressed: 'cpu'
+                (zstandard) or 'nvcomp' (GPU, needs nvCOMP and CUDA)
+            columns: Columns to read; the others are never decoded (default: all)
         """
         self.data_path = data_path
         self.batch_size = batch_size
         self.shuffle = shuffle
         self.seed = seed if seed is not None else random.randint(0, 2**32 - 1)
         self.chunk_size = chunk_size
+        self.read_size = read_size
+        self.prefetch = prefetch
+        self.reuse_buffer = reuse_buffer
+        
+        if decompress_backend not in ('cpu', 'nvcomp'):
+            raise ValueError(f"Unsupported decompress backend: {decompress_backend}")
+        if decompress_backend == 'nvcomp' and (nvcomp is None or not torch.cuda.is_available()):
+            raise ValueError("The nvcomp backend needs nvCOMP (pip install nvidia-nvcomp-cu12) and CUDA")
+        self.decompress_backend = decompress_backend
+        self._needed_cols = list(columns) if columns is not None else None
+        self._codec = None
+        
+        # Epochs started by this copy of the dataset, which varies the shuffle
+        self.epoch = 0
+        
+        # Decompressor and open Parquet input file, created on first use in
+        # each process
+        self._dctx = None
+        self._pq_file = None
+        
+        # Columns stacked, in order, into the 'features' matrix of a batch;
+        # found from the index, the Parquet schema or a CSV file's first rows
+        self.numeric_cols = None
         
         # Determine the data format
         if os.path.isdir(data_path):
@@ -59,14 +128,20 @@ class CustomStreamingDataset(IterableDataset):
         elif data_path.endswith('.csv'):
             self.format = 'csv'
             self._get_csv_length()
+            self._get_csv_numeric_cols()
         elif data_path.endswith('.parquet'):
             self.format = 'parquet'
             self._get_parquet_length()
         else:
             raise ValueError(f"Unsupported file format: {data_path}")
-        
-        # Initialize random generator
-        self.rng = random.Random(self.seed)
+    
+    def __getstate__(self):
+        """Drop the decompressor and file handle, which cannot be pickled, when sent to a worker."""
+        state = self.__dict__.copy()
+        state['_dctx'] = None
+        state['_pq_file'] = None
+        state['_codec'] = None
+        return state
     
     def _load_index(self):
         """Load the index file for custom streaming format."""
@@ -77,22 +152,147 @@ class CustomStreamingDataset(IterableDataset):
         self.length = self.index.get('samples', 0)
         self.columns = self.index.get('columns', {})
         self.shards = self.index.get('shards', [])
+        self.numeric_cols = [
+            col for col, col_type in self.columns.items()
+            if col_type in NUMERIC_TYPES and self._is_needed(col)
+        ]
+        
+        # Chunks line up with shards, so use the shard size of the dataset
+        self.chunk_size = self.index.get('chunk_size', self.chunk_size)
     
     def _get_csv_length(self):
         """Get the number of samples in a CSV file."""
-        # Use pandas to get the number of rows without loading the entire file
-        self.length = sum(1 for _ in open(self.data_path)) - 1  # Subtract header
+        # Count newlines over a memory map, which scans in native code instead
+        # of iterating over the lines in Python
+        import mmap
+        with open(self.data_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                self.length = 0
+                return
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                data = np.frombuffer(mm, dtype=np.uint8)
+                lines = 0
+                for start in range(0, len(data), CSV_SCAN_BLOCK_SIZE):
+                    lines += np.count_nonzero(data[start:start + CSV_SCAN_BLOCK_SIZE] == ord('\n'))
+                if data[-1] != ord('\n'):
+                    # The last line has no newline
+                    lines += 1
+                # Release the view before the memory map is closed
+                del data
+        self.length = max(lines - 1, 0)  # Subtract header
+    
+    def _get_csv_numeric_cols(self):
+        """Infer the numeric columns of a CSV file from its first rows."""
+        # Known before any chunk is loaded, so the main process has them even
+        # when the chunks are only read in DataLoader workers
+        sample = pd.read_csv(self.data_path, nrows=CSV_SAMPLE_ROWS, usecols=self._needed_cols)
+        self.numeric_cols = [
+            col for col in sample.columns
+            if pd.api.types.is_numeric_dtype(sample[col])
+        ]
     
     def _get_parquet_length(self):
         """Get the number of samples in a Parquet file."""
         # Use pyarrow to get the number of rows without loading the entire file
-        import pyarrow.parquet as pq
-        self.length = pq.read_metadata(self.data_path).num_rows
+        metadata = pq.read_metadata(self.data_path)
+        self.length = metadata.num_rows
+        
+        # First row of each row group, and the end of the last one, so a
+        # chunk can be read from only the row groups it overlaps
+        row_counts = [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)]
+        self._row_group_offsets = np.concatenate([[0], np.cumsum(row_counts, dtype=np.int64)])
+        
+        schema = pq.read_schema(self.data_path)
+        self.numeric_cols = [
+            field.name for field in schema
+            if (pa.types.is_integer(field.type) or pa.types.is_floating(field.type)
+                or pa.types.is_boolean(field.type)) and self._is_needed(field.name)
+        ]
+    
+    def _is_needed(self, col: str) -> bool:
+        """Return whether a column is read from the data."""
+        return self._needed_cols is None or col in self._needed_cols
     
     def __len__(self):
         """Return the number of samples in the dataset."""
         return self.length
     
+    def _decompress_shard(self, shard_path: str) -> Union[bytes, bytearray]:
+        """
+        Decompress a zstd shard, reading it read_size bytes at a time.
+        
+        Args:
+            shard_path: Path to the compressed shard
+            
+        Returns:
+            Decompressed shard
+        """
+        if self._dctx is None:
+            self._dctx = zstd.ZstdDecompressor()
+        
+        with open(shard_path, 'rb') as f_in:
+            size = zstd.get_frame_parameters(f_in.read(ZSTD_FRAME_HEADER_MAX_SIZE)).content_size
+            f_in.seek(0)
+            with self._dctx.stream_reader(f_in, read_size=self.read_size) as reader:
+                if size == zstd.CONTENTSIZE_UNKNOWN:
+                    return reader.read()
+                
+                # Decompress into a buffer of the final size, so neither the
+                # whole compressed shard nor a growing output is held in memory
+                data = bytearray(size)
+                view = memoryview(data)
+                offset = 0
+                while offset < size:
+                    n = reader.readinto(view[offset:])
+                    if n == 0:
+                        raise ValueError(f"Truncated zstd shard: {shard_path}")
+                    offset += n
+                return data
+    
+    def batched_decode(self, shard_paths: List[str]) -> List[Union[bytes, bytearray]]:
+        """
+        Decompress several zstd shards.
+        
+        With the nvcomp backend all shards are decompressed on the GPU in one
+        batched call, which pays off when several shards are requested at a
+        time; the CPU backend decompresses them one after another.
+        
+        Args:
+            shard_paths: Paths to the compressed shards
+            
+        Returns:
+            Decompressed shards, in the order of shard_paths
+        """
+        if self.decompress_backend == 'cpu':
+            return [self._decompress_shard(shard_path) for shard_path in shard_paths]
+        
+        if self._codec is None:
+            self._codec = nvcomp.Codec(algorithm='Zstd')
+        
+        blobs = []
+        for shard_path in shard_paths:
+            with open(shard_path, 'rb') as f_in:
+                blobs.append(nvcomp.as_array(f_in.read()).cuda())
+        
+        # The Parquet data is decoded by pyarrow, so copy it back to the host
+        return [bytes(array.cpu()) for array in self._codec.decode(blobs)]
+    
+    def _parquet_file(self) -> pq.ParquetFile:
+        """
+        Return the open, memory-mapped Parquet input file.
+        
+        Only the input file is kept open, since every chunk reads from it;
+        shards are read once per epoch and opened for each read.
+        
+        Returns:
+            Parquet file, opened on the first request in each process
+        """
+        if self._pq_file is None:
+            self._pq_file = pq.ParquetFile(self.data_path, memory_map=True)
+        return self._pq_file
+    
     def _load_chunk(self, start_idx: int, end_idx: int) -> pd.DataFrame:
         """
         Load a chunk of data.
@@ -104,81 +304,228 @@ class CustomStreamingDataset(IterableDataset):
         Returns:
             DataFrame containing the chunk
         """
+        chunk_data = self._read_chunk(start_idx, end_idx)
+        if isinstance(chunk_data, pa.Table):
+            return chunk_data.to_pandas()
+        return chunk_data
+    
+    def _read_chunk(self, start_idx: int, end_idx: int) -> Union[pa.Table, pd.DataFrame]:
+        """
+        Read a chunk of data in the form its reader produces.
+        
+        Args:
+            start_idx: Start index of the chunk
+            end_idx: End index of the chunk
+            
+        Returns:
+            Arrow table for Parquet data, DataFrame for CSV files
+        """
         if self.format == 'csv':
             # Load a chunk from CSV
-            return pd.read_csv(self.data_path, skiprows=range(1, start_idx + 1), nrows=end_idx - start_idx)
+            return pd.read_csv(self.data_path, skiprows=range(1, start_idx + 1), nrows=end_idx - start_idx,
+                               usecols=self._needed_cols, engine='c', memory_map=True)
         elif self.format == 'parquet':
-            # Load a chunk from Parquet
-            return pd.read_parquet(self.data_path, engine='pyarrow')
+            # Load a chunk from Parquet, reading only the row groups it overlaps
+            offsets = self._row_group_offsets
+            first = int(np.searchsorted(offsets, start_idx, side='right')) - 1
+            last = int(np.searchsorted(offsets, end_idx, side='left'))
+            table = self._parquet_file().read_row_groups(
+                list(range(first, last)), columns=self._needed_cols
+            )
+            return table.slice(start_idx - offsets[first], end_idx - start_idx)
         elif self.format == 'custom_streaming':
             # Load from our custom format
-            # For simplicity, we'll load the entire shard
-            # In a real implementation, you would load only the needed samples
-            shard_path = os.path.join(self.data_path, self.shards[0])
+            # Each shard holds chunk_size samples, so load the shard with the chunk
+            shard_path = os.path.join(self.data_path, self.shards[start_idx // self.chunk_size])
             
             if shard_path.endswith('.zstd'):
                 # Decompress the zstd file
-                import zstandard as zstd
-                with open(shard_path, 'rb') as f_in:
-                    dctx = zstd.ZstdDecompressor()
-                    decompressed_data = dctx.decompress(f_in.read())
-                    
-                    # Create a temporary file for the decompressed data
-                    import tempfile
-                    with tempfile.NamedTemporaryFile(delete=False, suffix='.parquet') as f_out:
-                        f_out.write(decompressed_data)
-                        temp_path = f_out.name
-                
-                # Load the decompressed parquet file
-                df = pd.read_parquet(temp_path)
+                decompressed_data = self.batched_decode([shard_path])[0]
                 
-                # Remove the temporary file
-                os.unlink(temp_path)
-                
-                return df
+                # Read the parquet data straight from memory; the reader needs
+                # to seek, so the shard is decompressed as a whole first
+                return pq.read_table(pa.BufferReader(decompressed_data), columns=self._needed_cols)
             else:
-                # Load the shard as a pandas DataFrame
-                return pd.read_parquet(shard_path)
+                # Load the shard as an Arrow table
+                return pq.read_table(shard_path, columns=self._needed_cols, memory_map=True)
+    
+    def _materialize_chunk(
+        self, chunk_data: Union[pa.Table, pd.DataFrame]
+    ) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Convert a chunk once into a feature matrix and non-numeric columns.
+        
+        Args:
+            chunk_data: Arrow table or DataFrame containing the chunk
+            
+        Returns:
+            Contiguous float32 matrix of shape (rows, len(numeric_cols)) and
+            the remaining columns as object arrays
+        """
+        if isinstance(chunk_data, pa.Table):
+            return self._materialize_table(chunk_data)
+        
+        features = np.ascontiguousarray(chunk_data[self.numeric_cols].to_numpy(dtype=np.float32))
+        numeric = set(self.numeric_cols)
+        aux = {
+            col: chunk_data[col].to_numpy(dtype=object)
+            for col in chunk_data.columns if col not in numeric
+        }
+        return features, aux
+    
+    def _materialize_table(self, table: pa.Table) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Convert an Arrow table into a feature matrix and non-numeric columns.
+        
+        Numeric columns are copied from Arrow straight into the matrix, without
+        building a DataFrame; only temporal columns go through pandas.
+        
+        Args:
+            table: Arrow table containing the chunk
+            
+        Returns:
+            Contiguous float32 matrix of shape (rows, len(numeric_cols)) and
+            the remaining columns as object arrays
+        """
+        features = np.empty((table.num_rows, len(self.numeric_cols)), dtype=np.float32)
+        for i, col in enumerate(self.numeric_cols):
+            features[:, i] = table.column(col).to_numpy()
+        
+        numeric = set(self.numeric_cols)
+        aux = {}
+        for col in table.column_names:
+            if col in numeric:
+                continue
+            column = table.column(col)
+            if pa.types.is_temporal(column.type):
+                # Keep the same Timestamp objects as the pandas path
+                aux[col] = column.to_pandas().to_numpy(dtype=object)
+            else:
+                aux[col] = column.to_numpy(zero_copy_only=False).astype(object, copy=False)
+        return features, aux
+    
+    def _load_materialized(self, chunk_start: int) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Load the chunk starting at a sample and convert its columns.
+        
+        Args:
+            chunk_start: Index of the first sample of the chunk
+            
+        Returns:
+            Feature matrix and non-numeric columns of the chunk
+        """
+        chunk_end = min(chunk_start + self.chunk_size, self.length)
+        return self._materialize_chunk(self._read_chunk(chunk_start, chunk_end))
+    
+    def _iter_chunks(self, chunk_starts: List[int]):
+        """
+        Load chunks in order, prefetching the next ones on a background thread.
+        
+        Args:
+            chunk_starts: Index of the first sample of each chunk
+            
+        Yields:
+            Start index, feature matrix and non-numeric columns of each chunk
+        """
+        if self.prefetch <= 0:
+            for chunk_start in chunk_starts:
+                yield (chunk_start, *self._load_materialized(chunk_start))
+            return
+        
+        # Decompressing and parsing the next chunks overlaps with the batches
+        # of the current one; at most prefetch chunks wait in memory
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = deque()
+            for chunk_start in chunk_starts:
+                pending.append((chunk_start, executor.submit(self._load_materialized, chunk_start)))
+                if len(pending) > self.prefetch:
+                    start, future = pending.popleft()
+                    yield (start, *future.result())
+            while pending:
+                start, future = pending.popleft()
+                yield (start, *future.result())
+    
+    def _batch_buffer(self, num_features: int) -> torch.Tensor:
+        """
+        Allocate the tensor that the features of each batch are copied into.
+        
+        Args:
+            num_features: Number of columns of the feature matrix
+            
+        Returns:
+            Float32 tensor of shape (batch_size, num_features)
+        """
+        return torch.empty(
+            (self.batch_size, num_features), dtype=torch.float32, pin_memory=torch.cuda.is_available()
+        )
     
     def __iter__(self):
         """
         Iterate through the dataset in batches.
         
         Yields:
-            Batch of samples as a dictionary of tensors
+            Batch of samples as a dictionary holding a float32 'features'
+            tensor with one column per entry of numeric_cols, and the
+            non-numeric columns as numpy arrays
         """
-        # Create indices for the entire dataset
-        indices = list(range(self.length))
+        # Every worker draws the same chunk order for an epoch, so the chunks
+        # can be split between them without overlap
+        epoch = self.epoch
+        self.epoch += 1
         
-        # Shuffle indices if requested
+        chunk_starts = np.arange(0, self.length, self.chunk_size, dtype=np.int64)
         if self.shuffle:
-            self.rng.shuffle(indices)
+            chunk_starts = np.random.default_rng([self.seed, epoch]).permutation(chunk_starts)
+        chunk_starts = chunk_starts.tolist()
         
-        # Process data in chunks to avoid loading the entire dataset
-        for chunk_start in range(0, self.length, self.chunk_size):
-            chunk_end = min(chunk_start + self.chunk_size, self.length)
-            chunk_indices = indices[chunk_start:chunk_end]
-            
-            # Load the chunk
-            chunk_data = self._load_chunk(min(chunk_indices), max(chunk_indices) + 1)
+        # Each DataLoader worker reads its own share of the chunks
+        worker_info = get_worker_info()
+        if worker_info is not None:
+            chunk_starts = chunk_starts[worker_info.id::worker_info.num_workers]
+        
+        # Process data in chunks to avoid loading the entire dataset; each
+        # chunk's columns are converted once when it is loaded, not per batch
+        chunks = self._iter_chunks(chunk_starts)
+        # Tensors sent from DataLoader workers share their memory with the main
+        # process, so a worker must not overwrite a batch it has produced
+        reuse_buffer = self.reuse_buffer and worker_info is None
+        batch_buffer = None
+        for chunk_start, features, aux in chunks:
+            # Shuffle the samples within the chunk if requested; sequential
+            # batches are plain slices and need no index array
+            chunk_indices = None
+            if self.shuffle:
+                chunk_rng = np.random.default_rng([self.seed, epoch, chunk_start])
+                chunk_indices = chunk_rng.permutation(len(features)).astype(np.int32)
             
             # Create batches from the chunk
-            for batch_start in range(0, len(chunk_indices), self.batch_size):
-                batch_end = min(batch_start + self.batch_size, len(chunk_indices))
-                batch_indices = chunk_indices[batch_start:batch_end]
+            for batch_start in range(0, len(features), self.batch_size):
+                if chunk_indices is None:
+                    rows = slice(batch_start, batch_start + self.batch_size)
+                else:
+                    rows = chunk_indices[batch_start:batch_start + self.batch_size]
                 
-                # Extract batch data
-                batch = {}
-                for col in chunk_data.columns:
-                    # Convert to appropriate tensor type
-                    col_data = chunk_data[col].iloc[batch_indices].values
-                    
-                    if pd.api.types.is_numeric_dtype(chunk_data[col]):
-                        # Convert numeric data to float tensor
-                        batch[col] = torch.tensor(col_data, dtype=torch.float32)
+                if reuse_buffer:
+                    if batch_buffer is None:
+                        batch_buffer = self._batch_buffer(features.shape[1])
+                    # Gather the rows straight into the reused buffer
+                    batch_features = batch_buffer[:min(self.batch_size, len(features) - batch_start)]
+                    if chunk_indices is None:
+                        np.copyto(batch_features.numpy(), features[rows])
                     else:
-                        # Keep non-numeric data as numpy array
-                        batch[col] = col_data
+                        np.take(features, rows, axis=0, out=batch_features.numpy())
+                else:
+                    # Indexing with an array yields a new contiguous array, which
+                    # the feature tensor shares instead of copying it again. A
+                    # slice is a view of the whole chunk, which a worker would
+                    # have to send in full, so workers copy it first
+                    batch_rows = features[rows]
+                    if chunk_indices is None and worker_info is not None:
+                        batch_rows = batch_rows.copy()
+                    batch_features = torch.from_numpy(batch_rows)
+                batch = {'features': batch_features}
+                for col, values in aux.items():
+                    batch[col] = values[rows]
                 
                 yield batch
     
@@ -208,11 +555,67 @@ class CustomStreamingDataset(IterableDataset):
         return sample
 
 
+def _read_json_lines(input_path: str) -> pd.DataFrame:
+    """
+    Read a JSON lines file with PyArrow's multithreaded parser.
+    
+    Args:
+        input_path: Path to the JSON lines file
+        
+    Returns:
+        DataFrame containing the file, or the pandas parse if PyArrow cannot
+        read it (e.g. a column mixing types)
+    """
+    try:
+        table = pa_json.read_json(
+            input_path,
+            read_options=pa_json.ReadOptions(use_threads=True, block_size=JSON_BLOCK_SIZE)
+        )
+    except pa.ArrowInvalid as e:
+        print(f"PyArrow could not read {input_path} ({e}), falling back to pandas")
+        return pd.read_json(input_path, lines=True)
+    
+    # pandas.read_json leaves timestamp strings as strings, so do the same
+    for i, field in enumerate(table.schema):
+        if pa.types.is_timestamp(field.type):
+            table = table.set_column(i, field.name, table.column(i).cast(pa.string()))
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def _write_shard(shard_df: pd.DataFrame, shard_path: str, compression: str, threads: int = 0) -> str:
+    """
+    Write one shard of the custom streaming format.
+    
+    Args:
+        shard_df: Samples of the shard
+        shard_path: Path of the uncompressed Parquet shard
+        compression: Compression algorithm to use
+        threads: Number of zstd compression threads (-1 for one per CPU, 0 for none)
+        
+    Returns:
+        Name of the shard file written
+    """
+    if compression != 'zstd':
+        shard_df.to_parquet(shard_path, index=False)
+        return os.path.basename(shard_path)
+    
+    # Compress the Parquet data in memory instead of writing it to disk and
+    # reading it back
+    buffer = io.BytesIO()
+    shard_df.to_parquet(buffer, index=False)
+    compressor = zstd.ZstdCompressor(level=3, threads=threads)
+    with open(f"{shard_path}.zstd", 'wb') as f_out:
+        f_out.write(compressor.compress(buffer.getbuffer()))
+    return f"{os.path.basename(shard_path)}.zstd"
+
+
 def convert_to_streaming_format(
     input_path: str,
     output_dir: str,
     compression: str = 'zstd',
-    chunk_size: int = 1000
+    chunk_size: int = 1000,
+    workers: Optional[int] = None,
+    downcast: bool = True
 ):
     """
     Convert a dataset to our custom streaming format.
@@ -222,6 +625,9 @@ def convert_to_streaming_format(
         output_dir: Output directory for the streaming dataset
         compression: Compression algorithm to use
         chunk_size: Number of samples per shard
+        workers: Number of processes writing shards (default: one per CPU)
+        downcast: Whether to store floats as float32 and integers in the
+            smallest integer type that holds their range
     """
     # Create output directory
     os.makedirs(output_dir, exist_ok=True)
@@ -232,7 +638,7 @@ def convert_to_streaming_format(
     elif input_path.endswith('.parquet'):
         df = pd.read_parquet(input_path)
     elif input_path.endswith('.json'):
-        df = pd.read_json(input_path, lines=True)
+        df = _read_json_lines(input_path)
     else:
         raise ValueError(f"Unsupported file format: {input_path}")
     
@@ -250,34 +656,38 @@ def convert_to_streaming_format(
         else:
             columns[col] = 'str'
     
+    # The reader yields float32 features, so wider types only make the
+    # shards larger to store, decompress and decode
+    if downcast:
+        for col, col_type in columns.items():
+            if col_type in ('int', 'float'):
+                df[col] = pd.to_numeric(df[col], downcast='integer' if col_type == 'int' else 'float')
+    
     # Split the dataset into shards
-    shards = []
-    for i in range(0, len(df), chunk_size):
-        shard_df = df.iloc[i:i+chunk_size]
-        shard_name = f"shard.{i//chunk_size:05d}.parquet"
-        shard_path = os.path.join(output_dir, shard_name)
-        
-        # Save the shard
-        shard_df.to_parquet(shard_path, index=False)
-        
-        # Compress the shard if requested
-        if compression == 'zstd':
-            import zstandard as zstd
-            with open(shard_path, 'rb') as f_in:
-                with open(f"{shard_path}.zstd", 'wb') as f_out:
-                    compressor = zstd.ZstdCompressor(level=3)
-                    f_out.write(compressor.compress(f_in.read()))
-            
-            # Remove the uncompressed shard
-            os.remove(shard_path)
-            shard_name = f"{shard_name}.zstd"
-        
-        shards.append(shard_name)
+    starts = range(0, len(df), chunk_size)
+    shard_dfs = (df.iloc[i:i+chunk_size] for i in starts)
+    shard_paths = [os.path.join(output_dir, f"shard.{i//chunk_size:05d}.parquet") for i in starts]
+    
+    workers = max(1, min(workers or os.cpu_count() or 1, len(shard_paths)))
+    if workers == 1:
+        # A single process lets zstd compress each shard on all cores
+        shards = [
+            _write_shard(shard_df, shard_path, compression, threads=-1)
+            for shard_df, shard_path in zip(shard_dfs, shard_paths)
+        ]
+    else:
+        # Shards are written by separate processes; map keeps their order
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            shards = list(executor.map(
+                _write_shard, shard_dfs, shard_paths, [compression] * len(shard_paths)
+            ))
     
     # Create index file
     index = {
         'samples': len(df),
+        'chunk_size': chunk_size,
         'columns': columns,
+        'dtypes': {col: str(dtype) for col, dtype in df.dtypes.items()},
         'shards': shards
     }
     
@@ -303,6 +713,10 @@ if __name__ == "__main__":
                         help='Compression algorithm to use')
     parser.add_argument('--chunk-size', type=int, default=1000,
                         help='Number of samples per shard')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Number of processes writing shards (default: one per CPU)')
+    parser.add_argument('--no-downcast', action='store_true',
+                        help='Keep the numeric column types of the input instead of downcasting them')
     
     args = parser.parse_args()
     
@@ -310,5 +724,7 @@ if __name__ == "__main__":
         args.input_path,
         args.output_dir,
         args.compression,
-        args.chunk_size
+        args.chunk_size,
+        args.workers,
+        downcast=not args.no_downcast
     )
@@ -9,14 +9,12 @@ the StreamingDataset conversion process.
 import os
 import numpy as np
 import pandas as pd
-import random
 import string
-from datetime import datetime, timedelta
 import argparse
 from tqdm import tqdm
 
-def parse_args():
-    """Parse command line arguments."""
+def parse_args(argv=None):
+    """Parse command line arguments, or argv if given."""
     parser = argparse.ArgumentParser(description='Generate a synthetic dataset')
     parser.add_argument('--rows', type=int, default=10000,
                         help='Number of rows in the dataset (default: 10000)')
@@ -27,7 +25,7 @@ def parse_args():
     parser.add_argument('--format', type=str, default='csv',
                         choices=['csv', 'parquet', 'json'],
                         help='Output format for the dataset (default: csv)')
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 def generate_dataset(rows=10000, cols=50):
     """
@@ -57,19 +55,22 @@ def generate_dataset(rows=10000, cols=50):
     
     # Generate string columns (30% of columns)
     num_string = int(cols * 0.3)
+    alphabet = np.frombuffer(string.ascii_letters.encode(), dtype='S1')
     for i in range(num_string):
-        # Generate random strings of length 10
-        data[f'str_col_{i}'] = [''.join(random.choices(string.ascii_letters, k=10)) for _ in range(rows)]
+        # Generate random strings of length 10 by viewing each row of 10
+        # random letters as one 10-byte string
+        letters = alphabet[np.random.randint(0, len(alphabet), size=(rows, 10))]
+        data[f'str_col_{i}'] = letters.view('S10').reshape(rows).astype(str)
     
     # Generate datetime columns (10% of columns)
     num_datetime = int(cols * 0.1)
-    start_date = datetime(2020, 1, 1)
-    end_date = datetime(2023, 12, 31)
-    delta = (end_date - start_date).total_seconds()
+    start_date = np.datetime64('2020-01-01T00:00:00', 's')
+    end_date = np.datetime64('2023-12-31T00:00:00', 's')
+    delta = (end_date - start_date).astype(np.int64)
     
     for i in range(num_datetime):
-        random_seconds = np.random.randint(0, delta, size=rows)
-        data[f'date_col_{i}'] = [start_date + timedelta(seconds=int(sec)) for sec in random_seconds]
+        random_seconds = np.random.randint(0, delta, size=rows, dtype=np.int64)
+        data[f'date_col_{i}'] = start_date + random_seconds.astype('timedelta64[s]')
     
     # Generate boolean columns (10% of columns)
     num_bool = cols - num_numeric - num_string - num_datetime
@@ -77,7 +78,7 @@ def generate_dataset(rows=10000, cols=50):
         data[f'bool_col_{i}'] = np.random.choice([True, False], size=rows)
     
     # Add a unique ID column
-    data['id'] = [f"id_{i}" for i in range(rows)]
+    data['id'] = np.char.add('id_', np.arange(rows).astype(str))
     
     return pd.DataFrame(data)
 
@@ -107,9 +108,9 @@ def save_dataset(df, output_dir, format='csv'):
     print(f"Dataset memory usage: {df.memory_usage(deep=True).sum() / (1024 * 1024):.2f} MB")
     print(f"Dataset columns: {', '.join(df.columns[:5])}... (total: {len(df.columns)})")
 
-def main():
+def main(argv=None):
     """Main function to generate the dataset."""
-    args = parse_args()
+    args = parse_args(argv)
     
     # Generate the dataset
     df = generate_dataset(rows=args.rows, cols=args.cols)
@@ -11,6 +11,7 @@ import argparse
 import pandas as pd
 from tqdm import tqdm
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Import streaming library
 try:
@@ -23,15 +24,17 @@ except ImportError:
 # Import MinIO client
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 try:
-    from minio_client.minio_crud_client import MinioCRUDClient
-    from minio_client.config import Config
+    from minio_client import MinioCrudClient
 except ImportError:
     print("Error: MinIO client not found.")
     print("Please ensure the minio_client module is available.")
     sys.exit(1)
 
-def parse_args():
-    """Parse command line arguments."""
+# Part size for multipart uploads of large shards
+PART_SIZE = 16 * 1024 * 1024
+
+def parse_args(argv=None):
+    """Parse command line arguments, or argv if given."""
     parser = argparse.ArgumentParser(description='StreamingDataset with MinIO integration')
     parser.add_argument('--local-dir', type=str, default='data/streaming',
                         help='Local directory for StreamingDataset (default: data/streaming)')
@@ -43,52 +46,61 @@ def parse_args():
                         help='Upload local StreamingDataset to MinIO')
     parser.add_argument('--download', action='store_true',
                         help='Download StreamingDataset from MinIO')
-    return parser.parse_args()
+    parser.add_argument('--workers', type=int, default=32,
+                        help='Number of concurrent uploads or downloads (default: 32)')
+    return parser.parse_args(argv)
 
-def upload_to_minio(local_dir, bucket_name):
+def upload_to_minio(local_dir, bucket_name, max_workers=32):
     """
     Upload a StreamingDataset to MinIO.
     
     Args:
         local_dir (str): Local directory containing the StreamingDataset
         bucket_name (str): MinIO bucket name
+        max_workers (int): Number of concurrent uploads
     """
     print(f"Uploading StreamingDataset from {local_dir} to MinIO bucket {bucket_name}...")
     
-    # Initialize MinIO client
-    config = Config()
-    minio_client = MinioCRUDClient(config)
+    # Initialize MinIO client with one pooled connection per upload thread
+    minio_client = MinioCrudClient(pool_size=max_workers)
     
     # Create bucket if it doesn't exist
     if not minio_client.bucket_exists(bucket_name):
         print(f"Creating bucket {bucket_name}...")
         minio_client.create_bucket(bucket_name)
     
-    # Upload all files in the local directory
-    for root, _, files in os.walk(local_dir):
-        for file in tqdm(files, desc="Uploading files"):
-            local_path = os.path.join(root, file)
-            # Create object name relative to local_dir
-            object_name = os.path.relpath(local_path, local_dir)
-            
-            # Upload file to MinIO
-            minio_client.upload_file(bucket_name, object_name, local_path)
+    # Collect all files in the local directory
+    local_paths = [
+        os.path.join(root, file)
+        for root, _, files in os.walk(local_dir)
+        for file in files
+    ]
+    
+    def upload(local_path):
+        # Create object name relative to local_dir
+        object_name = os.path.relpath(local_path, local_dir).replace(os.sep, '/')
+        return minio_client.upload_file(bucket_name, object_name, local_path, part_size=PART_SIZE)
+    
+    # Upload the files concurrently; each shard is a separate round-trip, so
+    # overlapping them matters more than the bandwidth of any single one
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(tqdm(executor.map(upload, local_paths), total=len(local_paths), desc="Uploading files"))
     
     print(f"Upload complete. StreamingDataset available in MinIO bucket {bucket_name}")
 
-def download_from_minio(local_dir, bucket_name):
+def download_from_minio(local_dir, bucket_name, max_workers=32):
     """
     Download a StreamingDataset from MinIO.
     
     Args:
         local_dir (str): Local directory to store the StreamingDataset
         bucket_name (str): MinIO bucket name
+        max_workers (int): Number of concurrent downloads
     """
     print(f"Downloading StreamingDataset from MinIO bucket {bucket_name} to {local_dir}...")
     
-    # Initialize MinIO client
-    config = Config()
-    minio_client = MinioCRUDClient(config)
+    # Initialize MinIO client with one pooled connection per download thread
+    minio_client = MinioCrudClient(pool_size=max_workers)
     
     # Check if bucket exists
     if not minio_client.bucket_exists(bucket_name):
@@ -98,19 +110,22 @@ def download_from_minio(local_dir, bucket_name):
     # Create local directory if it doesn't exist
     os.makedirs(local_dir, exist_ok=True)
     
-    # List all objects in the bucket
-    objects = minio_client.list_objects(bucket_name)
+    # List all objects in the bucket, including those under prefixes
+    object_names = [obj["name"] for obj in minio_client.list_objects(bucket_name, recursive=True)]
     
-    # Download all objects
-    for obj in tqdm(objects, desc="Downloading files"):
-        object_name = obj.object_name
+    def download(object_name):
         local_path = os.path.join(local_dir, object_name)
         
         # Create directory if it doesn't exist
         os.makedirs(os.path.dirname(local_path), exist_ok=True)
         
-        # Download file from MinIO
-        minio_client.download_file(bucket_name, object_name, local_path)
+        # Stream the object straight into the local file
+        with open(local_path, 'wb') as f:
+            minio_client.download_object(bucket_name, object_name, writer=f)
+    
+    # Download the objects concurrently
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(tqdm(executor.map(download, object_names), total=len(object_names), desc="Downloading files"))
     
     print(f"Download complete. StreamingDataset available at {local_dir}")
 
@@ -156,15 +171,15 @@ def use_streaming_dataset(local_dir, batch_size):
     end_time = time.time()
     print(f"Processed 10 batches in {end_time - start_time:.4f} seconds")
 
-def main():
+def main(argv=None):
     """Main function."""
-    args = parse_args()
+    args = parse_args(argv)
     
     if args.upload:
-        upload_to_minio(args.local_dir, args.bucket_name)
+        upload_to_minio(args.local_dir, args.bucket_name, args.workers)
     
     if args.download:
-        download_from_minio(args.local_dir, args.bucket_name)
+        download_from_minio(args.local_dir, args.bucket_name, args.workers)
     
     # Use StreamingDataset
     use_streaming_dataset(args.local_dir, args.batch_size)
